@@ -0,0 +1,131 @@
+# broadphase.py
+import math
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+
+class UniformGrid:
+    """
+    全場共用的均勻格子 broad phase：
+    - 桶子 / 地板 / 蘋果都登記在同一張 grid，用 tag 分辨（"barrel" / "tile" / "apple"）
+    - insert(obj, rect, tag)：依 (x // cell, y // cell) 放進 rect 蓋到的每一格
+    - remove(obj)：桶子爆掉、蘋果被吃掉時拿掉
+    - query(rect, tag=None)：只回傳跟 rect 同格的 (obj, tag)（不重複、照插入順序）
+    - query_into(rect, out)：每幀大量呼叫用（子彈），直接塞進呼叫端的 {tag: list}，不排序
+    - query_point(x, y, tag)：單點查詢（地雷踩踏這種每幀每個玩家都要問的）
+    之後再用 colliderect / 距離做精確判定
+    """
+    def __init__(self, cell: int = 128) -> None:
+        self.cell = cell
+        # 格子裡放 id(obj)：dataclass 的 == 是比欄位，不能拿來 remove
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        # id(obj) -> (obj, tag, 插入順序, 蓋到的格子)
+        self._entries: Dict[int, Tuple[object, str, int, List[Tuple[int, int]]]] = {}
+        self._next_order = 0
+
+    def clear(self, tag: Optional[str] = None) -> None:
+        # 不給 tag = 全清；給 tag = 只清那一類（例如重新 spawn 桶子）
+        if tag is None:
+            self._buckets.clear()
+            self._entries.clear()
+            return
+        for oid in [oid for oid, e in self._entries.items() if e[1] == tag]:
+            self._remove_id(oid)
+
+    def _cells(self, rect: pygame.Rect) -> List[Tuple[int, int]]:
+        c = self.cell
+        x0, y0 = rect.left // c, rect.top // c
+        x1 = max(rect.left, rect.right - 1) // c
+        y1 = max(rect.top, rect.bottom - 1) // c
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def insert(self, obj: object, rect: pygame.Rect, tag: str) -> None:
+        oid = id(obj)
+        if oid in self._entries:
+            self._remove_id(oid)
+        cells = self._cells(rect)
+        self._entries[oid] = (obj, tag, self._next_order, cells)
+        self._next_order += 1
+        for key in cells:
+            self._buckets.setdefault(key, []).append(oid)
+
+    def remove(self, obj: object) -> None:
+        oid = id(obj)
+        if oid in self._entries:
+            self._remove_id(oid)
+
+    def _remove_id(self, oid: int) -> None:
+        _, _, _, cells = self._entries.pop(oid)
+        for key in cells:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            bucket.remove(oid)
+            if not bucket:
+                del self._buckets[key]
+
+    def query(self, rect: pygame.Rect, tag: Optional[str] = None) -> List[Tuple[object, str]]:
+        seen = set()
+        hits = []
+        entries = self._entries
+        for key in self._cells(rect):
+            for oid in self._buckets.get(key, ()):
+                if oid in seen:
+                    continue
+                seen.add(oid)
+                e = entries[oid]
+                if tag is None or e[1] == tag:
+                    hits.append(e)
+        if len(hits) > 1:
+            hits.sort(key=lambda e: e[2])
+        return [(e[0], e[1]) for e in hits]
+
+    def query_into(self, rect: pygame.Rect, out: Dict[str, List[object]]) -> None:
+        # 只收 out 裡有的 tag，append 進呼叫端自己的 list（呼叫端負責清空）
+        # 命中判定跟順序無關：不排序；只蓋到一格（子彈幾乎都是）就連去重都不用
+        c = self.cell
+        entries = self._entries
+        buckets = self._buckets
+        x0, y0 = rect.left // c, rect.top // c
+        x1 = max(rect.left, rect.right - 1) // c
+        y1 = max(rect.top, rect.bottom - 1) // c
+        if x0 == x1 and y0 == y1:
+            for oid in buckets.get((x0, y0), ()):
+                e = entries[oid]
+                lst = out.get(e[1])
+                if lst is not None:
+                    lst.append(e[0])
+            return
+        seen = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                for oid in buckets.get((cx, cy), ()):
+                    if oid in seen:
+                        continue
+                    seen.add(oid)
+                    e = entries[oid]
+                    lst = out.get(e[1])
+                    if lst is not None:
+                        lst.append(e[0])
+
+    def query_tag(self, rect: pygame.Rect, tag: str) -> List[object]:
+        # 只要某一類的物件本身（系統內部用）
+        return [obj for obj, _ in self.query(rect, tag)]
+
+    def query_point(self, x: float, y: float, tag: str) -> List[object]:
+        # 一個點只會落在一格：直接看那個桶子，不用建 Rect / 去重 / 排序
+        # （同一桶裡本來就是照插入順序 append 的）
+        c = self.cell
+        entries = self._entries
+        hits = []
+        for oid in self._buckets.get((int(x) // c, int(y) // c), ()):
+            e = entries[oid]
+            if e[1] == tag:
+                hits.append(e[0])
+        return hits
+
+    def query_radius(self, x: float, y: float, radius: float, tag: Optional[str] = None) -> List[Tuple[object, str]]:
+        # 圓的 AABB：(x ± r, y ± r)
+        r = int(math.ceil(radius))
+        return self.query(pygame.Rect(int(x) - r, int(y) - r, 2 * r + 1, 2 * r + 1), tag)
@@ -1,24 +1,20 @@
 # chaos_features.py
 import random, math
-from dataclasses import dataclass
-from typing import Callable, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pygame
 
+from broadphase import UniformGrid
+from common import FX_LUT_ALPHA, FX_LUT_RADIUS, blast_damage_kernel, fx_lut_index, inflate_all
+
 
 # =========================
 # Helpers
 # =========================
 def _rects_overlap_any(r: pygame.Rect, rects: List[pygame.Rect]) -> bool:
-    return any(r.colliderect(o) for o in rects)
-
-def _clamp_rect_in_arena(rect: pygame.Rect, world_w: int, world_h: int, arena_margin: int) -> None:
-    left, top = arena_margin, arena_margin
-    right, bottom = world_w - arena_margin, world_h - arena_margin
-    if rect.left < left: rect.left = left
-    if rect.top < top: rect.top = top
-    if rect.right > right: rect.right = right
-    if rect.bottom > bottom: rect.bottom = bottom
+    # collidelist 在 C 裡掃整個清單，沒撞到回傳 -1
+    return r.collidelist(rects) != -1
 
 def _find_free_rect(
     rng: random.Random,
@@ -30,28 +26,38 @@ def _find_free_rect(
     avoid_rects: Optional[List[pygame.Rect]] = None,
     also_avoid: Optional[List[pygame.Rect]] = None,
     attempts: int = 900,
+    obstacles_inflated: Optional[List[pygame.Rect]] = None,
 ) -> Optional[pygame.Rect]:
     avoid_rects = avoid_rects or []
     also_avoid = also_avoid or []
     w, h = size
 
+    # system 沒傳算好的版本才自己算（見 common.inflate_all）
+    if obstacles_inflated is None:
+        obstacles_inflated = inflate_all(obstacles, 10)
+
+    # 迴圈外先準備好：取樣範圍 + inflate 過的 avoid 清單（每次呼叫只做一次）
+    x_lo, x_hi = arena_margin + 10, world_w - arena_margin - 10 - w
+    y_lo, y_hi = arena_margin + 10, world_h - arena_margin - 10 - h
+    avoid_inflated = inflate_all(avoid_rects, 24)
+    also_inflated = inflate_all(also_avoid, 14)
+    randint = rng.randint
+
     for _ in range(attempts):
-        x = rng.randint(arena_margin + 10, world_w - arena_margin - 10 - w)
-        y = rng.randint(arena_margin + 10, world_h - arena_margin - 10 - h)
+        x = randint(x_lo, x_hi)
+        y = randint(y_lo, y_hi)
         r = pygame.Rect(x, y, w, h)
 
-        if r.left < arena_margin + 6 or r.right > world_w - arena_margin - 6:
-            continue
-        if r.top < arena_margin + 6 or r.bottom > world_h - arena_margin - 6:
-            continue
+        # 取樣範圍本來就離邊界 10px，原本「貼邊 6px」的檢查不會成立，所以拿掉
 
-        if _rects_overlap_any(r.inflate(10, 10), obstacles):
+        if _rects_overlap_any(r, obstacles_inflated):
             continue
 
-        if any(r.colliderect(a.inflate(24, 24)) for a in avoid_rects):
+        # 整個清單丟給 collidelist，在 C 裡一次掃完
+        if r.collidelist(avoid_inflated) != -1:
             continue
 
-        if any(r.colliderect(a.inflate(14, 14)) for a in also_avoid):
+        if r.collidelist(also_inflated) != -1:
             continue
 
         return r
@@ -65,6 +71,7 @@ def _find_free_rect(
 @dataclass
 class Barrel:
     rect: pygame.Rect
+    alive: bool = True  # 爆掉就設 False，之後一次從清單清掉
 
 @dataclass
 class BarrelFX:
@@ -72,6 +79,10 @@ class BarrelFX:
     max_radius: int
     duration: float = 0.35
     t: float = 0.0
+    _inv_dur: float = field(init=False, repr=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        self._inv_dur = 1.0 / self.duration
 
     def update(self, dt: float) -> None:
         self.t += dt
@@ -79,14 +90,12 @@ class BarrelFX:
     def done(self) -> bool:
         return self.t >= self.duration
 
+    # 半徑比例 / 透明度查 common 的共用表
     def radius(self) -> float:
-        p = max(0.0, min(1.0, self.t / self.duration))
-        p = 1.0 - (1.0 - p) * (1.0 - p)
-        return self.max_radius * p
+        return self.max_radius * FX_LUT_RADIUS[fx_lut_index(self.t, self._inv_dur)]
 
     def alpha(self) -> int:
-        p = max(0.0, min(1.0, self.t / self.duration))
-        return int(255 * (1.0 - p))
+        return FX_LUT_ALPHA[fx_lut_index(self.t, self._inv_dur)]
 
 
 class BarrelSystem:
@@ -109,11 +118,13 @@ class BarrelSystem:
         min_damage: int = 10,
         chain_radius: int = 170,
         seed: Optional[int] = None,
+        grid: Optional[UniformGrid] = None,
     ) -> None:
         self.world_w = world_w
         self.world_h = world_h
         self.arena_margin = arena_margin
         self.obstacles = obstacles
+        self._obstacles_inflated = inflate_all(obstacles, 10)
 
         self.barrel_count = barrel_count
         self.barrel_size = barrel_size
@@ -123,9 +134,31 @@ class BarrelSystem:
         self.min_damage = min_damage
         self.chain_radius = chain_radius
 
+        # 距離判定都用平方比，省掉 sqrt
+        self._chain_r2 = chain_radius * chain_radius
+
         self.rng = random.Random(seed)
         self.barrels: List[Barrel] = []
         self.fx: List[BarrelFX] = []
+        # 桶子清單每變一次就 +1（外面快取障礙物清單用）
+        self.revision = 0
+
+        # broad phase：可以跟其他系統共用同一張 grid（tag = "barrel"），爆掉就 remove
+        self._grid = grid if grid is not None else UniformGrid(cell=128)
+
+        # 預先畫好的桶子外觀 (w, h) -> Surface
+        self._sprite_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+
+        # shockwave 共用的畫布：開最大的一張，每次只清用到的那塊
+        self._fx_scratch: Optional[pygame.Surface] = None
+
+    def _candidates(self, rect: pygame.Rect) -> List[Barrel]:
+        return self._grid.query_tag(rect, "barrel")
+
+    def _remove_barrel(self, b: Barrel) -> None:
+        b.alive = False
+        self._grid.remove(b)
+        self.revision += 1
 
     def get_obstacles(self) -> List[pygame.Rect]:
         return [b.rect for b in self.barrels]
@@ -133,6 +166,8 @@ class BarrelSystem:
     def spawn_initial(self, avoid_rects: Optional[List[pygame.Rect]] = None) -> None:
         avoid_rects = avoid_rects or []
         self.barrels = []
+        self._grid.clear("barrel")
+        self.revision += 1
         placed_rects: List[pygame.Rect] = []
 
         for _ in range(self.barrel_count):
@@ -141,84 +176,132 @@ class BarrelSystem:
                 self.obstacles,
                 size=self.barrel_size,
                 avoid_rects=avoid_rects,
-                also_avoid=placed_rects
+                also_avoid=placed_rects,
+                obstacles_inflated=self._obstacles_inflated,
             )
             if r is None:
                 continue
-            self.barrels.append(Barrel(rect=r))
+            b = Barrel(rect=r)
+            self.barrels.append(b)
+            self._grid.insert(b, r, "barrel")
             placed_rects.append(r)
 
     def _apply_blast_damage(self, pos: pygame.Vector2, players: List[object]) -> None:
-        for pl in players:
-            d = (pl.pos - pos).length()
-            if d > self.blast_radius:
-                continue
-            t = 1.0 - (d / self.blast_radius)
-            dmg = int(self.min_damage + (self.max_damage - self.min_damage) * t)
-            pl.take_damage(dmg)
+        xs = [pl.pos.x for pl in players]
+        ys = [pl.pos.y for pl in players]
+        dmgs = blast_damage_kernel(
+            xs, ys, pos.x, pos.y,
+            self.blast_radius, self.min_damage, self.max_damage,
+        )
+        for pl, dmg in zip(players, dmgs):
+            if dmg >= 0:
+                pl.take_damage(dmg)
 
     def explode_at(self, pos: pygame.Vector2, players: List[object]) -> None:
         # shockwave
         self.fx.append(BarrelFX(pos=pygame.Vector2(pos), max_radius=self.blast_radius, duration=0.35))
         self._apply_blast_damage(pos, players)
 
-        # chain reaction
+        # chain reaction（只看 chain_radius AABB 蓋到的格子）
+        cr = self.chain_radius
+        area = pygame.Rect(int(pos.x - cr), int(pos.y - cr), 2 * cr + 1, 2 * cr + 1)
+        px, py = pos.x, pos.y
+        chain_r2 = self._chain_r2
         chain = []
-        for b in self.barrels:
-            c = pygame.Vector2(b.rect.centerx, b.rect.centery)
-            if (c - pos).length() <= self.chain_radius:
+        for b in self._candidates(area):
+            if not b.alive:
+                continue
+            cx, cy = b.rect.center
+            dx = cx - px
+            dy = cy - py
+            if dx * dx + dy * dy <= chain_r2:
                 chain.append(b)
 
         if chain:
-            # 移除並逐個爆（避免同一桶重複爆）
+            # 逐個爆：alive 旗標 O(1) 判斷，避免同一桶重複爆
             for b in chain:
-                if b in self.barrels:
-                    self.barrels.remove(b)
+                if b.alive:
+                    self._remove_barrel(b)
                     c = pygame.Vector2(b.rect.centerx, b.rect.centery)
                     self.fx.append(BarrelFX(pos=c, max_radius=int(self.blast_radius*0.92), duration=0.33))
                     self._apply_blast_damage(c, players)
 
-    def handle_bullet_hit(self, bullet_rect: pygame.Rect, players: List[object]) -> bool:
+            # 最後單趟把爆掉的清掉
+            self.barrels = [b for b in self.barrels if b.alive]
+
+    def handle_bullet_hit(
+        self,
+        bullet_rect: pygame.Rect,
+        players: List[object],
+        candidates: Optional[List[Barrel]] = None,
+    ) -> bool:
         """
         在 main 的 bullet loop 裡呼叫：
         - 若子彈打到桶，回傳 True（代表你應該移除該子彈）
+        - candidates：呼叫端已經從共用 grid 查好的桶子（不給就自己查）
         """
-        for b in self.barrels[:]:
-            if bullet_rect.colliderect(b.rect):
-                self.barrels.remove(b)
+        if candidates is None:
+            candidates = self._candidates(bullet_rect)
+        for b in candidates:
+            if b.alive and bullet_rect.colliderect(b.rect):
+                self._remove_barrel(b)
+                self.barrels = [x for x in self.barrels if x.alive]
                 pos = pygame.Vector2(b.rect.centerx, b.rect.centery)
                 self.explode_at(pos, players)
                 return True
         return False
 
     def update(self, dt: float) -> None:
-        for e in self.fx[:]:
+        for e in self.fx:
             e.update(dt)
-            if e.done():
-                self.fx.remove(e)
+        self.fx = [e for e in self.fx if not e.done()]
 
-    def draw(self, surf: pygame.Surface, to_view_rect: Callable[[pygame.Rect], pygame.Rect]) -> None:
-        for b in self.barrels:
-            r = to_view_rect(b.rect)
+    def _barrel_sprite(self, w: int, h: int) -> pygame.Surface:
+        # 桶子外觀只跟尺寸有關：畫一次存起來，之後每幀只 blit
+        key = (w, h)
+        spr = self._sprite_cache.get(key)
+        if spr is not None:
+            return spr
+
+        spr = pygame.Surface((w, h), pygame.SRCALPHA)
+        r = spr.get_rect()
 
-            # 桶子本體（紅桶）
-            pygame.draw.rect(surf, (210, 70, 70), r, border_radius=8)
-            pygame.draw.rect(surf, (20, 20, 25), r, width=2, border_radius=8)
+        # 桶子本體（紅桶）
+        pygame.draw.rect(spr, (210, 70, 70), r, border_radius=8)
+        pygame.draw.rect(spr, (20, 20, 25), r, width=2, border_radius=8)
 
-            # 桶環（兩條深色）
-            band1 = pygame.Rect(r.x + 3, r.y + 12, r.w - 6, 6)
-            band2 = pygame.Rect(r.x + 3, r.y + r.h - 18, r.w - 6, 6)
-            pygame.draw.rect(surf, (150, 40, 40), band1, border_radius=6)
-            pygame.draw.rect(surf, (150, 40, 40), band2, border_radius=6)
+        # 桶環（兩條深色）
+        band1 = pygame.Rect(r.x + 3, r.y + 12, r.w - 6, 6)
+        band2 = pygame.Rect(r.x + 3, r.y + r.h - 18, r.w - 6, 6)
+        pygame.draw.rect(spr, (150, 40, 40), band1, border_radius=6)
+        pygame.draw.rect(spr, (150, 40, 40), band2, border_radius=6)
 
-            # 危險標誌（小黃黑）
-            sign = pygame.Rect(r.centerx - 7, r.centery - 7, 14, 14)
-            pygame.draw.rect(surf, (235, 200, 70), sign, border_radius=3)
-            pygame.draw.line(surf, (20, 20, 25), sign.topleft, sign.bottomright, 2)
-            pygame.draw.line(surf, (20, 20, 25), sign.topright, sign.bottomleft, 2)
+        # 危險標誌（小黃黑）
+        sign = pygame.Rect(r.centerx - 7, r.centery - 7, 14, 14)
+        pygame.draw.rect(spr, (235, 200, 70), sign, border_radius=3)
+        pygame.draw.line(spr, (20, 20, 25), sign.topleft, sign.bottomright, 2)
+        pygame.draw.line(spr, (20, 20, 25), sign.topright, sign.bottomleft, 2)
+
+        self._sprite_cache[key] = spr
+        return spr
+
+    def draw(self, surf: pygame.Surface, to_view_rect: Callable[[pygame.Rect], pygame.Rect]) -> None:
+        # 全部桶子一次 blits（C 端迴圈）
+        surf.blits(
+            [(self._barrel_sprite(b.rect.w, b.rect.h), to_view_rect(b.rect)) for b in self.barrels],
+            doreturn=False,
+        )
 
     def draw_fx(self, surf: pygame.Surface, to_view_pos: Callable[[pygame.Vector2], Tuple[int, int]]) -> None:
         # 爆炸動畫（shockwave）
+        if not self.fx:
+            return
+
+        max_size = max(2, self.blast_radius * 2 + 8)
+        s = self._fx_scratch
+        if s is None or s.get_width() < max_size:
+            s = self._fx_scratch = pygame.Surface((max_size, max_size), pygame.SRCALPHA)
+
         for e in self.fx:
             r = int(e.radius())
             a = e.alpha()
@@ -227,13 +310,14 @@ class BarrelSystem:
             size = max(2, r * 2 + 8)
             fx = x - size // 2
             fy = y - size // 2
-            s = pygame.Surface((size, size), pygame.SRCALPHA)
+            area = pygame.Rect(0, 0, size, size)
+            s.fill((0, 0, 0, 0), area)
 
             pygame.draw.circle(s, (255, 170, 80, a), (size // 2, size // 2), r, 4)
             core_r = max(2, int(r * 0.28))
             pygame.draw.circle(s, (255, 220, 170, min(255, a + 50)), (size // 2, size // 2), core_r)
 
-            surf.blit(s, (fx, fy))
+            surf.blit(s, (fx, fy), area)
 
 
 # =========================
@@ -245,6 +329,10 @@ class FragileTile:
     # broken_kind: "pit" or "mud"
     broken_kind: str = "pit"
     state: str = "intact"  # "intact" | "pit" | "mud"
+    # spawn 時先算好的木紋/刮痕（tile 自己的座標系）：(rect, color)，都是水平線，直接 fill
+    grain: List[Tuple[pygame.Rect, Tuple[int, int, int]]] = field(default_factory=list)
+    # 泥巴亮點中心
+    mud_dots: List[Tuple[int, int]] = field(default_factory=list)
 
 
 class BreakableFloorSystem:
@@ -263,11 +351,13 @@ class BreakableFloorSystem:
         size_range: Tuple[Tuple[int,int], Tuple[int,int]] = ((70, 44), (130, 70)),
         mud_slow: float = 0.72,
         seed: Optional[int] = None,
+        grid: Optional[UniformGrid] = None,
     ) -> None:
         self.world_w = world_w
         self.world_h = world_h
         self.arena_margin = arena_margin
         self.obstacles = obstacles
+        self._obstacles_inflated = inflate_all(obstacles, 10)
 
         self.tile_count = tile_count
         self.size_range = size_range
@@ -275,10 +365,23 @@ class BreakableFloorSystem:
 
         self.rng = random.Random(seed)
         self.tiles: List[FragileTile] = []
+        # 已經變泥巴的 tile（減速只要看這些）
+        self._mud_tiles: List[FragileTile] = []
+        # tile 狀態每變一次就 +1（外面快取 pit 障礙物用）
+        self.revision = 0
+
+        # broad phase：tile 不會被移除（只會換 state），spawn 時登記一次就好（tag = "tile"）
+        self._grid = grid if grid is not None else UniformGrid(cell=128)
+
+        # 預先畫好的地板外觀 (state, w, h, seed) -> Surface
+        self._sprite_cache: Dict[Tuple[str, int, int, int], pygame.Surface] = {}
 
     def spawn_initial(self, avoid_rects: Optional[List[pygame.Rect]] = None) -> None:
         avoid_rects = avoid_rects or []
         self.tiles = []
+        self._mud_tiles = []
+        self._grid.clear("tile")
+        self.revision += 1
         placed: List[pygame.Rect] = []
 
         for _ in range(self.tile_count):
@@ -289,7 +392,8 @@ class BreakableFloorSystem:
                 self.obstacles,
                 size=(w, h),
                 avoid_rects=avoid_rects,
-                also_avoid=placed
+                also_avoid=placed,
+                obstacles_inflated=self._obstacles_inflated,
             )
             if r is None:
                 continue
@@ -297,7 +401,10 @@ class BreakableFloorSystem:
             # ✅ 開局全部是木地板（intact）
             # ✅ 但「碎掉後會變成 mud 或 pit」的命運先決定好
             kind = "mud" if (self.rng.random() < 0.45) else "pit"
-            self.tiles.append(FragileTile(rect=r, broken_kind=kind, state="intact"))
+            tile = FragileTile(rect=r, broken_kind=kind, state="intact")
+            self._bake_pattern(tile)
+            self.tiles.append(tile)
+            self._grid.insert(tile, r, "tile")
             placed.append(r)
 
     def get_blockers(self) -> List[pygame.Rect]:
@@ -305,16 +412,30 @@ class BreakableFloorSystem:
         return [t.rect for t in self.tiles if t.state == "pit"]
 
     def speed_factor_for(self, player_hitbox: pygame.Rect) -> float:
-        # mud = 減速
-        for t in self.tiles:
-            if t.state == "mud" and player_hitbox.colliderect(t.rect):
+        # mud = 減速（只掃泥巴 tile，還沒碎的時候直接回 1.0）
+        for t in self._mud_tiles:
+            if player_hitbox.colliderect(t.rect):
                 return self.mud_slow
         return 1.0
 
-    def handle_bullet_hit(self, bullet_rect: pygame.Rect, sound=None) -> bool:
-        for t in self.tiles:
+    def _break_tile(self, t: FragileTile) -> None:
+        t.state = "mud" if t.broken_kind == "mud" else "pit"
+        if t.state == "mud":
+            self._mud_tiles.append(t)
+        self.revision += 1
+
+    def handle_bullet_hit(
+        self,
+        bullet_rect: pygame.Rect,
+        sound=None,
+        candidates: Optional[List[FragileTile]] = None,
+    ) -> bool:
+        # candidates：呼叫端已經從共用 grid 查好的 tile（不給就自己查）
+        if candidates is None:
+            candidates = self._grid.query_tag(bullet_rect, "tile")
+        for t in candidates:
             if t.state == "intact" and bullet_rect.colliderect(t.rect):
-                t.state = "mud" if t.broken_kind == "mud" else "pit"
+                self._break_tile(t)
                 if sound is not None:
                     sound.play("wood_bomb", volume=1.5)
                 return True
@@ -322,79 +443,125 @@ class BreakableFloorSystem:
 
     def on_explosion(self, pos: pygame.Vector2, radius: float, sound=None) -> None:
         broke_any = False
-        for t in self.tiles:
-            if t.state != "intact":
+        reach = radius + 20
+        reach2 = reach * reach
+        px, py = pos.x, pos.y
+        # AABB 先擋掉：tile 完全在爆炸方框外就不用算距離
+        min_x, max_x = px - reach, px + reach
+        min_y, max_y = py - reach, py + reach
+        for t, _ in self._grid.query_radius(px, py, reach, "tile"):
+            tr = t.rect
+            if (t.state != "intact" or tr.right < min_x or tr.left > max_x
+                    or tr.bottom < min_y or tr.top > max_y):
                 continue
-            c = pygame.Vector2(t.rect.centerx, t.rect.centery)
-            if (c - pos).length() <= radius + 20:
-                t.state = "mud" if t.broken_kind == "mud" else "pit"
+            cx, cy = tr.center
+            dx = cx - px
+            dy = cy - py
+            if dx * dx + dy * dy <= reach2:
+                self._break_tile(t)
                 broke_any = True
         # ✅ 爆炸一次只播一次，避免同時碎很多塊狂叫
         if broke_any and sound is not None:
             sound.play("wood_bomb", volume=3)
 
+    @staticmethod
+    def _pattern_seed(t: FragileTile) -> int:
+        if t.state == "intact":
+            return (t.rect.x * 73856093) ^ (t.rect.y * 19349663) ^ (t.rect.w * 83492791) ^ (t.rect.h * 2654435761)
+        if t.state == "mud":
+            return (t.rect.x * 912367) ^ (t.rect.y * 3571) ^ 12345
+        return 0
+
+    @staticmethod
+    def _bake_pattern(t: FragileTile) -> None:
+        # 木紋/刮痕/泥巴點只跟 tile 的位置大小有關：spawn 時算一次存在 tile 上
+        grain_hi = (165, 118, 74)     # 木紋亮線
+        grain_lo = (120, 78, 45)      # 木紋暗線
+        w, h = t.rect.size
+        r = pygame.Rect(0, 0, w, h)
+
+        t.grain = []
+        inner = r.inflate(-12, -12)
+        if inner.width > 0 and inner.height > 0:
+            rng = random.Random(
+                (t.rect.x * 73856093) ^ (t.rect.y * 19349663) ^ (t.rect.w * 83492791) ^ (t.rect.h * 2654435761)
+            )
+            # 幾條長木紋（水平）
+            for _ in range(4):
+                y = rng.randint(inner.top, inner.bottom)
+                col = grain_hi if rng.random() < 0.5 else grain_lo
+                t.grain.append((pygame.Rect(inner.left, y, inner.width + 1, 2), col))
+
+            # 一些短刮痕
+            for _ in range(6):
+                x = rng.randint(inner.left, inner.right)
+                y = rng.randint(inner.top, inner.bottom)
+                dx = rng.randint(10, 22)
+                t.grain.append((pygame.Rect(x, y, min(inner.right, x + dx) - x + 1, 1), grain_lo))
+
+        rng = random.Random((t.rect.x * 912367) ^ (t.rect.y * 3571) ^ 12345)
+        t.mud_dots = [
+            (rng.randint(r.left + 10, r.right - 10), rng.randint(r.top + 10, r.bottom - 10))
+            for _ in range(3)
+        ]
+
+    def _tile_sprite(self, t: FragileTile) -> pygame.Surface:
+        # 外觀只由 (state, w, h, seed) 決定：第一次用到才畫，之後直接拿快取
+        w, h = t.rect.size
+        seed = self._pattern_seed(t)
+        key = (t.state, w, h, seed)
+        spr = self._sprite_cache.get(key)
+        if spr is not None:
+            return spr
+
+        spr = pygame.Surface((w, h), pygame.SRCALPHA)
+        r = spr.get_rect()
+
+        if t.state == "intact":
+            # ===== 木頭地板：木色 + 木紋 + 打叉 =====
+            wood_base = (140, 96, 58)     # 木板底色
+            wood_edge = (60, 38, 20)      # 外框
+            x_col     = (25, 18, 12)      # X 的顏色（深色）
+
+            # 1) 木板底 + 外框
+            pygame.draw.rect(spr, wood_base, r, border_radius=10)
+            pygame.draw.rect(spr, wood_edge, r, 2, border_radius=10)
+
+            # 2) 木紋 + 刮痕：spawn 時已算好（_bake_pattern）
+            # 水平線用 fill 一塊 rect 就好，比 draw.line 少算很多
+            for rect, col in t.grain:
+                spr.fill(col, rect)
+
+            # 3) 打叉 X
+            pad = 12
+            a = (r.left + pad,  r.top + pad)
+            b = (r.right - pad, r.bottom - pad)
+            c = (r.left + pad,  r.bottom - pad)
+            d = (r.right - pad, r.top + pad)
+            pygame.draw.line(spr, x_col, a, b, 4)
+            pygame.draw.line(spr, x_col, c, d, 4)
+
+        elif t.state == "pit":
+            # 坑：黑洞 + 邊緣亮
+            pygame.draw.rect(spr, (12, 12, 16), r, border_radius=10)
+            pygame.draw.rect(spr, (110, 110, 130), r, 2, border_radius=10)
+
+        else:  # mud
+            pygame.draw.rect(spr, (120, 95, 70), r, border_radius=10)
+            pygame.draw.rect(spr, (20, 20, 25), r, 2, border_radius=10)
+            # 泥巴亮點（spawn 時已算好位置，才不會閃）
+            for c in t.mud_dots:
+                pygame.draw.circle(spr, (170, 140, 110), c, 3)
+
+        self._sprite_cache[key] = spr
+        return spr
+
     def draw(self, surf: pygame.Surface, to_view_rect: Callable[[pygame.Rect], pygame.Rect]) -> None:
-        import random
-        import pygame
-
-        for t in self.tiles:
-            r = to_view_rect(t.rect)
-
-            if t.state == "intact":
-                # ===== 木頭地板：木色 + 木紋 + 打叉 =====
-                wood_base = (140, 96, 58)     # 木板底色
-                wood_edge = (60, 38, 20)      # 外框
-                grain_hi  = (165, 118, 74)    # 木紋亮線
-                grain_lo  = (120, 78, 45)     # 木紋暗線
-                x_col     = (25, 18, 12)      # X 的顏色（深色）
-
-                # 1) 木板底 + 外框
-                pygame.draw.rect(surf, wood_base, r, border_radius=10)
-                pygame.draw.rect(surf, wood_edge, r, 2, border_radius=10)
-
-                # 2) 固定 seed：避免每幀木紋亂跳
-                seed = (t.rect.x * 73856093) ^ (t.rect.y * 19349663) ^ (t.rect.w * 83492791) ^ (t.rect.h * 2654435761)
-                rng = random.Random(seed)
-
-                inner = r.inflate(-12, -12)
-                if inner.width > 0 and inner.height > 0:
-                    # 幾條長木紋（水平）
-                    for _ in range(4):
-                        y = rng.randint(inner.top, inner.bottom)
-                        col = grain_hi if rng.random() < 0.5 else grain_lo
-                        pygame.draw.line(surf, col, (inner.left, y), (inner.right, y), 2)
-
-                    # 一些短刮痕
-                    for _ in range(6):
-                        x = rng.randint(inner.left, inner.right)
-                        y = rng.randint(inner.top, inner.bottom)
-                        dx = rng.randint(10, 22)
-                        pygame.draw.line(surf, grain_lo, (x, y), (min(inner.right, x + dx), y), 1)
-
-                # 3) 打叉 X
-                pad = 12
-                a = (r.left + pad,  r.top + pad)
-                b = (r.right - pad, r.bottom - pad)
-                c = (r.left + pad,  r.bottom - pad)
-                d = (r.right - pad, r.top + pad)
-                pygame.draw.line(surf, x_col, a, b, 4)
-                pygame.draw.line(surf, x_col, c, d, 4)
-
-            elif t.state == "pit":
-                # 坑：黑洞 + 邊緣亮
-                pygame.draw.rect(surf, (12, 12, 16), r, border_radius=10)
-                pygame.draw.rect(surf, (110, 110, 130), r, 2, border_radius=10)
-
-            else:  # mud
-                pygame.draw.rect(surf, (120, 95, 70), r, border_radius=10)
-                pygame.draw.rect(surf, (20, 20, 25), r, 2, border_radius=10)
-                # 泥巴亮點（這段你原本用 self.rng 會閃；我也改成固定 seed 更穩）
-                seed = (t.rect.x * 912367) ^ (t.rect.y * 3571) ^ 12345
-                rng = random.Random(seed)
-                for _ in range(3):
-                    cx = rng.randint(r.left + 10, r.right - 10)
-                    cy = rng.randint(r.top + 10, r.bottom - 10)
-                    pygame.draw.circle(surf, (170, 140, 110), (cx, cy), 3)
+        # 每塊地板一個預先畫好的 sprite，整批 blits
+        surf.blits(
+            [(self._tile_sprite(t), to_view_rect(t.rect)) for t in self.tiles],
+            doreturn=False,
+        )
 
 
 # =========================
@@ -411,22 +578,36 @@ class FogOfWarSystem:
         self.darkness = max(0, min(255, darkness))
         self.feather = max(0, feather)
 
-    def apply(self, view_surf: pygame.Surface, player_screen_xy: Tuple[int, int]) -> None:
-        w, h = view_surf.get_size()
-        x, y = player_screen_xy
+        # 預先挖好洞的遮罩（視窗大小的 2 倍，洞在正中央）
+        self._overlay: Optional[pygame.Surface] = None
+        self._overlay_size: Tuple[int, int] = (0, 0)
 
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
+    def _build_overlay(self, w: int, h: int) -> pygame.Surface:
+        overlay = pygame.Surface((w * 2, h * 2), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, self.darkness))
 
         # 挖洞（硬邊）
-        pygame.draw.circle(overlay, (0, 0, 0, 0), (x, y), self.radius)
+        pygame.draw.circle(overlay, (0, 0, 0, 0), (w, h), self.radius)
 
         # 羽化（外面再挖幾圈淡一點，看起來比較柔）
         if self.feather > 0:
             for i in range(1, 5):
                 rr = self.radius + i * (self.feather // 4)
                 aa = max(0, self.darkness - i * 35)
-                pygame.draw.circle(overlay, (0, 0, 0, aa), (x, y), rr)
+                pygame.draw.circle(overlay, (0, 0, 0, aa), (w, h), rr)
+
+        return overlay
+
+    def apply(self, view_surf: pygame.Surface, player_screen_xy: Tuple[int, int]) -> None:
+        w, h = view_surf.get_size()
+        x, y = player_screen_xy
 
-        view_surf.blit(overlay, (0, 0))
+        # radius/darkness/feather 都不會變：遮罩只在視窗大小改變時重畫
+        if self._overlay is None or self._overlay_size != (w, h):
+            self._overlay = self._build_overlay(w, h)
+            self._overlay_size = (w, h)
 
+        # 把洞的中心 (w, h) 對到玩家位置；玩家一定在視窗內，夾一下保險
+        x = max(0, min(w, x))
+        y = max(0, min(h, y))
+        view_surf.blit(self._overlay, (0, 0), area=pygame.Rect(w - x, h - y, w, h))
@@ -1,10 +1,13 @@
 # classic_features.py
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable, List, Optional, Tuple
 
 import pygame
 
+from broadphase import UniformGrid
+from common import arena_rect, clamp_rect_in_arena, inflate_all
+
 
 @dataclass
 class Apple:
@@ -14,6 +17,10 @@ class Apple:
 
 import math
 
+# 每幀都會叫到的數學函式先綁成模組層級名稱
+_sin = math.sin
+_TAU = math.tau
+
 @dataclass
 class Portal:
     pos: pygame.Vector2
@@ -21,12 +28,24 @@ class Portal:
     phase: float = 0.0         # ✅ 每個 portal 不同相位（看起來更自然）
     amp: float = 3.0           # ✅ 跳動幅度（建議 2~5）
     freq: float = 1.4          # ✅ 跳動頻率（Hz）
+    _omega: float = field(init=False, repr=False, default=0.0)
 
-    def radius(self, t: float) -> int:
+    def __post_init__(self) -> None:
+        # 2π f 先乘好
+        self._omega = _TAU * self.freq
+
+    def wave(self, t: float) -> float:
+        # sin(2π f t + phase)：半徑跟光暈 alpha 共用
+        return _sin(self._omega * t + self.phase)
+
+    def radius_for(self, w: float) -> int:
         # r = base + amp * sin(2π f t + phase)
-        r = self.base_radius + self.amp * math.sin(2.0 * math.pi * self.freq * t + self.phase)
+        r = self.base_radius + self.amp * w
         return max(6, int(r))
 
+    def radius(self, t: float) -> int:
+        return self.radius_for(self.wave(t))
+
 @dataclass
 class TeleportFX:
     pos: pygame.Vector2
@@ -41,29 +60,20 @@ class TeleportFX:
         return self.t >= self.duration
 
     def radius(self) -> int:
-        p = max(0.0, min(1.0, self.t / self.duration))
-        p = 1.0 - (1.0 - p) * (1.0 - p)  # ease-out
-        return int(self.max_radius * p)
+        p = self.t / self.duration
+        p = 0.0 if p < 0.0 else (1.0 if p > 1.0 else p)
+        q = 1.0 - p
+        return int(self.max_radius * (1.0 - q * q))  # ease-out
 
     def alpha(self) -> int:
-        p = max(0.0, min(1.0, self.t / self.duration))
+        p = self.t / self.duration
+        p = 0.0 if p < 0.0 else (1.0 if p > 1.0 else p)
         return int(220 * (1.0 - p))
 
 
 def _rects_overlap_any(r: pygame.Rect, rects: List[pygame.Rect]) -> bool:
-    return any(r.colliderect(o) for o in rects)
-
-
-def _clamp_rect_in_arena(rect: pygame.Rect, world_w: int, world_h: int, arena_margin: int) -> None:
-    left = arena_margin
-    top = arena_margin
-    right = world_w - arena_margin
-    bottom = world_h - arena_margin
-
-    if rect.left < left: rect.left = left
-    if rect.top < top: rect.top = top
-    if rect.right > right: rect.right = right
-    if rect.bottom > bottom: rect.bottom = bottom
+    # collidelist 在 C 裡掃整個清單，沒撞到回傳 -1
+    return r.collidelist(rects) != -1
 
 
 def _find_free_rect(
@@ -75,27 +85,35 @@ def _find_free_rect(
     size: Tuple[int, int],
     avoid_rects: Optional[List[pygame.Rect]] = None,
     attempts: int = 800,
+    obstacles_inflated: Optional[List[pygame.Rect]] = None,
 ) -> Optional[pygame.Rect]:
     """找一個不撞掩體、不超出邊界的位置放物件(用rect表示)"""
     avoid_rects = avoid_rects or []
     w, h = size
+
+    # system 沒傳算好的版本才自己算（見 common.inflate_all）
+    if obstacles_inflated is None:
+        obstacles_inflated = inflate_all(obstacles, 10)
+
+    # 迴圈外先準備好：取樣範圍 + inflate 過的 avoid 清單（每次呼叫只做一次）
+    x_lo, x_hi = arena_margin + 10, world_w - arena_margin - 10 - w
+    y_lo, y_hi = arena_margin + 10, world_h - arena_margin - 10 - h
+    avoid_inflated = inflate_all(avoid_rects, 20)
+    randint = rng.randint
+
     for _ in range(attempts):
-        x = rng.randint(arena_margin + 10, world_w - arena_margin - 10 - w)
-        y = rng.randint(arena_margin + 10, world_h - arena_margin - 10 - h)
+        x = randint(x_lo, x_hi)
+        y = randint(y_lo, y_hi)
         r = pygame.Rect(x, y, w, h)
 
-        # 不要貼邊太近
-        if r.left < arena_margin + 6 or r.right > world_w - arena_margin - 6:
-            continue
-        if r.top < arena_margin + 6 or r.bottom > world_h - arena_margin - 6:
-            continue
+        # 取樣範圍本來就離邊界 10px，原本「貼邊 6px」的檢查不會成立，所以拿掉
 
         # 不要跟掩體重疊（inflate 讓它離掩體一點）
-        if _rects_overlap_any(r.inflate(10, 10), obstacles):
+        if _rects_overlap_any(r, obstacles_inflated):
             continue
 
         # 不要跟 avoid_rects 重疊（例如出生點）
-        if any(r.colliderect(a.inflate(20, 20)) for a in avoid_rects):
+        if r.collidelist(avoid_inflated) != -1:
             continue
 
         return r
@@ -111,23 +129,56 @@ def _find_free_point_for_portal(
     portal_radius: int,
     avoid_rects: Optional[List[pygame.Rect]] = None,
     attempts: int = 800,
+    obstacles_inflated: Optional[List[pygame.Rect]] = None,
+    far_from: Optional[pygame.Vector2] = None,
+    min_dist: float = 0.0,
 ) -> Optional[pygame.Vector2]:
-    """找一個不在掩體上、可放圓形傳送門中心點的位置"""
+    """
+    找一個不在掩體上、可放圓形傳送門中心點的位置
+    有給 far_from 就還要離它 min_dist 以上；試完都不夠遠時，回傳試到的空位裡離它最遠的那個
+    """
     avoid_rects = avoid_rects or []
+    if obstacles_inflated is None:
+        obstacles_inflated = inflate_all(obstacles, 10)
+
+    # 迴圈外先準備好：取樣範圍 + inflate 過的 avoid 清單
+    x_lo, x_hi = arena_margin + portal_radius + 10, world_w - arena_margin - portal_radius - 10
+    y_lo, y_hi = arena_margin + portal_radius + 10, world_h - arena_margin - portal_radius - 10
+    avoid_inflated = inflate_all(avoid_rects, 30)
+    randint = rng.randint
+    d = portal_radius * 2
+    min_d2 = min_dist * min_dist
+    fx, fy = (far_from.x, far_from.y) if far_from is not None else (0.0, 0.0)
+
+    # 不夠遠、但本身是空位的點裡最遠的那個（備案）
+    best: Optional[pygame.Vector2] = None
+    best_d2 = -1.0
+    d2 = 0.0
+
     for _ in range(attempts):
-        x = rng.randint(arena_margin + portal_radius + 10, world_w - arena_margin - portal_radius - 10)
-        y = rng.randint(arena_margin + portal_radius + 10, world_h - arena_margin - portal_radius - 10)
+        x = randint(x_lo, x_hi)
+        y = randint(y_lo, y_hi)
+
+        # 距離最便宜，先擋：太近的點只有比目前備案還遠才值得再驗
+        if far_from is not None:
+            d2 = (x - fx) * (x - fx) + (y - fy) * (y - fy)
+            if d2 < min_d2 and d2 <= best_d2:
+                continue
 
-        r = pygame.Rect(x - portal_radius, y - portal_radius, portal_radius * 2, portal_radius * 2)
+        r = pygame.Rect(x - portal_radius, y - portal_radius, d, d)
 
-        if _rects_overlap_any(r.inflate(10, 10), obstacles):
+        if _rects_overlap_any(r, obstacles_inflated):
             continue
-        if any(r.colliderect(a.inflate(30, 30)) for a in avoid_rects):
+        if r.collidelist(avoid_inflated) != -1:
+            continue
+
+        if d2 < min_d2:
+            best, best_d2 = pygame.Vector2(x, y), d2
             continue
 
         return pygame.Vector2(x, y)
 
-    return None
+    return best
 
 
 class AppleSystem:
@@ -148,11 +199,13 @@ class AppleSystem:
         heal_amount: int = 15,
         spawn_cd_range: Tuple[float, float] = (6.0, 10.0),
         seed: Optional[int] = None,
+        grid: Optional[UniformGrid] = None,
     ) -> None:
         self.world_w = world_w
         self.world_h = world_h
         self.arena_margin = arena_margin
         self.obstacles = obstacles
+        self._obstacles_inflated = inflate_all(obstacles, 10)
 
         self.max_apples = max_apples
         self.heal_amount = heal_amount
@@ -161,8 +214,23 @@ class AppleSystem:
         self.rng = random.Random(seed)
         self.apples: List[Apple] = []
 
+        # broad phase：蘋果登記在（可共用的）grid，tag = "apple"
+        self._grid = grid if grid is not None else UniformGrid(cell=128)
+
+        # 蘋果外觀都一樣：先畫好一張，之後每顆只要 blit 一次
+        self._apple_sprite = self._build_apple_sprite()
+
         self._spawn_t = self.rng.uniform(*self.spawn_cd_range)
 
+    @staticmethod
+    def _build_apple_sprite() -> pygame.Surface:
+        # 24x24，蘋果中心在 (12, 12)（紅色圓+小葉子）
+        spr = pygame.Surface((24, 24), pygame.SRCALPHA)
+        pygame.draw.circle(spr, (235, 80, 80), (12, 12), 9)
+        pygame.draw.circle(spr, (30, 30, 35), (12, 12), 9, 2)
+        pygame.draw.circle(spr, (90, 220, 120), (18, 4), 3)
+        return spr
+
     def _schedule_next(self) -> None:
         self._spawn_t = self.rng.uniform(*self.spawn_cd_range)
 
@@ -178,11 +246,14 @@ class AppleSystem:
             self.obstacles,
             size=(18, 18),
             avoid_rects=avoid_rects,
+            obstacles_inflated=self._obstacles_inflated,
         )
         if r is None:
             return
 
-        self.apples.append(Apple(rect=r, heal=self.heal_amount))
+        a = Apple(rect=r, heal=self.heal_amount)
+        self.apples.append(a)
+        self._grid.insert(a, r, "apple")
 
     def update(
         self,
@@ -198,27 +269,36 @@ class AppleSystem:
                 self.spawn_one(avoid_rects=avoid_rects)
             self._schedule_next()
 
-        # 撿到判定
+        # 撿到判定（被吃掉的先記下來，最後一次重建清單）
+        eaten = set()
         for pl in players:
-            hit = pl.body_hitbox()
+            hit = pl.body_hitbox_ip()
 
-            for a in self.apples[:]:
+            for a in self._grid.query_tag(hit, "apple"):
                 if hit.colliderect(a.rect):
                     pl.hp = min(pl.max_hp, pl.hp + a.heal)
-                    self.apples.remove(a)
+                    eaten.add(id(a))
+                    self._grid.remove(a)
 
                     # ✅ 播 apple 音效
                     if sound is not None:
                         sound.play("apple", volume=4.5)
 
+        if eaten:
+            self.apples = [a for a in self.apples if id(a) not in eaten]
+
     def draw(self, surf: pygame.Surface, to_view_rect: Callable[[pygame.Rect], pygame.Rect]) -> None:
+        spr = self._apple_sprite
         for a in self.apples:
             r = to_view_rect(a.rect)
-            # 畫蘋果（紅色圓+小葉子）
-            center = r.center
-            pygame.draw.circle(surf, (235, 80, 80), center, 9)
-            pygame.draw.circle(surf, (30, 30, 35), center, 9, 2)
-            pygame.draw.circle(surf, (90, 220, 120), (center[0] + 6, center[1] - 8), 3)
+            surf.blit(spr, (r.centerx - 12, r.centery - 12))
+
+
+# 找傳送門 B 的取樣上限（開局時做一次；一般地圖幾十次內就找到）
+_PORTAL_B_ATTEMPTS = 4000
+
+# 傳送落點卡在掩體裡時，依序試這些偏移
+_TELEPORT_FALLBACK = ((0, -28), (0, 28), (28, 0), (-28, 0), (20, 20), (-20, 20), (20, -20), (-20, -20))
 
 
 class PortalPairSystem:
@@ -242,6 +322,8 @@ class PortalPairSystem:
         self.world_h = world_h
         self.arena_margin = arena_margin
         self.obstacles = obstacles
+        self._obstacles_inflated = inflate_all(obstacles, 10)
+        self._arena = arena_rect(world_w, world_h, arena_margin)
 
         self.portal_radius = portal_radius
         self.cooldown = cooldown
@@ -253,39 +335,40 @@ class PortalPairSystem:
         self._t = 0.0
         self.fx: List[TeleportFX] = []
 
-        # 每個玩家獨立冷卻
-        self._cd = {1: 0.0, 2: 0.0}
+        # 同一個 _t 只算一次 sin：(A, B) 的 wave / 半徑 / 半徑平方
+        self._cached_t = -1.0
+        self._wave: Tuple[float, float] = (0.0, 0.0)
+        self._r: Tuple[int, int] = (0, 0)
+        self._r2: Tuple[int, int] = (0, 0)
+
+        # 光暈 / 傳送特效共用的畫布（不夠大才重開）
+        self._layer: Optional[pygame.Surface] = None
+
+        # 每個玩家獨立冷卻（index = player id - 1）
+        self._cd = [0.0, 0.0]
 
     def spawn_pair(self, avoid_rects: Optional[List[pygame.Rect]] = None) -> None:
         avoid_rects = avoid_rects or []
 
         a = _find_free_point_for_portal(
             self.rng, self.world_w, self.world_h, self.arena_margin,
-            self.obstacles, self.portal_radius, avoid_rects=avoid_rects
+            self.obstacles, self.portal_radius, avoid_rects=avoid_rects,
+            obstacles_inflated=self._obstacles_inflated,
         )
         if a is None:
             return
 
-        b = None
-        for _ in range(400):
-            cand = _find_free_point_for_portal(
-                self.rng, self.world_w, self.world_h, self.arena_margin,
-                self.obstacles, self.portal_radius, avoid_rects=avoid_rects
-            )
-            if cand is None:
-                continue
-            if (cand - a).length() >= 220:
-                b = cand
-                break
-
+        # B 要離 A 至少 220：直接在同一個取樣迴圈裡拒絕太近的點
+        # 掩體很擠時最多試 _PORTAL_B_ATTEMPTS 次，不夠遠就用試到的空位裡離 A 最遠的
+        b = _find_free_point_for_portal(
+            self.rng, self.world_w, self.world_h, self.arena_margin,
+            self.obstacles, self.portal_radius, avoid_rects=avoid_rects,
+            attempts=_PORTAL_B_ATTEMPTS,
+            obstacles_inflated=self._obstacles_inflated,
+            far_from=a, min_dist=220,
+        )
         if b is None:
-            # 找不到夠遠的就先用最後候選（或直接 return）
-            b = _find_free_point_for_portal(
-                self.rng, self.world_w, self.world_h, self.arena_margin,
-                self.obstacles, self.portal_radius, avoid_rects=avoid_rects
-            )
-            if b is None:
-                return
+            return
 
         self.A = Portal(
             pos=a,
@@ -302,33 +385,61 @@ class PortalPairSystem:
             freq=1.4,
         )
 
-    def _inside(self, pl, portal: Portal) -> bool:
-        pr = portal.radius(self._t)  # ✅ 動態半徑
-        # 用玩家中心判斷
-        c = pygame.Vector2(pl.rect.centerx, pl.rect.centery)
-        return (c - portal.pos).length_squared() <= (pr * pr)
+    def _get_layer(self, size: int) -> pygame.Surface:
+        # 每次只清左上 size x size 這塊，blit 時用 area 切出來
+        s = self._layer
+        if s is None or s.get_width() < size:
+            s = self._layer = pygame.Surface((size, size), pygame.SRCALPHA)
+        s.fill((0, 0, 0, 0), (0, 0, size, size))
+        return s
 
-    def _teleport_player(self, pl, dest: Portal) -> None:
+    def _refresh_wave(self) -> None:
+        if self._cached_t == self._t:
+            return
+        self._cached_t = self._t
+        wa = self.A.wave(self._t)
+        wb = self.B.wave(self._t)
+        ra = self.A.radius_for(wa)
+        rb = self.B.radius_for(wb)
+        self._wave = (wa, wb)
+        self._r = (ra, rb)
+        self._r2 = (ra * ra, rb * rb)
+
+    def _inside(self, pl, portal: Portal, r2: int) -> bool:
+        # r2 = 這一幀的（動態半徑）平方，update 開頭算好
+        # 用玩家中心判斷（純數字算，不用另外建 Vector2）
+        cx, cy = pl.rect.center
+        dx = cx - portal.pos.x
+        dy = cy - portal.pos.y
+        return dx * dx + dy * dy <= r2
+
+    def _teleport_player(self, pl, dest: Portal, pr: int) -> None:
         # ✅ 1) 起點特效：一定要在改位置之前
         self.fx.append(TeleportFX(pos=pygame.Vector2(pl.pos)))
 
         fx = 1 if getattr(pl.facing, "x", 1) >= 0 else -1
 
-        pr = dest.radius(self._t)  # ✅ 動態半徑數值
-        offset = pygame.Vector2(fx * (pr + 30), 0)
-
-        new_center = dest.pos + offset
-        pl.rect.center = (int(new_center.x), int(new_center.y))
-        _clamp_rect_in_arena(pl.rect, self.world_w, self.world_h, self.arena_margin)
-
-        if _rects_overlap_any(pl.body_hitbox(), self.obstacles):
-            for dx, dy in [(0, -28), (0, 28), (28, 0), (-28, 0), (20, 20), (-20, 20), (20, -20), (-20, -20)]:
-                pl.rect.center = (int(dest.pos.x + dx), int(dest.pos.y + dy))
-                _clamp_rect_in_arena(pl.rect, self.world_w, self.world_h, self.arena_margin)
-                if not _rects_overlap_any(pl.body_hitbox(), self.obstacles):
+        # pr = 目的地這一幀的動態半徑
+        tx, ty = dest.pos.x, dest.pos.y
+
+        rect = pl.rect
+        arena = self._arena
+        rect.center = (int(tx + fx * (pr + 30)), int(ty))
+        clamp_rect_in_arena(rect, arena)
+
+        obstacles = self.obstacles
+        # body hitbox 永遠置中在 rect 上、大小不變：算一次，之後只搬中心
+        hit = pl.body_hitbox()
+        if hit.collidelist(obstacles) != -1:
+            cx, cy = int(tx), int(ty)
+            for dx, dy in _TELEPORT_FALLBACK:
+                rect.center = (cx + dx, cy + dy)
+                clamp_rect_in_arena(rect, arena)
+                hit.center = rect.center
+                if hit.collidelist(obstacles) == -1:
                     break
 
-        pl.pos.update(pl.rect.centerx, pl.rect.centery)
+        pl.pos.update(rect.centerx, rect.centery)
         self.fx.append(TeleportFX(pos=pygame.Vector2(pl.pos)))   # 終點特效
 
     def update(self, dt: float, players: List[object], sound=None) -> None:
@@ -337,35 +448,40 @@ class PortalPairSystem:
         if self.A is None or self.B is None:
             return
 
-        for pid in list(self._cd.keys()):
-            self._cd[pid] = max(0.0, self._cd[pid] - dt)
+        self._refresh_wave()
+
+        # 只有兩個玩家：直接展開，不用 range / max
+        cd = self._cd
+        cd[0] = cd[0] - dt if cd[0] > dt else 0.0
+        cd[1] = cd[1] - dt if cd[1] > dt else 0.0
 
         for pl in players:
-            if self._cd.get(pl.id, 0.0) > 0:
+            i = pl.id - 1
+            if cd[i] > 0:
                 continue
 
-            if self._inside(pl, self.A):
-                self._teleport_player(pl, self.B)
+            # 只有兩個門：直接算兩個距離平方（算到就停），不用另外查 grid
+            if self._inside(pl, self.A, self._r2[0]):
+                self._teleport_player(pl, self.B, self._r[1])
 
                 # ✅ teleport 成功音效（只在真的傳送那刻播）
                 if sound is not None:
                     sound.play("transmit", volume=0.30)
 
-                self._cd[pl.id] = self.cooldown
+                cd[i] = self.cooldown
 
-            elif self._inside(pl, self.B):
-                self._teleport_player(pl, self.A)
+            elif self._inside(pl, self.B, self._r2[1]):
+                self._teleport_player(pl, self.A, self._r[0])
 
                 # ✅ teleport 成功音效
                 if sound is not None:
                     sound.play("transmit", volume=0.30)
 
-                self._cd[pl.id] = self.cooldown
+                cd[i] = self.cooldown
 
-        for f in self.fx[:]:
+        for f in self.fx:
             f.update(dt)
-            if f.done():
-                self.fx.remove(f)
+        self.fx = [f for f in self.fx if not f.done()]
 
 
     def draw(self, surf: pygame.Surface, shift_pos):
@@ -374,33 +490,35 @@ class PortalPairSystem:
         if self.A is None or self.B is None:
             return
 
+        self._refresh_wave()
+
         for f in self.fx:
             r = f.radius()
             a = f.alpha()
             x, y = shift_pos(f.pos)
 
             size = r * 2 + 10
-            layer = pygame.Surface((size, size), pygame.SRCALPHA)
+            layer = self._get_layer(size)
             pygame.draw.circle(layer, (255, 245, 220, a), (size//2, size//2), r, 3)
             pygame.draw.circle(layer, (255, 220, 160, max(0, a-60)), (size//2, size//2), max(2, r-8), 2)
-            surf.blit(layer, (x - size//2, y - size//2))
+            surf.blit(layer, (x - size//2, y - size//2), (0, 0, size, size))
 
-        def draw_one(p, inner, outer, glow_col):
+        def draw_one(p, idx, inner, outer, glow_col):
             x, y = shift_pos(p.pos)
 
             # ✅ 動態半徑（呼吸動畫）
-            r = p.radius(self._t)
+            r = self._r[idx]
 
             # ✅ alpha 光暈（跟著呼吸）
             glow_r = r + 12
-            glow = pygame.Surface((glow_r * 2, glow_r * 2), pygame.SRCALPHA)
+            glow = self._get_layer(glow_r * 2)
 
             # alpha 也跟著跳動（更有「呼吸」感）
-            a = int(60 + 40 * (0.5 + 0.5 * math.sin(2.0 * math.pi * p.freq * self._t + p.phase)))
+            a = int(60 + 40 * (0.5 + 0.5 * self._wave[idx]))
             pygame.draw.circle(glow, (*glow_col, a), (glow_r, glow_r), glow_r)
 
             # 先貼光暈再畫圈圈（看起來比較亮）
-            surf.blit(glow, (x - glow_r, y - glow_r))
+            surf.blit(glow, (x - glow_r, y - glow_r), (0, 0, glow_r * 2, glow_r * 2))
 
             # 外圈
             pygame.draw.circle(surf, outer, (x, y), r + 6, 4)
@@ -412,5 +530,5 @@ class PortalPairSystem:
             pygame.draw.circle(surf, (20, 20, 25), (x, y), r + 6, 2)
 
         # A 藍紫、B 橘紅（更好辨識）
-        draw_one(self.A, inner=(90, 160, 255), outer=(160, 220, 255), glow_col=(120, 190, 255))
-        draw_one(self.B, inner=(255, 140, 90), outer=(255, 220, 170), glow_col=(255, 170, 120))
+        draw_one(self.A, 0, inner=(90, 160, 255), outer=(160, 220, 255), glow_col=(120, 190, 255))
+        draw_one(self.B, 1, inner=(255, 140, 90), outer=(255, 220, 170), glow_col=(255, 170, 120))
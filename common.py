@@ -0,0 +1,71 @@
+# common.py
+# 各模式（classic / hardcore / chaos）共用的小工具：純數字運算，不依賴 main（避免循環 import）
+import math
+from typing import List, Tuple
+
+import pygame
+
+
+# =========================
+# 場地 / 掩體
+# =========================
+def arena_rect(world_w: int, world_h: int, arena_margin: int) -> pygame.Rect:
+    # 場地範圍：system 建立時算一次
+    return pygame.Rect(arena_margin, arena_margin, world_w - 2 * arena_margin, world_h - 2 * arena_margin)
+
+
+def clamp_rect_in_arena(rect: pygame.Rect, arena: pygame.Rect) -> None:
+    # clamp_ip 在 C 裡推回場內（rect 一定比場地小：玩家 / 安全區）
+    rect.clamp_ip(arena)
+
+
+def inflate_all(rects: List[pygame.Rect], pad: int) -> List[pygame.Rect]:
+    """
+    一次把整組 rect 往外擴 pad（生成時「離掩體 / 出生區遠一點」用）
+    掩體整場不會動：各 system 建立時算一次存起來，生成取樣時直接拿來比，
+    不用每試一個位置就 inflate 一次
+    """
+    return [r.inflate(pad, pad) for r in rects]
+
+
+# =========================
+# 爆炸距離衰減
+# =========================
+def blast_damage_kernel(
+    xs: List[float],
+    ys: List[float],
+    bx: float,
+    by: float,
+    radius: float,
+    dmg_min: int,
+    dmg_max: int,
+) -> List[int]:
+    """爆炸距離衰減：回傳每個座標要吃的傷害，範圍外是 -1（先用平方比，範圍內才開根號）"""
+    r2 = radius * radius
+    span = dmg_max - dmg_min
+    out = []
+    for i in range(len(xs)):
+        dx = xs[i] - bx
+        dy = ys[i] - by
+        d2 = dx * dx + dy * dy
+        if d2 > r2:
+            out.append(-1)
+            continue
+        t = 1.0 - (math.sqrt(d2) / radius)
+        out.append(int(dmg_min + span * t))
+    return out
+
+
+# =========================
+# 爆炸 / 衝擊波動畫查表（main.Explosion、chaos 的 BarrelFX 共用）
+# =========================
+# 進度 p(0~1) 切 64 格：ease-out 半徑比例 / 透明度，模組載入時算一次
+FX_LUT_N = 63
+FX_LUT_RADIUS: Tuple[float, ...] = tuple(1.0 - (1.0 - i / FX_LUT_N) ** 2 for i in range(FX_LUT_N + 1))
+FX_LUT_ALPHA: Tuple[int, ...] = tuple(int(255 * (1.0 - i / FX_LUT_N)) for i in range(FX_LUT_N + 1))
+
+
+def fx_lut_index(t: float, inv_dur: float) -> int:
+    # 已經過時間 t / 總時間 -> 查表格子（超出範圍夾到頭尾）
+    i = int(t * inv_dur * FX_LUT_N)
+    return 0 if i < 0 else (FX_LUT_N if i > FX_LUT_N else i)
@@ -1,27 +1,36 @@
 # hardcore_features.py
 import random
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable, List, Optional, Tuple
 
 import pygame
 
+from broadphase import UniformGrid
+from common import arena_rect, blast_damage_kernel, clamp_rect_in_arena, inflate_all
+
 # -------------------------
 # helpers
 # -------------------------
 def _rects_overlap_any(r: pygame.Rect, rects: List[pygame.Rect]) -> bool:
-    return any(r.colliderect(o) for o in rects)
-
-def _clamp_rect_in_arena(rect: pygame.Rect, world_w: int, world_h: int, arena_margin: int) -> None:
-    left = arena_margin
-    top = arena_margin
-    right = world_w - arena_margin
-    bottom = world_h - arena_margin
+    # collidelist 在 C 裡掃整個清單，沒撞到回傳 -1
+    return r.collidelist(rects) != -1
 
-    if rect.left < left: rect.left = left
-    if rect.top < top: rect.top = top
-    if rect.right > right: rect.right = right
-    if rect.bottom > bottom: rect.bottom = bottom
+class _ObstacleCells:
+    """
+    生成用的掩體格子（只在 system 建立時做一次）：
+    rows[cy][cx] = 左上角落在這格、邊長 <= span 的方框「有可能」撞到的掩體
+    所以每次嘗試只要查一格，再用 collidelist 比那一小撮
+    """
+    def __init__(self, rects: List[pygame.Rect], world_w: int, world_h: int, span: int, cell: int = 160) -> None:
+        self.cell = cell
+        self.rows: List[List[List[pygame.Rect]]] = []
+        for cy in range(world_h // cell + 1):
+            row = []
+            for cx in range(world_w // cell + 1):
+                area = pygame.Rect(cx * cell, cy * cell, cell + span, cell + span)
+                row.append([o for o in rects if o.colliderect(area)])
+            self.rows.append(row)
 
 
 def _find_free_point(
@@ -33,16 +42,38 @@ def _find_free_point(
     radius: int,
     avoid_rects: Optional[List[pygame.Rect]] = None,
     attempts: int = 1200,
+    obstacles_inflated: Optional[List[pygame.Rect]] = None,
+    obstacle_cells: Optional[_ObstacleCells] = None,
 ) -> Optional[pygame.Vector2]:
+    """
+    obstacle_cells：用 obstacles_inflated 建好的格子（span 要 >= radius * 2），有給就只比同格的掩體
+    """
     avoid_rects = avoid_rects or []
+
+    # system 沒傳算好的版本才自己算（見 common.inflate_all）
+    if obstacles_inflated is None:
+        obstacles_inflated = inflate_all(obstacles, 12)
+
+    # 迴圈外先準備好：取樣範圍 + inflate 過的 avoid 清單
+    x_lo, x_hi = arena_margin + radius + 10, world_w - arena_margin - radius - 10
+    y_lo, y_hi = arena_margin + radius + 10, world_h - arena_margin - radius - 10
+    avoid_inflated = inflate_all(avoid_rects, 30)
+    randint = rng.randint
+    d = radius * 2
+    if obstacle_cells is not None:
+        cell, rows = obstacle_cells.cell, obstacle_cells.rows
+
     for _ in range(attempts):
-        x = rng.randint(arena_margin + radius + 10, world_w - arena_margin - radius - 10)
-        y = rng.randint(arena_margin + radius + 10, world_h - arena_margin - radius - 10)
+        x = randint(x_lo, x_hi)
+        y = randint(y_lo, y_hi)
 
-        r = pygame.Rect(x - radius, y - radius, radius * 2, radius * 2)
-        if _rects_overlap_any(r.inflate(12, 12), obstacles):
+        r = pygame.Rect(x - radius, y - radius, d, d)
+        if obstacle_cells is not None:
+            if r.collidelist(rows[r.y // cell][r.x // cell]) != -1:
+                continue
+        elif _rects_overlap_any(r, obstacles_inflated):
             continue
-        if any(r.colliderect(a.inflate(30, 30)) for a in avoid_rects):
+        if r.collidelist(avoid_inflated) != -1:
             continue
         return pygame.Vector2(x, y)
     return None
@@ -71,6 +102,7 @@ class PoisonZoneSystem:
         self.world_w = world_w
         self.world_h = world_h
         self.arena_margin = arena_margin
+        self._arena = arena_rect(world_w, world_h, arena_margin)
 
         left = arena_margin
         top = arena_margin
@@ -86,6 +118,12 @@ class PoisonZoneSystem:
         self._t = 0.0
         self._acc = 0.0
 
+        # 安全區外的暗色遮罩：整張鋪好一次，之後每幀只 blit 四條邊
+        self._dim: Optional[pygame.Surface] = None
+        # 安全區外光暈：vr 大小不變就重用
+        self._glow: Optional[pygame.Surface] = None
+        self._glow_key: Optional[Tuple[int, int]] = None
+
     def _shrink_once(self) -> None:
         # 往內縮（保持中心不動）
         cx, cy = self.safe_rect.center
@@ -95,7 +133,13 @@ class PoisonZoneSystem:
         self.safe_rect.center = (cx, cy)
 
         # 不要縮到超出 arena margin
-        _clamp_rect_in_arena(self.safe_rect, self.world_w, self.world_h, self.arena_margin)
+        clamp_rect_in_arena(self.safe_rect, self._arena)
+
+    def register_players(self, players: List[object]) -> None:
+        # 開場掛一次毒傷小數累積欄位（update 裡就不用每幀 hasattr）
+        for pl in players:
+            if not hasattr(pl, "_poison_float"):
+                pl._poison_float = 0.0
 
     def update(self, dt: float, players: List[object]) -> None:
         self._t += dt
@@ -105,21 +149,22 @@ class PoisonZoneSystem:
             self._acc -= self.shrink_interval
             self._shrink_once()
 
-        # 毒傷：在安全區外扣血
+        # 毒傷：在安全區外扣血（安全區邊界先拿成區域變數，點在框內的判斷直接比大小）
+        sr = self.safe_rect
+        left, top, right, bottom = sr.left, sr.top, sr.right, sr.bottom
+        # 用累積的小數避免 dt 太小扣不到
+        dmg = self.damage_per_sec * dt
         for pl in players:
             px, py = pl.rect.center
-            if not self.safe_rect.collidepoint(px, py):
-                # 用累積的小數避免 dt 太小扣不到
-                dmg = self.damage_per_sec * dt
-                # 你 Player.take_damage 是 int，這邊做累積比較準
-                # 用一個私有欄位存小數
-                if not hasattr(pl, "_poison_float"):
-                    pl._poison_float = 0.0
-                pl._poison_float += dmg
-                take = int(pl._poison_float)
-                if take > 0:
-                    pl.take_damage(take)
-                    pl._poison_float -= take
+            if left <= px < right and top <= py < bottom:
+                continue
+            # 你 Player.take_damage 是 int，這邊做累積比較準
+            # 小數存在 register_players 掛上去的私有欄位
+            pl._poison_float += dmg
+            take = int(pl._poison_float)
+            if take > 0:
+                pl.take_damage(take)
+                pl._poison_float -= take
 
     def draw(
         self,
@@ -135,30 +180,38 @@ class PoisonZoneSystem:
         vr = to_view_rect(self.safe_rect)
 
         # 1) 外面變暗（用四塊矩形遮罩，避免挖洞麻煩）
-        dim = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-        a = 90  # 暗度
-        dim.fill((0, 0, 0, 0))
-
-        # top
-        pygame.draw.rect(dim, (0, 0, 0, a), pygame.Rect(0, 0, surf.get_width(), max(0, vr.top)))
-        # bottom
-        pygame.draw.rect(dim, (0, 0, 0, a), pygame.Rect(0, vr.bottom, surf.get_width(), surf.get_height() - vr.bottom))
-        # left
-        pygame.draw.rect(dim, (0, 0, 0, a), pygame.Rect(0, vr.top, max(0, vr.left), max(0, vr.height)))
-        # right
-        pygame.draw.rect(dim, (0, 0, 0, a), pygame.Rect(vr.right, vr.top, surf.get_width() - vr.right, max(0, vr.height)))
-
-        surf.blit(dim, (0, 0))
+        sw, sh = surf.get_size()
+        dim = self._dim
+        if dim is None or dim.get_size() != (sw, sh):
+            a = 90  # 暗度
+            dim = self._dim = pygame.Surface((sw, sh), pygame.SRCALPHA)
+            dim.fill((0, 0, 0, a))
+
+        bands = (
+            pygame.Rect(0, 0, sw, max(0, vr.top)),                          # top
+            pygame.Rect(0, vr.bottom, sw, sh - vr.bottom),                  # bottom
+            pygame.Rect(0, vr.top, max(0, vr.left), max(0, vr.height)),     # left
+            pygame.Rect(vr.right, vr.top, sw - vr.right, max(0, vr.height)),  # right
+        )
+        for band in bands:
+            if band.w > 0 and band.h > 0:
+                surf.blit(dim, band.topleft, band)
 
         # 2) 安全區邊框（呼吸）
         pulse = 0.5 + 0.5 * math.sin(self._t * 2.2)
         w = 3 + int(2 * pulse)
         col = (120, 255, 170)  # 綠框
-        glow = (120, 255, 170, int(40 + 60 * pulse))
-
-        # 外光暈
-        g = pygame.Surface((vr.w + 30, vr.h + 30), pygame.SRCALPHA)
-        pygame.draw.rect(g, glow, pygame.Rect(15, 15, vr.w, vr.h), border_radius=14, width=8)
+        glow_a = int(40 + 60 * pulse)
+
+        # 外光暈：框的形狀只跟 vr 大小有關（縮圈 / 換視窗才重畫），
+        # 呼吸的 alpha 用 set_alpha 疊上去
+        key = (vr.w, vr.h)
+        g = self._glow
+        if g is None or self._glow_key != key:
+            g = self._glow = pygame.Surface((vr.w + 30, vr.h + 30), pygame.SRCALPHA)
+            pygame.draw.rect(g, (*col, 255), pygame.Rect(15, 15, vr.w, vr.h), border_radius=14, width=8)
+            self._glow_key = key
+        g.set_alpha(glow_a)
         surf.blit(g, (vr.x - 15, vr.y - 15))
 
         # 主邊框
@@ -168,6 +221,12 @@ class PoisonZoneSystem:
 # -------------------------
 # Mines
 # -------------------------
+# 火線擺動 int(2 * sin) 查表：一圈切 256 格，每幀不用每顆地雷都叫 math.sin
+_WOB_N = 256
+_WOB_SCALE = _WOB_N / math.tau
+_WOB_LUT = tuple(int(2 * math.sin(i / _WOB_SCALE)) for i in range(_WOB_N))
+
+
 @dataclass
 class Mine:
     pos: pygame.Vector2
@@ -175,6 +234,10 @@ class Mine:
     arm_delay: float = 0.7  # 出生後 0.7 秒才會觸發（避免一生成就踩到）
     armed: bool = False
     phase: float = 0.0 
+    phase_idx: int = field(init=False, default=0)   # phase 換算成查表的格數
+
+    def __post_init__(self) -> None:
+        self.phase_idx = int(self.phase * _WOB_SCALE)
 
 @dataclass
 class MineFX:
@@ -190,12 +253,14 @@ class MineFX:
         return self.t >= self.duration
 
     def radius(self) -> float:
-        p = max(0.0, min(1.0, self.t / self.duration))
-        p = 1.0 - (1.0 - p) * (1.0 - p)
-        return self.max_radius * p
+        p = self.t / self.duration
+        p = 0.0 if p < 0.0 else (1.0 if p > 1.0 else p)
+        q = 1.0 - p
+        return self.max_radius * (1.0 - q * q)
 
     def alpha(self) -> int:
-        p = max(0.0, min(1.0, self.t / self.duration))
+        p = self.t / self.duration
+        p = 0.0 if p < 0.0 else (1.0 if p > 1.0 else p)
         return int(255 * (1.0 - p))
 
 
@@ -219,11 +284,17 @@ class MineSystem:
         max_damage: int = 48,
         min_damage: int = 12,
         seed: Optional[int] = None,
+        grid: Optional[UniformGrid] = None,
     ) -> None:
         self.world_w = world_w
         self.world_h = world_h
         self.arena_margin = arena_margin
         self.obstacles = obstacles
+        self._obstacles_inflated = inflate_all(obstacles, 12)
+        # 生成地雷時只比候選點那一格的掩體（方框邊長 = 2 * (mine_radius + 6)）
+        self._obstacle_cells = _ObstacleCells(
+            self._obstacles_inflated, world_w, world_h, span=2 * (mine_radius + 6),
+        )
 
         self.mine_count = mine_count
         self.mine_radius = mine_radius
@@ -235,114 +306,199 @@ class MineSystem:
 
         self.mines: List[Mine] = []
         self.fx: List[MineFX] = []
+        # 動畫用的累積時間（update 加、draw 讀）
+        self._t = 0.0
+        # 還在倒數、沒 armed 的地雷（全部 armed 之後每幀就不用再掃）
+        self._arming: List[Mine] = []
+        # 觸發距離平方（每顆地雷半徑一樣，建立時算一次）
+        self._trigger_r2 = (mine_radius + 10) ** 2
+
+        # shockwave 共用的畫布（不夠大才重開）
+        self._layer: Optional[pygame.Surface] = None
+
+        # 地雷本體（黑球、高光、引信座）每顆都一樣：先畫好一張
+        self._body_sprite, self._body_off = self._build_body_sprite()
+        # 火花三顆小點點的相對位置固定，也先畫成一張（中心在 (6, 5)）
+        self._spark_sprite = self._build_spark_sprite()
+
+        # broad phase：每顆地雷用「觸發範圍」的方框登記（tag = "mine"）
+        # 自己開的話格子大小抓 2 倍地雷直徑左右
+        self._grid = grid if grid is not None else UniformGrid(cell=max(2 * mine_radius, 48))
 
     def spawn_initial(self, avoid_rects: Optional[List[pygame.Rect]] = None) -> None:
         avoid_rects = avoid_rects or []
         self.mines = []
+        self._arming = []
+        self._grid.clear("mine")
 
         for _ in range(self.mine_count):
             p = _find_free_point(
                 self.rng, self.world_w, self.world_h, self.arena_margin,
-                self.obstacles, radius=self.mine_radius + 6, avoid_rects=avoid_rects
+                self.obstacles, radius=self.mine_radius + 6, avoid_rects=avoid_rects,
+                obstacles_inflated=self._obstacles_inflated,
+                obstacle_cells=self._obstacle_cells,
             )
             if p is None:
                 continue
-            self.mines.append(
-                Mine(
-                    pos=p,
-                    radius=self.mine_radius,
-                    arm_delay=0.7,
-                    armed=False,
-                    phase=self.rng.random() * math.tau,   # ✅ 這裡填入隨機 phase
-                )
+            m = Mine(
+                pos=p,
+                radius=self.mine_radius,
+                arm_delay=0.7,
+                armed=False,
+                phase=self.rng.random() * math.tau,   # ✅ 這裡填入隨機 phase
             )
+            self.mines.append(m)
+            self._arming.append(m)
+            reach = m.radius + 10
+            self._grid.insert(m, pygame.Rect(int(p.x) - reach, int(p.y) - reach, 2 * reach + 2, 2 * reach + 2), "mine")
 
-    def _explode(self, pos: pygame.Vector2, players: List[object], sound=None) -> None:
+    def _explode(
+        self,
+        pos: pygame.Vector2,
+        players: List[object],
+        sound=None,
+        coords: Optional[Tuple[List[float], List[float]]] = None,
+    ) -> None:
+        """
+        coords：呼叫端已經攤平好的 (xs, ys)（同一幀連爆好幾顆時共用，不給就自己攤）
+        """
         if sound is not None:
             sound.play("bomb", volume=0.35)
 
         # 特效
         self.fx.append(MineFX(pos=pygame.Vector2(pos), max_radius=self.blast_radius, duration=0.35))
 
-        # 範圍傷害：越近越痛
-        for pl in players:
-            d = (pl.pos - pos).length()
-            if d > self.blast_radius:
-                continue
-            t = 1.0 - (d / self.blast_radius)
-            dmg = int(self.min_damage + (self.max_damage - self.min_damage) * t)
-            pl.take_damage(dmg)
+        # 範圍傷害：越近越痛（座標先攤平成兩個 list，再丟給純數字的 kernel）
+        if coords is None:
+            coords = ([pl.pos.x for pl in players], [pl.pos.y for pl in players])
+        xs, ys = coords
+        dmgs = blast_damage_kernel(
+            xs, ys, pos.x, pos.y, self.blast_radius, self.min_damage, self.max_damage,
+        )
+        for pl, dmg in zip(players, dmgs):
+            if dmg >= 0:
+                pl.take_damage(dmg)
 
     def update(self, dt: float, players: List[object], sound=None) -> None:
-        self._t = getattr(self, "_t", 0.0) + dt
+        self._t += dt
 
-        # arm 計時
-        for m in self.mines:
-            if not m.armed:
+        # arm 計時（只看還沒 armed 的）
+        if self._arming:
+            still = []
+            for m in self._arming:
                 m.arm_delay -= dt
                 if m.arm_delay <= 0:
                     m.armed = True
-
-        # 踩到判定（用玩家中心距離）
-        for m in self.mines[:]:
-            if not m.armed:
-                continue
-            for pl in players:
-                c = pygame.Vector2(pl.rect.centerx, pl.rect.centery)
-                if (c - m.pos).length_squared() <= (m.radius + 10) ** 2:
+                else:
+                    still.append(m)
+            self._arming = still
+
+        # 踩到判定（用玩家中心距離）：只看玩家中心那一格登記的地雷
+        stepped = set()
+        r2 = self._trigger_r2
+        query_point = self._grid.query_point
+        for pl in players:
+            cx, cy = pl.rect.center
+            for m in query_point(cx, cy, "mine"):
+                if not m.armed:
+                    continue
+                dx = cx - m.pos.x
+                dy = cy - m.pos.y
+                if dx * dx + dy * dy <= r2:
+                    stepped.add(id(m))
+
+        if stepped:
+            # 照原本地雷順序爆，剩下的一次收集起來
+            # 扣血不會動到位置：玩家座標攤平一次，這幀每顆爆炸共用
+            coords = ([pl.pos.x for pl in players], [pl.pos.y for pl in players])
+            alive = []
+            for m in self.mines:
+                if id(m) in stepped:
                     # 觸發爆炸
-                    self._explode(m.pos, players, sound=sound)
-                    self.mines.remove(m)
-                    break
+                    self._explode(m.pos, players, sound=sound, coords=coords)
+                    self._grid.remove(m)
+                else:
+                    alive.append(m)
+            self.mines = alive
 
         # fx 更新
-        for e in self.fx[:]:
+        for e in self.fx:
             e.update(dt)
-            if e.done():
-                self.fx.remove(e)
+        self.fx = [e for e in self.fx if not e.done()]
+
+    def _build_body_sprite(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        # 回傳 (sprite, 地雷中心在 sprite 裡的位置)
+        r = int(self.mine_radius)
+        hl_r = max(2, r // 3)
+        cap_w = max(6, r)
+        cap_h = max(4, r // 2)
+        top = r + cap_h            # 引信座頂端到中心的距離
+        half_w = max(r, cap_w)
+        w = 2 * half_w + 2
+        h = top + r + 2
+        ox, oy = half_w + 1, top
+
+        spr = pygame.Surface((w, h), pygame.SRCALPHA)
+        # 1) 本體（黑色球）
+        pygame.draw.circle(spr, (25, 25, 30), (ox, oy), r)
+        pygame.draw.circle(spr, (10, 10, 14), (ox, oy), r, 2)
+        # 2) 高光（左上角一點）
+        pygame.draw.circle(spr, (70, 70, 85), (ox - r//3, oy - r//3), hl_r)
+        # 3) 小短管（引信座）
+        cap = pygame.Rect(ox - cap_w//2, oy - r - cap_h + 2, cap_w, cap_h)
+        pygame.draw.rect(spr, (55, 55, 65), cap, border_radius=3)
+        pygame.draw.rect(spr, (15, 15, 18), cap, 1, border_radius=3)
+        return spr, (ox, oy)
+
+    @staticmethod
+    def _build_spark_sprite() -> pygame.Surface:
+        spr = pygame.Surface((12, 12), pygame.SRCALPHA)
+        pygame.draw.circle(spr, (255, 210, 90), (6, 5), 3)
+        pygame.draw.circle(spr, (255, 140, 80), (9, 6), 2)
+        pygame.draw.circle(spr, (255, 240, 180), (4, 7), 2)
+        return spr
 
     def draw(self, surf: pygame.Surface, shift_pos):
         """
         shift_pos: (world_vec2)->(x,y)
         """
+        # 每顆地雷都一樣的東西（大小、時間、火花閃爍）迴圈外先算好
+        # 炸彈大小：用 mine_radius 做基準
+        r = int(self.mine_radius)
+        cap_h = max(4, r // 2)
+        wick_len = max(10, int(r * 1.1))
+        t = self._t  # update 每幀累加的時間（火線擺動 / 火花閃爍用）
+        # 4) 火花（閃爍的小點點）：所有地雷同步閃
+        spark_on = int((t * 12.0) % 2) == 0
+        wob_base = int(t * 8.0 * _WOB_SCALE)
+        wob_lut = _WOB_LUT
+        body = self._body_sprite
+        bx, by = self._body_off
+        spark = self._spark_sprite
+
         for m in self.mines:
             x, y = shift_pos(m.pos)
 
-            # 炸彈大小：用 mine_radius 做基準
-            r = int(self.mine_radius)
-
-            # 1) 本體（黑色球）
-            pygame.draw.circle(surf, (25, 25, 30), (x, y), r)
-            pygame.draw.circle(surf, (10, 10, 14), (x, y), r, 2)
-
-            # 2) 高光（左上角一點）
-            hl_r = max(2, r // 3)
-            pygame.draw.circle(surf, (70, 70, 85), (x - r//3, y - r//3), hl_r)
-
-            # 3) 火線（上方小短管 + 曲線火線）
-            # 小短管（引信座）
-            cap_w = max(6, r)
-            cap_h = max(4, r // 2)
-            cap = pygame.Rect(x - cap_w//2, y - r - cap_h + 2, cap_w, cap_h)
-            pygame.draw.rect(surf, (55, 55, 65), cap, border_radius=3)
-            pygame.draw.rect(surf, (15, 15, 18), cap, 1, border_radius=3)
-
-            # 火線（簡單用折線模擬彎曲）
-            wick_len = max(10, int(r * 1.1))
-            t = getattr(self, "_t", 0.0)  # 如果你 update 有 self._t += dt，就會動；沒有也沒關係
-            wob = int(2 * math.sin(t * 8.0 + m.phase)) if hasattr(m, "phase") else int(2 * math.sin(t * 8.0))
+            # 1)~3) 本體 + 高光 + 引信座：一張 sprite
+            surf.blit(body, (x - bx, y - by))
+
+            # 3) 火線（簡單用折線模擬彎曲）
+            wob = wob_lut[(wob_base + m.phase_idx) & (_WOB_N - 1)]
             p0 = (x, y - r - cap_h + 2)
             p1 = (x + 4 + wob, y - r - cap_h - wick_len//2)
             p2 = (x - 2 - wob, y - r - cap_h - wick_len)
             pygame.draw.lines(surf, (160, 120, 60), False, [p0, p1, p2], 3)
             pygame.draw.lines(surf, (30, 30, 35), False, [p0, p1, p2], 1)
-            # 4) 火花（閃爍的小點點）
-            spark_on = int((t * 12.0) % 2) == 0
             if spark_on:
-                sx, sy = p2
-                pygame.draw.circle(surf, (255, 210, 90), (sx, sy), 3)
-                pygame.draw.circle(surf, (255, 140, 80), (sx + 3, sy + 1), 2)
-                pygame.draw.circle(surf, (255, 240, 180), (sx - 2, sy + 2), 2)
+                surf.blit(spark, (p2[0] - 6, p2[1] - 5))
+
+    def _get_layer(self, size: int) -> pygame.Surface:
+        # 每次只清左上 size x size 這塊，blit 時用 area 切出來
+        s = self._layer
+        if s is None or s.get_width() < size:
+            s = self._layer = pygame.Surface((size, size), pygame.SRCALPHA)
+        s.fill((0, 0, 0, 0), (0, 0, size, size))
+        return s
 
     def draw_fx(self, surf: pygame.Surface, to_view_pos: Callable[[pygame.Vector2], Tuple[int, int]]) -> None:
         # 爆炸動畫（類似你 Explosion 的 shockwave）
@@ -354,10 +510,10 @@ class MineSystem:
             size = max(2, r * 2 + 8)
             fx = x - size // 2
             fy = y - size // 2
-            s = pygame.Surface((size, size), pygame.SRCALPHA)
+            s = self._get_layer(size)
 
             pygame.draw.circle(s, (255, 120, 120, a), (size // 2, size // 2), r, 4)
             core_r = max(2, int(r * 0.28))
             pygame.draw.circle(s, (255, 210, 180, min(255, a + 50)), (size // 2, size // 2), core_r)
 
-            surf.blit(s, (fx, fy))
+            surf.blit(s, (fx, fy), (0, 0, size, size))
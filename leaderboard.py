@@ -1,8 +1,9 @@
 # leaderboard.py
 import json
 import os
+import sqlite3
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import List, Tuple
 
 import pygame
 
@@ -11,31 +12,63 @@ class LeaderboardManager:
     """
     每個 mode_key 一份榜單（Classic/Hardcore/Chaos 分開）
     記錄：玩家 name 的 wins 次數（累計）
-    存到 leaderboard.json（跟 leaderboard.py 同資料夾）
+    存到 leaderboard.db（SQLite，跟 leaderboard.py 同資料夾）
+    - 一張表 lb(mode, name, wins, last)，(mode, name) 是主鍵
+    - record_win 是一句 upsert，top 直接 ORDER BY ... LIMIT
+    - record_win 當場 commit（WAL 下單筆 upsert 很便宜），中途當掉也不會掉勝場
+    - 第一次開、表是空的時候，會把舊的 leaderboard.json 匯入
     """
-    def __init__(self, filename: str = "leaderboard.json") -> None:
+    def __init__(self, filename: str = "leaderboard.db", legacy_json: str = "leaderboard.json") -> None:
         self.base_dir = os.path.dirname(__file__)
         self.path = os.path.join(self.base_dir, filename)
-        self.data: Dict[str, Dict[str, Dict]] = {}  # mode_key -> name -> {"wins":int, "last":float}
-        self._load()
+        self.legacy_path = os.path.join(self.base_dir, legacy_json)
+        self.conn = self._connect()
+        self._import_legacy()
 
-    def _load(self) -> None:
+    def _connect(self) -> sqlite3.Connection:
         try:
-            if os.path.exists(self.path):
-                with open(self.path, "r", encoding="utf-8") as f:
-                    raw = json.load(f)
-                if isinstance(raw, dict):
-                    self.data = raw
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
         except Exception as e:
-            print("[Leaderboard] load failed:", e)
-            self.data = {}
-
-    def _save(self) -> None:
+            # 檔案開不了（唯讀資料夾之類）：這次就先記在記憶體裡
+            print("[Leaderboard] open failed:", e)
+            conn = sqlite3.connect(":memory:")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS lb("
+            "mode TEXT, name TEXT, wins INTEGER, last REAL, PRIMARY KEY(mode, name))"
+        )
+        conn.commit()
+        return conn
+
+    def _import_legacy(self) -> None:
+        # 舊版的 mode_key -> name -> {"wins":int, "last":float}，只在表是空的時候搬一次
+        if self.conn.execute("SELECT 1 FROM lb LIMIT 1").fetchone() is not None:
+            return
         try:
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            if not os.path.exists(self.legacy_path):
+                return
+            with open(self.legacy_path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            if not isinstance(raw, dict):
+                return
+
+            rows = []
+            for mode_key, mode in raw.items():
+                if not isinstance(mode, dict):
+                    continue
+                for name, info in mode.items():
+                    try:
+                        wins = int(info.get("wins", 0))
+                        last = float(info.get("last", 0.0))
+                    except Exception:
+                        wins, last = 0, 0.0
+                    rows.append((str(mode_key), str(name), wins, last))
+
+            # 照原本的順序插入：同分時 rowid 小的排前面，跟以前一樣
+            self.conn.executemany("INSERT OR IGNORE INTO lb(mode, name, wins, last) VALUES (?, ?, ?, ?)", rows)
+            self.conn.commit()
         except Exception as e:
-            print("[Leaderboard] save failed:", e)
+            print("[Leaderboard] import failed:", e)
 
     def record_win(self, mode_key: str, winner_name: str) -> None:
         mode_key = str(mode_key)
@@ -43,38 +76,36 @@ class LeaderboardManager:
         if not winner_name:
             return
 
-        if mode_key not in self.data or not isinstance(self.data[mode_key], dict):
-            self.data[mode_key] = {}
-
-        if winner_name not in self.data[mode_key]:
-            self.data[mode_key][winner_name] = {"wins": 0, "last": 0.0}
-
-        self.data[mode_key][winner_name]["wins"] = int(self.data[mode_key][winner_name].get("wins", 0)) + 1
-        self.data[mode_key][winner_name]["last"] = float(time.time())
-        self._save()
+        try:
+            self.conn.execute(
+                "INSERT INTO lb(mode, name, wins, last) VALUES (?, ?, 1, ?) "
+                "ON CONFLICT(mode, name) DO UPDATE SET wins = lb.wins + 1, last = excluded.last",
+                (mode_key, winner_name, float(time.time())),
+            )
+            self.conn.commit()
+        except Exception as e:
+            print("[Leaderboard] record failed:", e)
 
     def top(self, mode_key: str, limit: int = 10) -> List[Tuple[str, int]]:
-        """回傳 [(name, wins), ...] 依 wins 由大到小排序"""
-        mode = self.data.get(mode_key, {})
-        if not isinstance(mode, dict):
+        """回傳 [(name, wins), ...] 依 wins 由大到小排序（同分照先上榜的順序）"""
+        try:
+            rows = self.conn.execute(
+                "SELECT name, wins FROM lb WHERE mode = ? ORDER BY wins DESC, rowid LIMIT ?",
+                (str(mode_key), int(limit)),
+            ).fetchall()
+        except Exception as e:
+            print("[Leaderboard] query failed:", e)
             return []
-
-        items = []
-        for name, info in mode.items():
-            try:
-                wins = int(info.get("wins", 0))
-            except Exception:
-                wins = 0
-            items.append((name, wins))
-
-        items.sort(key=lambda x: x[1], reverse=True)
-        return items[:limit]
+        return [(name, int(wins)) for name, wins in rows]
 
 
 class LeaderboardScene:
     """
     不繼承 main.Scene 也沒關係，只要提供 handle_event/update/draw，Game 就能用。
     """
+    BOX_W, BOX_H = 520, 330
+    BOX_Y = 190
+
     def __init__(
         self,
         game,
@@ -103,6 +134,39 @@ class LeaderboardScene:
 
         self.rows = self.lb.top(self.mode_key, limit=10)
 
+        # 整個畫面的字在這個場景裡都不會變：先 render 好，draw 只 blit
+        self._texts = self._render_texts()
+
+    def _render_texts(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        texts = []
+
+        title = self.big.render(f"Leaderboard - {self.mode_title}", True, self.UI)
+        texts.append((title, (self.W // 2 - title.get_width() // 2, 70)))
+
+        win = self.font.render(f"Winner: {self.winner_name}", True, (255, 220, 140))
+        texts.append((win, (self.W // 2 - win.get_width() // 2, 135)))
+
+        # 表格框（位置跟 draw 一樣）
+        x = self.W // 2 - self.BOX_W // 2
+        y = self.BOX_Y
+
+        header = self.small.render("Rank    Name                          Wins", True, (170, 170, 190))
+        texts.append((header, (x + 22, y + 18)))
+
+        # Rows
+        start_y = y + 62
+        for i, (name, wins) in enumerate(self.rows):
+            rank = i + 1
+            highlight = (name == self.winner_name)
+            col = (255, 230, 140) if highlight else self.UI
+
+            line = self.font.render(f"{rank:>2}     {name:<28}   {wins}", True, col)
+            texts.append((line, (x + 22, start_y + i * 28)))
+
+        hint = self.small.render("Enter: Play again | Esc: Menu", True, (170, 170, 190))
+        texts.append((hint, (self.W // 2 - hint.get_width() // 2, self.H - 60)))
+        return texts
+
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type != pygame.KEYDOWN:
             return
@@ -124,34 +188,15 @@ class LeaderboardScene:
     def draw(self, screen: pygame.Surface) -> None:
         screen.fill(self.BG)
 
-        title = self.big.render(f"Leaderboard - {self.mode_title}", True, self.UI)
-        screen.blit(title, (self.W // 2 - title.get_width() // 2, 70))
-
-        win = self.font.render(f"Winner: {self.winner_name}", True, (255, 220, 140))
-        screen.blit(win, (self.W // 2 - win.get_width() // 2, 135))
-
         # 表格框
-        box_w, box_h = 520, 330
+        box_w, box_h = self.BOX_W, self.BOX_H
         x = self.W // 2 - box_w // 2
-        y = 190
+        y = self.BOX_Y
         pygame.draw.rect(screen, (35, 35, 45), (x, y, box_w, box_h), border_radius=14)
         pygame.draw.rect(screen, (120, 120, 140), (x, y, box_w, box_h), width=2, border_radius=14)
 
-        header = self.small.render("Rank    Name                          Wins", True, (170, 170, 190))
-        screen.blit(header, (x + 22, y + 18))
-
         # 分隔線
         pygame.draw.line(screen, (80, 80, 100), (x + 18, y + 45), (x + box_w - 18, y + 45), 2)
 
-        # Rows
-        start_y = y + 62
-        for i, (name, wins) in enumerate(self.rows):
-            rank = i + 1
-            highlight = (name == self.winner_name)
-            col = (255, 230, 140) if highlight else self.UI
-
-            line = self.font.render(f"{rank:>2}     {name:<28}   {wins}", True, col)
-            screen.blit(line, (x + 22, start_y + i * 28))
-
-        hint = self.small.render("Enter: Play again | Esc: Menu", True, (170, 170, 190))
-        screen.blit(hint, (self.W // 2 - hint.get_width() // 2, self.H - 60))
+        # 標題 / 贏家 / 表頭 / 每一列 / 提示：一次 blit 完
+        screen.blits(self._texts, doreturn=False)
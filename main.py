@@ -1,8 +1,9 @@
 import math
 import random
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
+from common import FX_LUT_ALPHA, FX_LUT_RADIUS, arena_rect, clamp_rect_in_arena, fx_lut_index
 from leaderboard import LeaderboardManager, LeaderboardScene
 from classic_features import AppleSystem, PortalPairSystem
 from hardcore_features import PoisonZoneSystem, MineSystem
@@ -10,6 +11,7 @@ from chaos_features import BarrelSystem, BreakableFloorSystem, FogOfWarSystem
 
 import pygame
 import os
+import threading
 
 # =========================
 # Global Config
@@ -52,6 +54,13 @@ class GameMode:
     grenade_speed: float = GRENADE_SPEED
     world_w: int = WIDTH
     world_h: int = HEIGHT
+    # 模式建立時算一次，每幀 clamp 直接拿來用
+    # （共用的 Rect，只拿來讀，不要改它）
+    arena: pygame.Rect = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # 場地可以站的範圍（四邊扣掉 ARENA_MARGIN）
+        object.__setattr__(self, "arena", arena_rect(self.world_w, self.world_h, ARENA_MARGIN))
 
 MODES = {
     "classic": GameMode(
@@ -77,24 +86,16 @@ MODES = {
 # =========================
 # Utility
 # =========================
-def clamp_in_arena(rect: pygame.Rect, world_w: int, world_h: int) -> None:
-    left = ARENA_MARGIN
-    top = ARENA_MARGIN
-    right = world_w - ARENA_MARGIN
-    bottom = world_h - ARENA_MARGIN
-
-    if rect.left < left: rect.left = left
-    if rect.top < top: rect.top = top
-    if rect.right > right: rect.right = right
-    if rect.bottom > bottom: rect.bottom = bottom
-
-    if rect.left < left: rect.left = left
-    if rect.top < top: rect.top = top
-    if rect.right > right: rect.right = right
-    if rect.bottom > bottom: rect.bottom = bottom
+def clamp_in_arena(rect: pygame.Rect, world_w: int, world_h: int,
+                   arena: Optional[pygame.Rect] = None) -> None:
+    # arena：呼叫端先建好的場地 Rect（例如 GameMode.arena），沒給才現算
+    if arena is None:
+        arena = arena_rect(world_w, world_h, ARENA_MARGIN)
+    clamp_rect_in_arena(rect, arena)
 
 def rects_overlap_any(r: pygame.Rect, rects: List[pygame.Rect]) -> bool:
-    return any(r.colliderect(o) for o in rects)
+    # collidelist 在 C 裡掃整個清單，沒撞到回傳 -1
+    return r.collidelist(rects) != -1
 
 def safe_normalize(v: pygame.Vector2) -> pygame.Vector2:
     if v.length_squared() == 0:
@@ -130,15 +131,18 @@ class SoundManager:
         # 取得檔案所在資料夾，避免相對路徑問題
         self.base_dir = os.path.dirname(__file__)
 
+    def _resolve(self, filepath: str) -> str:
+        # 如果你傳入的是相對路徑，幫你變成「以程式檔所在資料夾為基準」
+        if not os.path.isabs(filepath):
+            return os.path.join(self.base_dir, filepath)
+        return filepath
+
     def load(self, name: str, filepath: str) -> None:
         if not self.enabled:
             self.sounds[name] = None
             return
 
-        fullpath = filepath
-        # 如果你傳入的是相對路徑，幫你變成「以程式檔所在資料夾為基準」
-        if not os.path.isabs(filepath):
-            fullpath = os.path.join(self.base_dir, filepath)
+        fullpath = self._resolve(filepath)
 
         try:
             self.sounds[name] = pygame.mixer.Sound(fullpath)
@@ -146,6 +150,20 @@ class SoundManager:
             self.sounds[name] = None
             print(f"[SoundManager] load failed ({name}) {fullpath}: {e}")
 
+    def load_many(self, pairs: List[Tuple[str, str]]) -> threading.Thread:
+        """
+        背景 thread 依序 load（解碼 mp3 不會卡住開遊戲）
+        - 還沒載好的音效 play 會直接略過（sounds 裡還沒有那個 key）
+        - 只有這個 thread 在寫 sounds，主執行緒只讀
+        """
+        def worker() -> None:
+            for name, filepath in pairs:
+                self.load(name, filepath)
+
+        t = threading.Thread(target=worker, name="sound-preload", daemon=True)
+        t.start()
+        return t
+
     def play(self, name: str, volume: float = 0.35) -> None:
         if not self.enabled:
             return
@@ -184,26 +202,33 @@ class ArenaMap:
         spawn_left  = pygame.Rect(ARENA_MARGIN, self.world_h // 2 - 120, 220, 240)
         spawn_right = pygame.Rect(self.world_w - ARENA_MARGIN - 220, self.world_h // 2 - 120, 220, 240)
 
+        spawns = [spawn_left, spawn_right]
+
+        # 迴圈裡不變的東西先算好（x/y 上限再扣掉這次的 w/h）
+        randint = self.rng.randint
+        lo_x = lo_y = ARENA_MARGIN + 40
+        hi_x = self.world_w - ARENA_MARGIN - 40
+        hi_y = self.world_h - ARENA_MARGIN - 40
+        want = 1 + self.obstacle_count
+
         attempts = 0
-        while len(self.obstacles) < 1 + self.obstacle_count and attempts < 2000:
+        while len(self.obstacles) < want and attempts < 2000:
             attempts += 1
-            w = self.rng.randint(50, 150)
-            h = self.rng.randint(22, 90)
+            w = randint(50, 150)
+            h = randint(22, 90)
 
-            x = self.rng.randint(ARENA_MARGIN + 40, self.world_w - ARENA_MARGIN - 40 - w)
-            y = self.rng.randint(ARENA_MARGIN + 40, self.world_h - ARENA_MARGIN - 40 - h)
+            x = randint(lo_x, hi_x - w)
+            y = randint(lo_y, hi_y - h)
             r = pygame.Rect(x, y, w, h)
 
             # 不要擋住出生區
-            if r.colliderect(spawn_left) or r.colliderect(spawn_right):
+            if r.collidelist(spawns) != -1:
                 continue
 
-            # 邊界檢查也一樣換成 self.world_w/self.world_h
-            if r.right > self.world_w - ARENA_MARGIN - 10: continue
-            if r.bottom > self.world_h - ARENA_MARGIN - 10: continue
+            # 邊界不用再檢查：x/y 的上限已經讓 r 離場邊至少 40
 
             # 不要重疊太多（允許稍微靠近）
-            if rects_overlap_any(r.inflate(12, 12), self.obstacles):
+            if r.inflate(12, 12).collidelist(self.obstacles) != -1:
                 continue
             self.obstacles.append(r)
 
@@ -214,7 +239,8 @@ class ArenaMap:
 # =========================
 # Weapons / Projectiles
 # =========================
-@dataclass
+# 子彈 / 手榴彈 / 爆炸場上數量多、每幀都在讀欄位：用 slots 省掉每個物件的 __dict__
+@dataclass(slots=True)
 class Bullet:
     rect: pygame.Rect
     vel: pygame.Vector2
@@ -224,10 +250,39 @@ class Bullet:
     thickness: int = 4   
 
     def update(self, dt: float) -> None:
-        self.rect.x += int(self.vel.x * dt)
-        self.rect.y += int(self.vel.y * dt)
+        self.rect.move_ip(int(self.vel.x * dt), int(self.vel.y * dt))
+
 
-@dataclass
+class BulletPool:
+    """
+    子彈回收池：霰彈槍一發就是好幾顆，打到東西就丟掉
+    - acquire：有回收的就拿來改欄位重用（連 Rect 一起），沒有才新建
+    - release：子彈從場上移除時放回來（最多留 capacity 顆）
+    """
+    def __init__(self, capacity: int = 256) -> None:
+        self.capacity = capacity
+        self._free: List[Bullet] = []
+
+    def acquire(self, x: int, y: int, w: int, h: int, vel: pygame.Vector2,
+                owner_id: int, damage: int, kind: str, thickness: int) -> Bullet:
+        if not self._free:
+            return Bullet(rect=pygame.Rect(x, y, w, h), vel=vel, owner_id=owner_id,
+                          damage=damage, kind=kind, thickness=thickness)
+        b = self._free.pop()
+        b.rect.update(x, y, w, h)
+        b.vel = vel
+        b.owner_id = owner_id
+        b.damage = damage
+        b.kind = kind
+        b.thickness = thickness
+        return b
+
+    def release(self, b: Bullet) -> None:
+        if len(self._free) < self.capacity:
+            self._free.append(b)
+
+
+@dataclass(slots=True)
 class Grenade:
     pos: pygame.Vector2
     vel: pygame.Vector2
@@ -255,30 +310,30 @@ class Grenade:
             self.pos.y = (world_h - ARENA_MARGIN) - 7
             self.vel.y *= -GRENADE_BOUNCE
 
-        # 掩體反彈（分軸處理）
-        for o in obstacles:
-            if r.colliderect(o):
-                # 往回推一點再反彈
-                # 嘗試以最小穿透方向修正
-                dx_left = abs(r.right - o.left)
-                dx_right = abs(o.right - r.left)
-                dy_top = abs(r.bottom - o.top)
-                dy_bottom = abs(o.bottom - r.top)
-                m = min(dx_left, dx_right, dy_top, dy_bottom)
-
-                if m == dx_left:
-                    self.pos.x = o.left - 7
-                    self.vel.x *= -GRENADE_BOUNCE
-                elif m == dx_right:
-                    self.pos.x = o.right + 7
-                    self.vel.x *= -GRENADE_BOUNCE
-                elif m == dy_top:
-                    self.pos.y = o.top - 7
-                    self.vel.y *= -GRENADE_BOUNCE
-                else:
-                    self.pos.y = o.bottom + 7
-                    self.vel.y *= -GRENADE_BOUNCE
-                break
+        # 掩體反彈（分軸處理）：collidelist 在 C 裡找第一個撞到的掩體
+        hit = r.collidelist(obstacles)
+        if hit != -1:
+            o = obstacles[hit]
+            # 往回推一點再反彈
+            # 嘗試以最小穿透方向修正（有重疊時四個穿透量都是正的，不用 abs）
+            dx_left = r.right - o.left
+            dx_right = o.right - r.left
+            dy_top = r.bottom - o.top
+            dy_bottom = o.bottom - r.top
+            m = min(dx_left, dx_right, dy_top, dy_bottom)
+
+            if m == dx_left:
+                self.pos.x = o.left - 7
+                self.vel.x *= -GRENADE_BOUNCE
+            elif m == dx_right:
+                self.pos.x = o.right + 7
+                self.vel.x *= -GRENADE_BOUNCE
+            elif m == dy_top:
+                self.pos.y = o.top - 7
+                self.vel.y *= -GRENADE_BOUNCE
+            else:
+                self.pos.y = o.bottom + 7
+                self.vel.y *= -GRENADE_BOUNCE
 
         # 簡單阻尼，避免永遠彈
         self.vel *= 0.993
@@ -286,12 +341,16 @@ class Grenade:
         # fuse 倒數
         self.fuse -= dt
 
-@dataclass
+@dataclass(slots=True)
 class Explosion:
     pos: pygame.Vector2
     max_radius: int
     duration: float = 0.35  # 爆炸動畫總時間(秒)
     t: float = 0.0          # 已經過時間
+    _inv_dur: float = field(init=False, repr=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        self._inv_dur = 1.0 / self.duration
 
     def update(self, dt: float) -> None:
         self.t += dt
@@ -299,14 +358,12 @@ class Explosion:
     def done(self) -> bool:
         return self.t >= self.duration
 
+    # 半徑比例 / 透明度查 common 的共用表
     def radius(self) -> float:
-        p = max(0.0, min(1.0, self.t / self.duration))
-        p = 1.0 - (1.0 - p) * (1.0 - p)  # ease-out
-        return self.max_radius * p
+        return self.max_radius * FX_LUT_RADIUS[fx_lut_index(self.t, self._inv_dur)]
 
     def alpha(self) -> int:
-        p = max(0.0, min(1.0, self.t / self.duration))
-        return int(255 * (1.0 - p))
+        return FX_LUT_ALPHA[fx_lut_index(self.t, self._inv_dur)]
 
 class Weapon:
     """
@@ -365,6 +422,21 @@ class Weapon:
             if self._reload_left <= 0:
                 self._finish_reload()
 
+    @staticmethod
+    def tick_all(weapons: List["Weapon"], dt: float) -> None:
+        # 一次推進一整組武器（跟逐把 w.update(dt) 結果一樣，只是少了每把一次 method call）
+        for w in weapons:
+            cl = w._cooldown_left
+            if cl > 0:
+                w._cooldown_left = cl - dt if cl > dt else 0.0
+
+            if w._reloading:
+                rl = w._reload_left - dt
+                if rl <= 0:
+                    w._finish_reload()
+                else:
+                    w._reload_left = rl
+
     def can_fire(self) -> bool:
         if self._reloading:
             return False
@@ -392,7 +464,9 @@ class Weapon:
         self._reloading = False
         self._reload_left = 0.0
 
-    def fire(self, origin: pygame.Vector2, dir_vec: pygame.Vector2, owner_id: int) -> List[Bullet]:
+    def fire(self, origin: pygame.Vector2, dir_vec: pygame.Vector2, owner_id: int,
+             pool: Optional["BulletPool"] = None) -> List[Bullet]:
+        """pool：有給就從回收池拿子彈，不用每顆都 new"""
         if not self.can_fire():
             return []
 
@@ -403,25 +477,37 @@ class Weapon:
         bullets: List[Bullet] = []
         base_angle = math.degrees(math.atan2(dir_vec.y, dir_vec.x))
 
+        # 迴圈外先算好：子彈大小 / 左上角 / 散射範圍都跟第幾顆無關
+        bw, bh = self.bullet_size
+        bx = int(origin.x) - bw // 2
+        by = int(origin.y) - bh // 2
+        spread = self.spread_deg
+        speed = self.bullet_speed
+        damage = self.damage
+        kind = self.bullet_kind
+        thickness = self.bullet_thickness
+        uniform = random.uniform
+        radians, cos, sin = math.radians, math.cos, math.sin
+        Vector2 = pygame.Vector2
+
         for _ in range(self.pellets):
-            # 隨機散射
-            a = base_angle + random.uniform(-self.spread_deg, self.spread_deg)
-            v = angle_to_vector(a) * self.bullet_speed
+            # 隨機散射（跟 angle_to_vector(a) * speed 同一組算式，只是少了一次建 Vector2）
+            rad = radians(base_angle + uniform(-spread, spread))
+            v = Vector2(cos(rad) * speed, sin(rad) * speed)
 
             # 子彈rect以中心建
-            bw, bh = self.bullet_size
-            bx = int(origin.x) - bw // 2
-            by = int(origin.y) - bh // 2
-            rect = pygame.Rect(bx, by, bw, bh)
+            if pool is not None:
+                bullets.append(pool.acquire(bx, by, bw, bh, v, owner_id, damage, kind, thickness))
+                continue
 
             bullets.append(
                 Bullet(
-                    rect=rect,
+                    rect=pygame.Rect(bx, by, bw, bh),
                     vel=v,
                     owner_id=owner_id,
-                    damage=self.damage,
-                    kind=self.bullet_kind,
-                    thickness=self.bullet_thickness,
+                    damage=damage,
+                    kind=kind,
+                    thickness=thickness,
                 )
             )
 
@@ -491,6 +577,11 @@ class Player:
         self.rect = pygame.Rect(start_pos[0], start_pos[1], PLAYER_SIZE[0], PLAYER_SIZE[1])
         self.pos = pygame.Vector2(self.rect.centerx, self.rect.centery)
 
+        # body hitbox 大小固定、只有位置跟著 rect 走：body_hitbox_ip 用的共用 Rect
+        self._hb_w = int(self.rect.w * 0.45)   # 身體寬
+        self._hb_h = int(self.rect.h * 0.55)   # 身體高
+        self._body_hb = pygame.Rect(0, 0, self._hb_w, self._hb_h)
+
         self.max_hp = MAX_HP
         self.hp = self.max_hp
 
@@ -498,6 +589,11 @@ class Player:
         self.facing = pygame.Vector2(1, 0) if player_id == 1 else pygame.Vector2(-1, 0)
 
         self.keymap = keymap
+        # 每幀都要查的四個方向鍵先拆成 int，update 裡就不用每次查 dict
+        self.key_left = keymap["left"]
+        self.key_right = keymap["right"]
+        self.key_up = keymap["up"]
+        self.key_down = keymap["down"]
         self.weapons = make_default_weapons()
         self.weapon_index = 0
 
@@ -507,6 +603,10 @@ class Player:
         self.sound = None            # PlayScene 會塞進來
         self.hurt_sfx_cd = 0.0       # 受傷音效冷卻
 
+        # 圓角身體畫一次就好，draw 只要 blit
+        self._body_surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(self._body_surf, self.color, self._body_surf.get_rect(), border_radius=10)
+
     @property
     def weapon(self) -> Weapon:
         return self.weapons[self.weapon_index]
@@ -515,12 +615,20 @@ class Player:
         return self.hp > 0
 
     def body_hitbox(self) -> pygame.Rect:
-        # 身體 hitbox：比整個 PLAYER_SIZE 小，讓手腳可穿牆
-        w = int(self.rect.w * 0.45)   # 身體寬
-        h = int(self.rect.h * 0.55)   # 身體高
+        # 身體 hitbox：比整個 PLAYER_SIZE 小，讓手腳可穿牆（每次都是新的 Rect，可以放心留著用）
+        w, h = self._hb_w, self._hb_h
         cx, cy = self.rect.center
         return pygame.Rect(cx - w // 2, cy - h // 2, w, h)
 
+    def body_hitbox_ip(self) -> pygame.Rect:
+        # 同 body_hitbox，但回傳玩家自己那個共用的 Rect（下次呼叫就被蓋掉）
+        # 只給「拿到馬上用完」的熱路徑用（移動、地板減速、撿蘋果）
+        w, h = self._hb_w, self._hb_h
+        cx, cy = self.rect.center
+        hb = self._body_hb
+        hb.update(cx - w // 2, cy - h // 2, w, h)
+        return hb
+
     def set_weapon(self, idx: int) -> None:
         if 0 <= idx < len(self.weapons):
             self.weapon_index = idx
@@ -541,25 +649,35 @@ class Player:
                 self.hurt_sfx_cd = 0.35
 
     def _try_move_axis(self, dx: float, dy: float, obstacles: List[pygame.Rect],
-                   world_w: int, world_h: int) -> None:
+                   world_w: int, world_h: int,
+                   arena: Optional[pygame.Rect] = None) -> None:
         # 分軸移動：比較滑順，也比較好卡牆
-        if dx != 0:
-            self.rect.x += int(dx)
-            if rects_overlap_any(self.body_hitbox(), obstacles):
-                self.rect.x -= int(dx)
-
-        if dy != 0:
-            self.rect.y += int(dy)
-            if rects_overlap_any(self.body_hitbox(), obstacles):
-                self.rect.y -= int(dy)
-
-        clamp_in_arena(self.rect, world_w, world_h)
+        # 位移取整後是 0 就不用測碰撞；hitbox 只建一次，之後跟著 rect 一起平移
+        ix, iy = int(dx), int(dy)
+        hb = None
+        if ix:
+            self.rect.x += ix
+            hb = self.body_hitbox_ip()
+            if rects_overlap_any(hb, obstacles):
+                self.rect.x -= ix
+                hb.x -= ix
+
+        if iy:
+            self.rect.y += iy
+            if hb is None:
+                hb = self.body_hitbox_ip()
+            else:
+                hb.y += iy
+            if rects_overlap_any(hb, obstacles):
+                self.rect.y -= iy
+
+        clamp_in_arena(self.rect, world_w, world_h, arena)
         self.pos.update(self.rect.centerx, self.rect.centery)
 
-    def update(self, dt: float, keys: pygame.key.ScancodeWrapper, obstacles: List[pygame.Rect], world_w, world_h) -> None:
+    def update(self, dt: float, keys: pygame.key.ScancodeWrapper, obstacles: List[pygame.Rect], world_w, world_h,
+               arena: Optional[pygame.Rect] = None) -> None:
         # 武器內部 cooldown / reload
-        for w in self.weapons:
-            w.update(dt)
+        Weapon.tick_all(self.weapons, dt)
 
         if self.grenade_cd > 0:
             self.grenade_cd = max(0.0, self.grenade_cd - dt)
@@ -570,21 +688,26 @@ class Player:
         # 移動
         vx = 0.0
         vy = 0.0
-        if keys[self.keymap["left"]]:  vx -= 1.0
-        if keys[self.keymap["right"]]: vx += 1.0
-        if keys[self.keymap["up"]]:    vy -= 1.0
-        if keys[self.keymap["down"]]:  vy += 1.0
-
-        move = safe_normalize(pygame.Vector2(vx, vy)) * self.speed * dt
-        if move.length_squared() > 0:
-            # 用移動方向更新 facing（讓玩家面向移動方向）
-            self.facing = safe_normalize(pygame.Vector2(vx, vy))
-        self._try_move_axis(move.x, move.y, obstacles, world_w, world_h)
-
-    def try_shoot(self, sound: SoundManager) -> List[Bullet]:
+        if keys[self.key_left]:  vx -= 1.0
+        if keys[self.key_right]: vx += 1.0
+        if keys[self.key_up]:    vy -= 1.0
+        if keys[self.key_down]:  vy += 1.0
+
+        # 直接用 float 正規化一次（不用建兩個 Vector2、也不用開兩次根號）
+        if vx or vy:
+            length = math.sqrt(vx * vx + vy * vy)
+            nx, ny = vx / length, vy / length
+            # 用移動方向更新 facing（讓玩家面向移動方向）；原地改，不換新物件
+            self.facing.update(nx, ny)
+            mx, my = nx * self.speed * dt, ny * self.speed * dt
+        else:
+            mx = my = 0.0
+        self._try_move_axis(mx, my, obstacles, world_w, world_h, arena)
+
+    def try_shoot(self, sound: SoundManager, pool: Optional[BulletPool] = None) -> List[Bullet]:
         # 從玩家中心稍微往 facing 方向偏移，避免子彈出生就撞到自己
         origin = self.pos + self.facing * (PLAYER_SIZE[0] * 0.55)
-        bullets = self.weapon.fire(origin=origin, dir_vec=self.facing, owner_id=self.id)
+        bullets = self.weapon.fire(origin=origin, dir_vec=self.facing, owner_id=self.id, pool=pool)
         if bullets:
             sound.play(self.weapon.name, volume=0.3)
         return bullets
@@ -612,7 +735,7 @@ class Player:
                     owner_id=self.id, fuse=GRENADE_FUSE_SEC)
 
     def draw(self, screen: pygame.Surface) -> None:
-        pygame.draw.rect(screen, self.color, self.rect, border_radius=10)
+        screen.blit(self._body_surf, self.rect)
         # facing 小白點
         tip = (int(self.pos.x + self.facing.x * 18), int(self.pos.y + self.facing.y * 18))
         pygame.draw.circle(screen, (245, 245, 245), tip, 4)
@@ -638,6 +761,22 @@ class MenuScene(Scene):
         self.selection = 0
         self.items = ["Start", "Controls", "Quit"]
 
+        # 靜態的字 / 按鈕底只在這裡 render 一次，draw 只負責 blit
+        self.box_w, self.box_h = 320, 52
+        self.item_surfs = [self.font.render(it, True, (0, 0, 0)) for it in self.items]
+        self.btn_surfs = [self._make_btn(False), self._make_btn(True)]
+        # 整個畫面只跟 selection 有關：每個 selection 第一次畫時組好一張，之後整張 blit
+        self._frames: Dict[int, pygame.Surface] = {}
+
+    def _make_btn(self, selected: bool) -> pygame.Surface:
+        # ✅ 半透明白色圓角方塊
+        alpha = 150  # 0~255，越小越透明（可調 110~190）
+        fill = (255, 255, 255, alpha) if not selected else (255, 255, 255, alpha + 20)
+
+        btn = pygame.Surface((self.box_w, self.box_h), pygame.SRCALPHA)
+        pygame.draw.rect(btn, fill, (0, 0, self.box_w, self.box_h), border_radius=14)
+        return btn
+
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
@@ -654,13 +793,20 @@ class MenuScene(Scene):
                     self.game.running = False
 
     def draw(self, screen: pygame.Surface) -> None:
+        frame = self._frames.get(self.selection)
+        if frame is None:
+            frame = self._frames[self.selection] = pygame.Surface((WIDTH, HEIGHT))
+            self._compose(frame, self.selection)
+        screen.blit(frame, (0, 0))
+
+    def _compose(self, screen: pygame.Surface, selection: int) -> None:
         if getattr(self.game, "menu_bg", None) is not None:
             screen.blit(self.game.menu_bg, (0, 0))
         else:
             screen.fill(BG_COLOR)
 
         # ===== menu items: 白底圓角方塊 + 黑字 =====
-        box_w, box_h = 320, 52
+        box_w, box_h = self.box_w, self.box_h
         start_y = 250
         gap = 18
 
@@ -669,15 +815,9 @@ class MenuScene(Scene):
             x = WIDTH // 2 - box_w // 2
             y = start_y + offset_y + i * (box_h + gap)
 
-            selected = (i == self.selection)
-
-            # ✅ 半透明白色圓角方塊
-            alpha = 150  # 0~255，越小越透明（可調 110~190）
-            fill = (255, 255, 255, alpha) if not selected else (255, 255, 255, alpha + 20)
+            selected = (i == selection)
 
-            btn = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
-            pygame.draw.rect(btn, fill, (0, 0, box_w, box_h), border_radius=14)
-            screen.blit(btn, (x, y))
+            screen.blit(self.btn_surfs[selected], (x, y))
 
             # 選到的加黑框
             if selected:
@@ -691,7 +831,7 @@ class MenuScene(Scene):
                 pygame.draw.polygon(screen, (0, 0, 0), pts)
 
             # 黑色字體（置中在方塊內）
-            text = self.font.render(it, True, (0, 0, 0))
+            text = self.item_surfs[i]
             shift = 14 if selected else 0
             tx = x + (box_w - text.get_width()) // 2 + shift
             ty = y + (box_h - text.get_height()) // 2 
@@ -715,6 +855,54 @@ class NameInputScene(Scene):
         self.cursor_t = 0.0
         self.cursor_on = True
 
+        # 固定的字先 render 好；名字那行只有內容變了（打字 / 游標閃）才重 render
+        self.title_surf = self.big.render("Enter Player Names", True, UI_COLOR)
+        self.hint_surf = self.font.render("Type name | Enter: next/confirm | Tab: switch | Esc: back", True, (170, 170, 190))
+        self.label_surfs = [self.font.render("P1 Name:", True, UI_COLOR),
+                            self.font.render("P2 Name:", True, UI_COLOR)]
+        self.ok_surf = self.font.render("Press Enter to continue", True, (170, 170, 190))
+        self._name_cache: List[Tuple[Optional[str], Optional[pygame.Surface]]] = [(None, None), (None, None)]
+        self.box_w, self.box_h = 520, 56
+        self.start_y = 230
+        self._bg = self._build_bg()
+        # 輸入框只有 active / 非 active 兩種樣子：先畫好兩張
+        self.box_surfs = [self._make_box((120, 120, 140)), self._make_box((235, 235, 245))]
+
+    def _make_box(self, border: Tuple[int, int, int]) -> pygame.Surface:
+        box = pygame.Surface((self.box_w, self.box_h), pygame.SRCALPHA)
+        rect = (0, 0, self.box_w, self.box_h)
+        pygame.draw.rect(box, (35, 35, 45), rect, border_radius=10)
+        pygame.draw.rect(box, border, rect, width=2, border_radius=10)
+        return box
+
+    def _build_bg(self) -> pygame.Surface:
+        # 背景圖 + 標題 / 提示 / 兩個欄位標籤都不會變：先疊成一張
+        bg = pygame.Surface((WIDTH, HEIGHT))
+        if getattr(self.game, "menuinput_bg", None) is not None:
+            bg.blit(self.game.menuinput_bg, (0, 0))
+        else:
+            bg.fill(BG_COLOR)
+
+        title = self.title_surf
+        bg.blit(title, (WIDTH // 2 - title.get_width() // 2, 90))
+
+        hint = self.hint_surf
+        bg.blit(hint, (WIDTH // 2 - hint.get_width() // 2, 150))
+
+        for i in range(2):
+            bg.blit(self.label_surfs[i], (WIDTH // 2 - self.box_w // 2, self.start_y + i * 110 - 26))
+
+        ok = self.ok_surf
+        bg.blit(ok, (WIDTH // 2 - ok.get_width() // 2, HEIGHT - 90))
+        return bg
+
+    def _name_surf(self, i: int, text: str) -> pygame.Surface:
+        cached_text, surf = self._name_cache[i]
+        if surf is None or cached_text != text:
+            surf = self.font.render(text, True, UI_COLOR)
+            self._name_cache[i] = (text, surf)
+        return surf
+
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type != pygame.KEYDOWN:
             return
@@ -769,75 +957,62 @@ class NameInputScene(Scene):
             self.cursor_on = not self.cursor_on
 
     def draw(self, screen: pygame.Surface) -> None:
-        if getattr(self.game, "menuinput_bg", None) is not None:
-            screen.blit(self.game.menuinput_bg, (0, 0))
-        else:
-            screen.fill(BG_COLOR)
-
-        title = self.big.render("Enter Player Names", True, UI_COLOR)
-        screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 90))
+        screen.blit(self._bg, (0, 0))
 
-        hint = self.font.render("Type name | Enter: next/confirm | Tab: switch | Esc: back", True, (170, 170, 190))
-        screen.blit(hint, (WIDTH // 2 - hint.get_width() // 2, 150))
-
-        box_w, box_h = 520, 56
-        start_y = 230
+        box_w, box_h = self.box_w, self.box_h
+        start_y = self.start_y
 
         for i in range(2):
             is_active = (i == self.active)
-            label = "P1 Name:" if i == 0 else "P2 Name:"
-            label_surf = self.font.render(label, True, UI_COLOR)
-            screen.blit(label_surf, (WIDTH // 2 - box_w // 2, start_y + i * 110 - 26))
             # box
             x = WIDTH // 2 - box_w // 2
             y = start_y + i * 110
-            border = (235, 235, 245) if is_active else (120, 120, 140)
-            pygame.draw.rect(screen, (35, 35, 45), (x, y, box_w, box_h), border_radius=10)
-            pygame.draw.rect(screen, border, (x, y, box_w, box_h), width=2, border_radius=10)
+            screen.blit(self.box_surfs[is_active], (x, y))
 
             text = self.names[i]
             if is_active and self.cursor_on:
                 text += "|"
 
-            text_surf = self.font.render(text, True, UI_COLOR)
+            text_surf = self._name_surf(i, text)
             screen.blit(text_surf, (x + 16, y + 15))
 
-        ok = self.font.render("Press Enter to continue", True, (170, 170, 190))
-        screen.blit(ok, (WIDTH // 2 - ok.get_width() // 2, HEIGHT - 90))
-
 class ControlsScene(Scene):
+    LINES = [
+        "P1 (Blue):  Move WASD | Shoot F | Reload R | Grenade Q | Weapon 1/2/3",
+        "P2 (Red):   Move Arrows | Shoot / | Reload RightShift | Grenade RightCtrl | Weapon KP1/KP2/KP3",
+        "Common: ESC quit | In game: ESC menu | After win: Enter restart",
+        "Apple: Touch to heal +HP, then it disappears ✦",
+        "Portals: Enter one portal → teleport next to the other portal",
+        "Poison Zone: Shrinks every shrink_interval; staying inside deals DoT ⚠",
+        "Landmine: Step on it → instant explosion (AoE damage)",
+        "Barrel: Solid obstacle; can explode and deal nearby damage ⚠",
+        "Blocker: Cannot pass; entering the slow area reduces speed ↓",
+    ]
+
     def __init__(self, game: "Game") -> None:
         self.game = game
         self.font = pygame.font.SysFont("Arial", 22)
         self.big = pygame.font.SysFont("Arial", 42, bold=True)
 
+        # 整頁都是固定文字：底色 + 全部字一次疊成一張，draw 只要整張 blit
+        title = self.big.render("Controls", True, UI_COLOR)
+        hint = self.font.render("Press Enter/Esc to go back", True, (170, 170, 190))
+        texts = [(title, (WIDTH // 2 - title.get_width() // 2, 80))]
+        for i, line in enumerate(self.LINES):
+            texts.append((self.font.render(line, True, UI_COLOR), (80, 200 + i * 40)))
+        texts.append((hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT - 90)))
+
+        self._bg = pygame.Surface((WIDTH, HEIGHT))
+        self._bg.fill(BG_COLOR)
+        self._bg.blits(texts, doreturn=False)
+
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key in (pygame.K_ESCAPE, pygame.K_RETURN):
                 self.game.set_scene(MenuScene(self.game))
 
     def draw(self, screen: pygame.Surface) -> None:
-        screen.fill(BG_COLOR)
-        title = self.big.render("Controls", True, UI_COLOR)
-        screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 80))
-
-        lines = [
-            "P1 (Blue):  Move WASD | Shoot F | Reload R | Grenade Q | Weapon 1/2/3",
-            "P2 (Red):   Move Arrows | Shoot / | Reload RightShift | Grenade RightCtrl | Weapon KP1/KP2/KP3",
-            "Common: ESC quit | In game: ESC menu | After win: Enter restart",
-            "Apple: Touch to heal +HP, then it disappears ✦",
-            "Portals: Enter one portal → teleport next to the other portal",
-            "Poison Zone: Shrinks every shrink_interval; staying inside deals DoT ⚠",
-            "Landmine: Step on it → instant explosion (AoE damage)",
-            "Barrel: Solid obstacle; can explode and deal nearby damage ⚠",
-            "Blocker: Cannot pass; entering the slow area reduces speed ↓",
-        ]
-        for i, s in enumerate(lines):
-            t = self.font.render(s, True, UI_COLOR)
-            screen.blit(t, (80, 200 + i * 40))
-
-        hint = self.font.render("Press Enter/Esc to go back", True, (170, 170, 190))
-        screen.blit(hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT - 90))
+        screen.blit(self._bg, (0, 0))
 
 class ModeSelectScene(Scene):
     def __init__(self, game: "Game") -> None:
@@ -849,6 +1024,25 @@ class ModeSelectScene(Scene):
         self.mode_keys = ["classic", "hardcore", "chaos"]
         self.selection = 0
 
+        # 介紹文字（讓你選的時候就知道差異）
+        desc_map = {
+            "classic":  "Balanced: normal HP, normal obstacles, normal grenades.",
+            "hardcore": "Lower HP, more obstacles, bigger grenade radius (hard).",
+            "chaos":    "More HP, many obstacles, faster grenades, infinite ammo!",
+        }
+        desc_font = pygame.font.SysFont("Arial", 18)
+
+        # 每個模式先 render 好「沒選 / 有選（▶）」兩版標題 + 介紹，draw 只看 selection 挑一張
+        self.title_surf = self.big.render("Select Mode", True, UI_COLOR)
+        self.line_surfs = [
+            (self.font.render("  " + MODES[key].title, True, UI_COLOR),
+             self.font.render("▶ " + MODES[key].title, True, UI_COLOR))
+            for key in self.mode_keys
+        ]
+        self.desc_surfs = [desc_font.render(desc_map[key], True, (170, 170, 190)) for key in self.mode_keys]
+        # 跟 MenuScene 一樣：畫面只跟 selection 有關，每個 selection 組一張就好
+        self._frames: Dict[int, pygame.Surface] = {}
+
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
@@ -867,34 +1061,31 @@ class ModeSelectScene(Scene):
                 self.game.set_scene(PlayScene(self.game))
 
     def draw(self, screen: pygame.Surface) -> None:
+        frame = self._frames.get(self.selection)
+        if frame is None:
+            frame = self._frames[self.selection] = pygame.Surface((WIDTH, HEIGHT))
+            self._compose(frame, self.selection)
+        screen.blit(frame, (0, 0))
+
+    def _compose(self, screen: pygame.Surface, selection: int) -> None:
         if getattr(self.game, "mode_bg", None) is not None:
             screen.blit(self.game.mode_bg, (0, 0))
         else:
             screen.fill(BG_COLOR)
 
-        title = self.big.render("Select Mode", True, UI_COLOR)
+        title = self.title_surf
         screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 80))
 
-        # 介紹文字（讓你選的時候就知道差異）
-        desc_map = {
-            "classic":  "Balanced: normal HP, normal obstacles, normal grenades.",
-            "hardcore": "Lower HP, more obstacles, bigger grenade radius (hard).",
-            "chaos":    "More HP, many obstacles, faster grenades, infinite ammo!",
-        }
-        desc_font = pygame.font.SysFont("Arial", 18)
         start_y = 190
         block_h = 90  # 每個模式佔 90px，高度夠就不會擠在一起
 
-        for i, key in enumerate(self.mode_keys):
-            m = MODES[key]
-            prefix = "▶ " if i == self.selection else "  "
-
-            line_surf = self.font.render(prefix + m.title, True, UI_COLOR)
+        for i in range(len(self.mode_keys)):
+            line_surf = self.line_surfs[i][i == selection]
             line_x = WIDTH // 2 - line_surf.get_width() // 2
             line_y = start_y + i * block_h
             screen.blit(line_surf, (line_x, line_y))
 
-            desc_surf = desc_font.render(desc_map[key], True, (170, 170, 190))
+            desc_surf = self.desc_surfs[i]
             desc_x = WIDTH // 2 - desc_surf.get_width() // 2
             screen.blit(desc_surf, (desc_x, line_y + 28))
 
@@ -913,18 +1104,39 @@ class Game:
 
         # 修改 Game.__init__ 內部
         self.sound = SoundManager() 
-        self.sound.load("Pistol", "pistol_shot.mp3")  # 標籤名要對應武器名稱
-        self.sound.load("Rifle", "rifle_shot.mp3")
-        self.sound.load("Shotgun", "shotgun_shot.mp3")
-        self.sound.load("apple", "apple.mp3")
-        self.sound.load("scream_p1", "scream.mp3")
-        self.sound.load("scream_p2", "scream2.mp3")
-        self.sound.load("wood_bomb", "wood_bomb.mp3")
-        self.sound.load("transmit", "transmit.mp3")
-        self.sound.load("bomb", "bomb.mp3")
-
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        self.render_surface = pygame.Surface((WIDTH, HEIGHT))
+        # 音效在背景載入，視窗 / 選單不用等解碼
+        self.sound.load_many([
+            ("Pistol", "pistol_shot.mp3"),  # 標籤名要對應武器名稱
+            ("Rifle", "rifle_shot.mp3"),
+            ("Shotgun", "shotgun_shot.mp3"),
+            ("apple", "apple.mp3"),
+            ("scream_p1", "scream.mp3"),
+            ("scream_p2", "scream2.mp3"),
+            ("wood_bomb", "wood_bomb.mp3"),
+            ("transmit", "transmit.mp3"),
+            ("bomb", "bomb.mp3"),
+        ])
+
+        # SCALED：邏輯解析度固定 WIDTH x HEIGHT，等比例縮放 + 黑邊交給 SDL 的 renderer 做
+        # （線性濾波，看起來跟原本 smoothscale 一樣；場景直接畫在 screen 上）
+        os.environ.setdefault("SDL_RENDER_SCALE_QUALITY", "linear")
+        try:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED | pygame.FULLSCREEN)
+            self.render_surface = self.screen
+        except pygame.error:
+            # 不支援 SCALED 才退回：畫到固定畫布，每幀自己 smoothscale 到全螢幕
+            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            self.render_surface = pygame.Surface((WIDTH, HEIGHT))
+        self._scaled: Optional[pygame.Surface] = None   # 縮放結果重複用，視窗大小變了才重建
+
+        # 高頻率的「移動」類事件（滑鼠移動、手把 / 控制器搖桿、觸控拖曳）遊戲用不到，直接擋在 SDL，不進 event queue
+        # 按鍵（含 KEYUP）、按鈕這類低頻事件照常放行，之後的場景要用不用另外解封
+        pygame.event.set_blocked([
+            pygame.MOUSEMOTION,
+            pygame.JOYAXISMOTION,
+            pygame.CONTROLLERAXISMOTION,
+            pygame.FINGERMOTION,
+        ])
 
         # ✅ load menu background once
         base_dir = os.path.dirname(__file__)
@@ -990,28 +1202,36 @@ class Game:
             # 先畫到固定 1000x600 畫布
             self.scene.draw(self.render_surface)
 
-            # 取得全螢幕大小
-            sw, sh = self.screen.get_size()
+            # SCALED 模式 render_surface 就是 screen，縮放由 SDL 處理
+            if self.render_surface is not self.screen:
+                self._present_letterboxed()
 
-            # 等比例縮放（不變形）
-            scale = min(sw / WIDTH, sh / HEIGHT)
-            scaled_w = int(WIDTH * scale)
-            scaled_h = int(HEIGHT * scale)
+            pygame.display.flip()
 
-            # 置中偏移（letterbox）
-            ox = (sw - scaled_w) // 2
-            oy = (sh - scaled_h) // 2
+        pygame.quit()
 
-            # 畫背景（黑邊）
-            self.screen.fill((0, 0, 0))
+    def _present_letterboxed(self) -> None:
+        # 取得全螢幕大小
+        sw, sh = self.screen.get_size()
 
-            # 縮放後貼到中央
-            scaled = pygame.transform.smoothscale(self.render_surface, (scaled_w, scaled_h))
-            self.screen.blit(scaled, (ox, oy))
+        # 等比例縮放（不變形）
+        scale = min(sw / WIDTH, sh / HEIGHT)
+        scaled_w = int(WIDTH * scale)
+        scaled_h = int(HEIGHT * scale)
 
-            pygame.display.flip()
+        # 置中偏移（letterbox）
+        ox = (sw - scaled_w) // 2
+        oy = (sh - scaled_h) // 2
 
-        pygame.quit()
+        # 畫背景（黑邊）
+        self.screen.fill((0, 0, 0))
+
+        # 縮放後貼到中央
+        scaled = self._scaled
+        if scaled is None or scaled.get_size() != (scaled_w, scaled_h):
+            scaled = self._scaled = pygame.Surface((scaled_w, scaled_h))
+        pygame.transform.smoothscale(self.render_surface, (scaled_w, scaled_h), scaled)
+        self.screen.blit(scaled, (ox, oy))
 
 def main():
     Game().run()
@@ -1,7 +1,8 @@
 # play_scene.py
 from __future__ import annotations
+import math
 import pygame
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # ✅ 直接從 main.py 把需要的東西「拿來用」
 # 這樣你 PlayScene 內的 WIDTH/HEIGHT/ARENA_MARGIN... 都不用改
@@ -11,22 +12,39 @@ from main import (
     P1_COLOR, P2_COLOR, OBSTACLE_COLOR,
     GRENADE_FUSE_SEC, PLAYER_SIZE,
     rects_overlap_any, safe_normalize,
-    Bullet, Grenade, Explosion, Player, ArenaMap,
+    Bullet, BulletPool, Grenade, Explosion, Player, ArenaMap,
 )
 
 from leaderboard import LeaderboardScene
 from classic_features import AppleSystem, PortalPairSystem
 from hardcore_features import PoisonZoneSystem, MineSystem
 from chaos_features import BarrelSystem, BreakableFloorSystem, FogOfWarSystem
+from broadphase import UniformGrid
 
 import random
 
+def _rect_facing(x, y, w, h, fx):
+    """fx=1 面右: 從x往右畫；fx=-1 面左: 從x往左畫，但Rect寬度仍為正"""
+    if fx >= 0:
+        return pygame.Rect(x, y, w, h)
+    else:
+        return pygame.Rect(x - w, y, w, h)
+
+# 太空人 sprite 畫布：角色中心放在 (_HUMAN_CX, _HUMAN_CY)，要裝得下天線跟步槍
+_HUMAN_SIZE = (128, 96)
+_HUMAN_CX, _HUMAN_CY = 64, 48
+
 # =========================
 # Play Scene (main game)
 # =========================
 class PlayScene(Scene):
     def __init__(self, game: "Game") -> None:
         self.game = game
+        self._build_static()
+        self._build_round()
+
+    def _build_static(self) -> None:
+        # 整場都不會變的東西：字型、模式參數、畫面 Surface、各種快取（重開一局不用重建）
         self.font = pygame.font.SysFont("Arial", 18)
         self.big = pygame.font.SysFont("Arial", 48, bold=True)
 
@@ -39,11 +57,35 @@ class PlayScene(Scene):
         self.mode_grenade_cd = mode.grenade_cd
         self.mode_grenade_speed = mode.grenade_speed
 
-        self.win_timer = 0.0
         self.win_delay = 1.2  # 勝利畫面停 1.2 秒後進 leaderboard
 
         self.world_w = mode.world_w
         self.world_h = mode.world_h
+        self.arena = mode.arena   # 玩家 clamp 用（模式建立時就算好）
+
+        # 星空跟地圖無關（固定種子），整場共用
+        self._star_layer = self._build_star_layer()
+
+        # 視野遮罩只看模式，挖好洞的 overlay 跨局沿用
+        self.fog = FogOfWarSystem(radius=220, darkness=210, feather=24) if mode.key == "chaos" else None
+
+        # 場上物件清單：建一次，每局開始時原地清空
+        self.bullets: List[Bullet] = []
+        self.bullet_pool = BulletPool()   # 打掉的子彈放回來給下一發用
+        self.grenades: List[Grenade] = []
+        self.explosions: List[Explosion] = []
+        # 爆炸特效快取：半徑 / 透明度都是查表來的（每種半徑最多 64 組），畫好的整張直接重用
+        self._fx_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        # 玩家 sprite 快取：(顏色, 武器, 面向) -> (上層, 下層)
+        self._human_sprites: Dict[tuple, tuple] = {}
+        # 左右分割畫面：固定大小，建一次重複用（draw_world 一開始就會整張 fill）
+        self._left_view = pygame.Surface((WIDTH // 2, HEIGHT))
+        self._right_view = pygame.Surface((WIDTH // 2, HEIGHT))
+
+    def _build_round(self) -> None:
+        # 每一局要重來的：地圖、玩家、各模式系統、場上物件
+        self.win_timer = 0.0
+        self.winner: Optional[str] = None
 
         # map
         self.map = ArenaMap(
@@ -53,6 +95,8 @@ class PlayScene(Scene):
             world_h=self.world_h
         )
         self.map.generate()
+        # 場地外框 + 掩體圖層：地圖每局重生，所以跟著重畫一次，draw 只負責貼
+        self._world_layer = self._build_world_layer()
 
         # players
         p1_keys = dict(left=pygame.K_a, right=pygame.K_d, up=pygame.K_w, down=pygame.K_s)
@@ -76,23 +120,46 @@ class PlayScene(Scene):
         self.p1.sound = self.game.sound
         self.p2.sound = self.game.sound
 
+        # 遊戲中的動作鍵 → (玩家, 動作, 參數)：handle_event 查一次 dict 就好，不用一路比下去
+        self._key_actions = {
+            # P1 actions
+            pygame.K_f: (self.p1, "shoot", None),
+            pygame.K_r: (self.p1, "reload", None),
+            pygame.K_q: (self.p1, "grenade", None),
+            pygame.K_1: (self.p1, "weapon", 0),
+            pygame.K_2: (self.p1, "weapon", 1),
+            pygame.K_3: (self.p1, "weapon", 2),
+            # P2 actions
+            pygame.K_SLASH: (self.p2, "shoot", None),
+            pygame.K_RSHIFT: (self.p2, "reload", None),
+            pygame.K_RCTRL: (self.p2, "grenade", None),
+            pygame.K_KP1: (self.p2, "weapon", 0),
+            pygame.K_KP2: (self.p2, "weapon", 1),
+            pygame.K_KP3: (self.p2, "weapon", 2),
+        }
+
         # 產生出生區 avoid（避免桶/地板生成在出生點）
         spawn_left  = pygame.Rect(ARENA_MARGIN, self.world_h // 2 - 140, 260, 280)
         spawn_right = pygame.Rect(self.world_w - ARENA_MARGIN - 260, self.world_h // 2 - 140, 260, 280)
         avoid = [spawn_left, spawn_right]
 
+        # 全場共用的 broad phase：桶子/地板/蘋果/傳送門都登記在這（用 tag 分）
+        self.broadphase = UniformGrid(cell=128)
+        # 地圖 + 桶子 + 坑 的障礙物清單（有變才重組，見 update）
+        self._blockers: List[pygame.Rect] = []
+        self._blockers_key = None
 
         # ===== Chaos features =====
         self.barrels = None
         self.floor = None
-        self.fog = None
 
         if self.game.mode.key == "chaos":
             self.barrels = BarrelSystem(
                 world_w=self.world_w, world_h=self.world_h,
                 arena_margin=ARENA_MARGIN,
                 obstacles=self.map.obstacles,
-                barrel_count=6
+                barrel_count=6,
+                grid=self.broadphase,
             )
             self.barrels.spawn_initial(avoid_rects=avoid)
 
@@ -100,12 +167,11 @@ class PlayScene(Scene):
                 world_w=self.world_w, world_h=self.world_h,
                 arena_margin=ARENA_MARGIN,
                 obstacles=self.map.obstacles,
-                tile_count=10
+                tile_count=10,
+                grid=self.broadphase,
             )
             self.floor.spawn_initial(avoid_rects=avoid)
 
-            self.fog = FogOfWarSystem(radius=220, darkness=210, feather=24)
-
         # -------------------------
         # ✅ Hardcore features: Poison + Mines
         # -------------------------
@@ -130,6 +196,7 @@ class PlayScene(Scene):
                 min_size=(int(self.world_w * 0.40), int(self.world_h * 0.35)),
                 damage_per_sec=12.0,
             )
+            self.poison.register_players([self.p1, self.p2])
 
             self.mines = MineSystem(
                 world_w=self.world_w,
@@ -141,17 +208,20 @@ class PlayScene(Scene):
                 blast_radius=105,
                 max_damage=48,
                 min_damage=12,
+                grid=self.broadphase,
             )
             self.mines.spawn_initial(avoid_rects=avoid)
         # ===== Classic features: apples + portals =====
         self.apple_sys = None
         self.portal_sys = None
+        self._apple_avoid: List[pygame.Rect] = []
 
         if self.game.mode.key == "classic":
             # 避免生成在出生區附近
             spawn_left  = pygame.Rect(ARENA_MARGIN, self.world_h // 2 - 120, 220, 240)
             spawn_right = pygame.Rect(self.world_w - ARENA_MARGIN - 220, self.world_h // 2 - 120, 220, 240)
             avoid = [spawn_left, spawn_right]
+            self._apple_avoid = avoid   # update 補蘋果時也用同一組，不用每幀重建
 
             self.apple_sys = AppleSystem(
                 world_w=self.world_w, world_h=self.world_h, arena_margin=ARENA_MARGIN,
@@ -159,6 +229,7 @@ class PlayScene(Scene):
                 max_apples=3,
                 heal_amount=15,
                 spawn_cd_range=(6.0, 10.0),
+                grid=self.broadphase,
             )
 
             self.portal_sys = PortalPairSystem(
@@ -179,13 +250,15 @@ class PlayScene(Scene):
                 for w in pl.weapons:
                     w.reserve = 9999
 
-        self.bullets: List[Bullet] = []
-        self.grenades: List[Grenade] = []
-        self.explosions: List[Explosion] = []
-        self.winner: Optional[str] = None
+        # 上一局還在飛的子彈收回池子，清單原地清空（不重新配置）
+        for b in self.bullets:
+            self.bullet_pool.release(b)
+        self.bullets.clear()
+        self.grenades.clear()
+        self.explosions.clear()
 
     def reset_round(self) -> None:
-        self.__init__(self.game)
+        self._build_round()
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -198,32 +271,20 @@ class PlayScene(Scene):
                     self.reset_round()
                 return
 
-            # P1 actions
-            if event.key == pygame.K_f:
-                self.bullets.extend(self.p1.try_shoot(self.game.sound))
-            if event.key == pygame.K_r:
-                self.p1.try_reload(self.game.sound)
-            if event.key == pygame.K_q:
-                g = self.p1.try_throw_grenade(self.game.sound, self.mode_grenade_speed, self.mode_grenade_cd)
-                if g: self.grenades.append(g)
-            # P1 weapon switch (穩定寫法)
-            if event.key == pygame.K_1: self.p1.set_weapon(0)
-            elif event.key == pygame.K_2: self.p1.set_weapon(1)
-            elif event.key == pygame.K_3: self.p1.set_weapon(2)
+            action = self._key_actions.get(event.key)
+            if action is None:
+                return
 
-            # P2 actions
-            if event.key == pygame.K_SLASH:
-                self.bullets.extend(self.p2.try_shoot(self.game.sound))
-            if event.key == pygame.K_RSHIFT:
-                self.p2.try_reload(self.game.sound)
-            if event.key == pygame.K_RCTRL:
-                g = self.p2.try_throw_grenade(self.game.sound, self.mode_grenade_speed, self.mode_grenade_cd)
+            pl, kind, arg = action
+            if kind == "shoot":
+                self.bullets.extend(pl.try_shoot(self.game.sound, self.bullet_pool))
+            elif kind == "reload":
+                pl.try_reload(self.game.sound)
+            elif kind == "grenade":
+                g = pl.try_throw_grenade(self.game.sound, self.mode_grenade_speed, self.mode_grenade_cd)
                 if g: self.grenades.append(g)
-            if event.key in (pygame.K_KP1, pygame.K_KP2, pygame.K_KP3):
-                # keypad '1' is 257 typically, but pygame gives constants; map directly
-                if event.key == pygame.K_KP1: self.p2.set_weapon(0)
-                if event.key == pygame.K_KP2: self.p2.set_weapon(1)
-                if event.key == pygame.K_KP3: self.p2.set_weapon(2)
+            else:
+                pl.set_weapon(arg)
 
     def update(self, dt: float) -> None:
         # winner 出現後：停留一下，再去 leaderboard
@@ -256,42 +317,52 @@ class PlayScene(Scene):
         # =========================================
         # 1) 組合「障礙物清單」：地圖 + 桶子 + 坑(pit)
         # =========================================
-        base_obstacles = self.map.obstacles[:]  # 原本地圖掩體
-        if barrels:
-            base_obstacles += barrels.get_obstacles()   # 桶子也擋路
-        if floor:
-            base_obstacles += floor.get_blockers()      # pit 不能走 → 也當障礙物
+        # 地圖掩體不會動，桶子 / 坑只有爆掉、碎掉才會變：用 revision 判斷要不要重組
+        blockers_key = (barrels.revision if barrels else -1, floor.revision if floor else -1)
+        if blockers_key != self._blockers_key:
+            base_obstacles = self.map.obstacles[:]  # 原本地圖掩體
+            if barrels:
+                base_obstacles += barrels.get_obstacles()   # 桶子也擋路
+            if floor:
+                base_obstacles += floor.get_blockers()      # pit 不能走 → 也當障礙物
+            self._blockers = base_obstacles
+            self._blockers_key = blockers_key
+        base_obstacles = self._blockers
 
         # =========================================
         # 2) 玩家更新（泥地減速要先套用再更新）
         # =========================================
         for pl in (self.p1, self.p2):
-            slow = floor.speed_factor_for(pl.body_hitbox()) if floor else 1.0
+            slow = floor.speed_factor_for(pl.body_hitbox_ip()) if floor else 1.0
             old_speed = pl.speed
             pl.speed = old_speed * slow
 
             # ✅ 玩家碰撞用 base_obstacles（含桶子/坑）
-            pl.update(dt, keys, base_obstacles, self.world_w, self.world_h)
+            pl.update(dt, keys, base_obstacles, self.world_w, self.world_h, self.arena)
 
             pl.speed = old_speed  # update 完一定要還原
 
         # =========================================
         # 3) 模式系統 update
         # =========================================
+        # 之後各段都會用到的東西先拿成 local
+        p1, p2 = self.p1, self.p2
+        players = [p1, p2]
+        sound = self.game.sound
+        world_w, world_h = self.world_w, self.world_h
+
         # hardcore systems
         if poison:
-            poison.update(dt, [self.p1, self.p2])
+            poison.update(dt, players)
         if mines:
-            mines.update(dt, [self.p1, self.p2], sound=self.game.sound)
+            mines.update(dt, players, sound=sound)
 
         # classic systems
         if getattr(self, "apple_sys", None) is not None:
-            spawn_left  = pygame.Rect(ARENA_MARGIN, self.world_h // 2 - 120, 220, 240)
-            spawn_right = pygame.Rect(self.world_w - ARENA_MARGIN - 220, self.world_h // 2 - 120, 220, 240)
-            self.apple_sys.update(dt, [self.p1, self.p2], avoid_rects=[spawn_left, spawn_right], sound=self.game.sound)
+            self.apple_sys.update(dt, players, avoid_rects=self._apple_avoid, sound=sound)
 
         if getattr(self, "portal_sys", None) is not None:
-            self.portal_sys.update(dt, [self.p1, self.p2], sound=self.game.sound)
+            self.portal_sys.update(dt, players, sound=sound)
 
         # chaos systems（桶子的 fx 可能需要 update）
         if barrels:
@@ -300,64 +371,89 @@ class PlayScene(Scene):
         # =========================================
         # 4) bullets：要先判斷 floor / barrel，再判斷 obstacles
         # =========================================
-        for b in self.bullets[:]:
+        # 子彈 / 手榴彈判定期間玩家不會動：hitbox 每幀取一次就好
+        p1_hb = p1.body_hitbox()
+        p2_hb = p2.body_hitbox()
+
+        # 留下來的子彈收進新清單（不用複製整個 list 再 remove）
+        kept_bullets = []
+        release = self.bullet_pool.release
+        # 共用 grid 的候選 list 整幀重複用：每顆子彈清空再讓 query_into 依 tag 塞進來
+        tiles: List[object] = []
+        kegs: List[object] = []
+        candidates = {"tile": tiles, "barrel": kegs}
+        query_into = self.broadphase.query_into if (floor or barrels) else None
+        for b in self.bullets:
             b.update(dt)
 
             # remove out of arena
-            if (b.rect.right < 0 or b.rect.left > self.world_w or
-                b.rect.bottom < 0 or b.rect.top > self.world_h):
-                self.bullets.remove(b)
+            if (b.rect.right < 0 or b.rect.left > world_w or
+                b.rect.bottom < 0 or b.rect.top > world_h):
+                release(b)
                 continue
 
+            # 共用 grid 查一次，再依 tag 分給各系統
+            if query_into is not None:
+                tiles.clear()
+                kegs.clear()
+                query_into(b.rect, candidates)
+
             # (A) 打碎地板
-            # (A) 打碎地板
-            if floor and floor.handle_bullet_hit(b.rect, sound=self.game.sound):
-                self.bullets.remove(b)
+            if tiles and floor.handle_bullet_hit(b.rect, sound=sound, candidates=tiles):
+                release(b)
                 continue
 
             # (B) 打到爆炸桶
-            if barrels and barrels.handle_bullet_hit(b.rect, [self.p1, self.p2]):
-                self.bullets.remove(b)
-                self.game.sound.play("bomb", volume=0.35)
+            if kegs and barrels.handle_bullet_hit(b.rect, players, candidates=kegs):
+                sound.play("bomb", volume=0.35)
+                release(b)
                 continue
 
             # (C) obstacle hit（用 base_obstacles，不要只用 map.obstacles）
             if rects_overlap_any(b.rect, base_obstacles):
-                self.bullets.remove(b)
+                release(b)
                 continue
 
             # (D) player hit (no friendly-fire)
-            if b.owner_id == 1 and b.rect.colliderect(self.p2.body_hitbox()):
-                self.p2.take_damage(b.damage)
-                self.bullets.remove(b)
-                self.game.sound.play("hit", volume=0.25)
+            if b.owner_id == 1 and b.rect.colliderect(p2_hb):
+                p2.take_damage(b.damage)
+                sound.play("hit", volume=0.25)
+                release(b)
                 continue
 
-            if b.owner_id == 2 and b.rect.colliderect(self.p1.body_hitbox()):
-                self.p1.take_damage(b.damage)
-                self.bullets.remove(b)
-                self.game.sound.play("hit", volume=0.25)
+            if b.owner_id == 2 and b.rect.colliderect(p1_hb):
+                p1.take_damage(b.damage)
+                sound.play("hit", volume=0.25)
+                release(b)
                 continue
 
+            kept_bullets.append(b)
+
+        self.bullets = kept_bullets
+
         # =========================================
         # 5) grenades：也用 base_obstacles（含桶子/坑）
         # =========================================
-        for g in self.grenades[:]:
-            g.update(dt, base_obstacles, self.world_w, self.world_h)
+        kept_grenades = []
+        for g in self.grenades:
+            g.update(dt, base_obstacles, world_w, world_h)
 
             grenade_rect = pygame.Rect(int(g.pos.x - 7), int(g.pos.y - 7), 14, 14)
 
-            hit_p1 = (g.owner_id != 1 and grenade_rect.colliderect(self.p1.body_hitbox()))
-            hit_p2 = (g.owner_id != 2 and grenade_rect.colliderect(self.p2.body_hitbox()))
+            hit_p1 = (g.owner_id != 1 and grenade_rect.colliderect(p1_hb))
+            hit_p2 = (g.owner_id != 2 and grenade_rect.colliderect(p2_hb))
 
             if hit_p1 or hit_p2:
                 self._explode(g)
-                self.grenades.remove(g)
                 continue
 
             if g.fuse <= 0:
                 self._explode(g)
-                self.grenades.remove(g)
+                continue
+
+            kept_grenades.append(g)
+
+        self.grenades = kept_grenades
 
         # =========================================
         # 6) winner 判定
@@ -374,10 +470,13 @@ class PlayScene(Scene):
         # =========================================
         # 7) explosions
         # =========================================
-        for e in self.explosions[:]:
+        # 更新跟過期判定一起做，只走一趟
+        kept_explosions = []
+        for e in self.explosions:
             e.update(dt)
-            if e.done():
-                self.explosions.remove(e)
+            if not e.done():
+                kept_explosions.append(e)
+        self.explosions = kept_explosions
 
     def _explode(self, g: Grenade) -> None:
         self.game.sound.play("bomb", volume=0.35)
@@ -387,14 +486,19 @@ class PlayScene(Scene):
             Explosion(pos=pygame.Vector2(g.pos), max_radius=self.mode_grenade_radius, duration=0.35)
         )
 
-        # 範圍傷害：距離越近傷害越高
+        # 範圍傷害：距離越近傷害越高（純數字算距離，不另外建 Vector2）
+        gx, gy = g.pos.x, g.pos.y
+        radius = self.mode_grenade_radius
+
         def apply(player: Player):
-            d = (player.pos - g.pos).length()
-            if d > self.mode_grenade_radius:
+            dx = player.pos.x - gx
+            dy = player.pos.y - gy
+            d2 = dx * dx + dy * dy
+            if d2 > radius * radius:
                 return
 
             # 最高 35，最低 8（在邊緣）
-            t = 1.0 - (d / self.mode_grenade_radius)
+            t = 1.0 - (math.sqrt(d2) / radius)
             dmg = int(8 + 27 * t)
             player.take_damage(dmg)
 
@@ -407,6 +511,222 @@ class PlayScene(Scene):
         if self.barrels:
             self.barrels.explode_at(g.pos, [self.p1, self.p2])  # 爆炸可以引爆附近桶
 
+    def _build_star_layer(self) -> pygame.Surface:
+        # 星空：固定 40 顆、固定種子（用自己的 Random，不去動全域 random）
+        view_w, view_h = WIDTH // 2, HEIGHT
+        layer = pygame.Surface((view_w, view_h), pygame.SRCALPHA)
+        rng = random.Random(42)
+        for _ in range(40):
+            rx, ry = rng.randint(0, view_w), rng.randint(0, view_h)
+            pygame.draw.circle(layer, (150, 150, 200), (rx, ry), 1)
+        return layer
+
+    def _build_world_layer(self) -> pygame.Surface:
+        # 場地外框 + 地圖掩體：開局後就不會變，用世界座標畫一次（透明底，下面的網格/星空照樣看得到）
+        layer = pygame.Surface((self.world_w, self.world_h), pygame.SRCALPHA)
+
+        # arena border
+        arena_rect = pygame.Rect(
+            ARENA_MARGIN, ARENA_MARGIN,
+            self.world_w - 2 * ARENA_MARGIN,
+            self.world_h - 2 * ARENA_MARGIN
+        )
+
+        pygame.draw.rect(
+            layer,
+            (70, 70, 85),
+            arena_rect,
+            width=2,
+            border_radius=14,
+        )
+
+        # obstacles (磚塊風格)
+        for r in self.map.obstacles:
+            # 1. 畫出障礙物底色（磚縫/水泥的顏色）
+            grout_color = (40, 40, 45) # 深灰色磚縫
+            pygame.draw.rect(layer, grout_color, r, border_radius=4)
+
+            # 2. 定義磚塊大小
+            brick_w = 20  # 磚塊寬度
+            brick_h = 10  # 磚塊高度
+
+            # 3. 遍歷矩形區域畫出每一塊小磚頭
+            for row_y in range(r.top, r.bottom, brick_h):
+                # 計算這一行是否需要偏移（交錯排列效果）
+                # 使用 row_y 相對於 r.top 的索引來判斷奇偶行
+                is_offset = ((row_y - r.top) // brick_h) % 2 == 1
+                start_x = r.left - (brick_w // 2 if is_offset else 0)
+
+                for col_x in range(start_x, r.right, brick_w):
+                    # 計算單個磚塊的矩形
+                    b_rect = pygame.Rect(col_x + 1, row_y + 1, brick_w - 2, brick_h - 2)
+
+                    # 確保磚塊不超出障礙物邊界
+                    clipped_rect = b_rect.clip(r)
+
+                    if clipped_rect.width > 0 and clipped_rect.height > 0:
+                        # 磚塊主色 (根據原本的 OBSTACLE_COLOR 做一點隨機或明暗變化)
+                        pygame.draw.rect(layer, OBSTACLE_COLOR, clipped_rect, border_radius=2)
+
+                        # 加上磚塊的高光（左上角），增加立體感
+                        highlight_col = (min(255, OBSTACLE_COLOR[0]+30),
+                                         min(255, OBSTACLE_COLOR[1]+30),
+                                         min(255, OBSTACLE_COLOR[2]+30))
+                        pygame.draw.line(layer, highlight_col,
+                                         clipped_rect.topleft, (clipped_rect.right, clipped_rect.top), 1)
+                        pygame.draw.line(layer, highlight_col,
+                                         clipped_rect.topleft, (clipped_rect.left, clipped_rect.bottom), 1)
+
+            # 4. 最後加上一層外框，讓整體更紮實
+            pygame.draw.rect(layer, (20, 20, 25), r, width=2, border_radius=4)
+        return layer
+
+    def _build_explosion_fx(self, r: int, a: int) -> pygame.Surface:
+        size = max(2, r * 2 + 8)
+        sfx = pygame.Surface((size, size), pygame.SRCALPHA)
+
+        cx = size // 2
+        cy = size // 2
+
+        # ✅ 讓外圈線寬跟半徑走：半徑小就不要畫空心圈（會像 V）
+        if r <= 4:
+            # 半徑太小：直接畫實心比較漂亮
+            pygame.draw.circle(sfx, (255, 230, 120, a), (cx, cy), r)
+        else:
+            thick = 2 if r < 14 else 3  # 你也可以再調整
+            pygame.draw.circle(sfx, (255, 230, 120, a), (cx, cy), r, thick)
+
+        # 內核亮點
+        core_r = max(2, int(r * 0.35))
+        pygame.draw.circle(sfx, (255, 200, 80, min(255, a + 40)), (cx, cy), core_r)
+        return sfx
+
+    def _human_layers(self, color, wpn: str, fx: int):
+        """太空人 sprite（上層：背包/身體/頭/面罩；下層：手/武器），依 (顏色, 武器, 面向) 快取"""
+        key = (color, wpn, fx)
+        layers = self._human_sprites.get(key)
+        if layers is not None:
+            return layers
+
+        upper = pygame.Surface(_HUMAN_SIZE, pygame.SRCALPHA)
+        lower = pygame.Surface(_HUMAN_SIZE, pygame.SRCALPHA)
+        cx, cy = _HUMAN_CX, _HUMAN_CY
+
+        # === [修改] 顏色定義：讓 P1/P2 有區別 ===
+        armor_col = (240, 240, 245)
+
+        visor_col = (max(0, color[0]-60), max(0, color[1]-60), max(0, color[2]-60))
+
+        outline = (30, 30, 40)
+        detail_col = (180, 185, 200)
+        body_h, body_w = 26, 22
+        head_r = 12
+
+        # 1. 背包與天線 (背包顏色改用玩家色 [新增])
+        tank_rect = _rect_facing(cx - fx * 13, cy - 8, 10, 22, fx)
+        pygame.draw.rect(upper, color, tank_rect, border_radius=3)
+        pygame.draw.rect(upper, outline, tank_rect, width=2, border_radius=3)
+        ant_x = cx - fx * 10
+        pygame.draw.line(upper, outline, (ant_x, cy - 5), (ant_x, cy - 35), 2)
+
+        # 2. 身體 (不變)
+        body_rect = pygame.Rect(cx - body_w//2, cy - body_h//2, body_w, body_h)
+        pygame.draw.rect(upper, armor_col, body_rect, border_radius=6)
+        pygame.draw.rect(upper, outline, body_rect, width=2, border_radius=6)
+        panel_rect = _rect_facing(cx - fx * 4, cy - 2, 8, 6, fx)
+        pygame.draw.rect(upper, detail_col, panel_rect, border_radius=2)
+
+        # 3. 頭部與面罩 (不變)
+        head_pos = (cx, cy - body_h//2 - 6)
+        pygame.draw.circle(upper, armor_col, head_pos, head_r)
+        pygame.draw.circle(upper, outline, head_pos, head_r, 2)
+        v_w, v_h = 14, 10
+        visor_rect = _rect_facing(cx + fx * 1, head_pos[1] - v_h//2, v_w, v_h, fx)
+        pygame.draw.rect(upper, visor_col, visor_rect, border_radius=5)
+        # === [修改] 將反光點改為可愛哭哭臉 ===
+        # 哭哭眼睛 (兩條向下斜的線 \ / )
+        eye_y = visor_rect.centery - 2
+        # 左眼
+        pygame.draw.line(upper, (255, 255, 255), 
+                         (visor_rect.centerx - 3, eye_y - 1), 
+                         (visor_rect.centerx - 1, eye_y + 1), 1)
+        # 右眼
+        pygame.draw.line(upper, (255, 255, 255), 
+                         (visor_rect.centerx + 1, eye_y + 1), 
+                         (visor_rect.centerx + 3, eye_y - 1), 1)
+
+        # 委屈的小嘴巴 (一個扁平的 v)
+        mouth_y = visor_rect.centery + 2
+        pygame.draw.line(upper, (255, 255, 255), 
+                         (visor_rect.centerx - 1, mouth_y), 
+                         (visor_rect.centerx, mouth_y + 1), 1)
+        pygame.draw.line(upper, (255, 255, 255), 
+                         (visor_rect.centerx, mouth_y + 1), 
+                         (visor_rect.centerx + 1, mouth_y), 1)
+
+        # === [修改後] 4. 手與武器 ===
+        shoulder_y = cy - body_h//2 + 8
+        # gx, gy 是槍的起點，也是手的末端
+        gx = cx + (fx * (body_w//2 + 10))
+        gy = shoulder_y + 2
+
+        # --- 新增：畫手臂 (連結身體肩膀與槍枝) ---
+        # 這樣手才會出現！使用粗線條模擬像素手臂
+        pygame.draw.line(lower, armor_col, (cx, shoulder_y), (gx, gy), 6)
+        pygame.draw.line(lower, outline, (cx, shoulder_y), (gx, gy), 2)
+
+        g_col, g_out = (30, 30, 35), (220, 220, 235)
+        # 定義未來感配色
+        g_col = (40, 42, 50)      # 深灰色槍身
+        g_out = (80, 85, 100)     # 槍身輪廓
+        glow_col = (0, 255, 255)  # 未來感青色發光條 (能量源)
+
+        if wpn == "Pistol":
+            # --- 未來能量手槍：短小但有厚重的能量核心 ---
+            # 主槍身
+            gr = pygame.Rect(gx if fx > 0 else gx - 16, gy - 4, 16, 8)
+            pygame.draw.rect(lower, g_col, gr, border_radius=2)
+            pygame.draw.rect(lower, g_out, gr, 1, border_radius=2)
+            # 能量發光槽 (側邊的一條細線)
+            gl = pygame.Rect(gx + (fx*4) if fx > 0 else gx - 12, gy - 1, 8, 2)
+            pygame.draw.rect(lower, glow_col, gl)
+
+        elif wpn == "Rifle":
+            # --- 未來電磁步槍：長管、分段式設計 ---
+            # 前段槍管 (較細)
+            bar = pygame.Rect(gx if fx > 0 else gx - 30, gy - 2, 30, 4)
+            # 後段槍機 (較厚)
+            body = pygame.Rect(gx if fx > 0 else gx - 12, gy - 5, 12, 9)
+            # 槍托 (斜向或梯形感)
+            st = pygame.Rect((gx - fx * 8) if fx > 0 else (gx - fx * 8 - 10), gy - 3, 10, 10)
+
+            pygame.draw.rect(lower, g_col, bar); pygame.draw.rect(lower, g_col, body)
+            pygame.draw.rect(lower, g_col, st, border_bottom_left_radius=4)
+            # 貫穿槍身的電磁發光線
+            line_x = gx if fx > 0 else gx - 28
+            pygame.draw.line(lower, glow_col, (line_x, gy), (line_x + (fx*25 if fx > 0 else 25), gy), 1)
+            # 輪廓
+            pygame.draw.rect(lower, g_out, bar, 1); pygame.draw.rect(lower, g_out, body, 1)
+
+        elif wpn == "Shotgun":
+            # --- 未來重型霰彈槍：寬大槍口、帶有散熱片感 ---
+            # 厚重的槍身
+            bar = pygame.Rect(gx if fx > 0 else gx - 24, gy - 5, 24, 10)
+            # 槍口加寬處理 (散熱器)
+            muz = pygame.Rect((gx + fx * 16) if fx > 0 else (gx + fx * 16 - 8), gy - 7, 8, 14)
+
+            pygame.draw.rect(lower, g_col, bar, border_radius=1)
+            pygame.draw.rect(lower, (50, 55, 70), muz) # 槍口用不同深灰色
+            # 側面三個能量指示燈 (點點)
+            for i in range(3):
+                dot_x = gx + fx*(4 + i*4) if fx > 0 else gx - (6 + i*4)
+                pygame.draw.circle(lower, glow_col, (dot_x, gy), 1)
+            # 輪廓
+            pygame.draw.rect(lower, g_out, bar, 1); pygame.draw.rect(lower, g_out, muz, 1)
+
+        layers = self._human_sprites[key] = (upper, lower)
+        return layers
+
     def _draw_hp_bar(self, screen, x, y, w, h, hp, max_hp, color, label, title="PLAYER", align_right=False):
 
         # === [核心修改] 如果靠右，重新計算整個血條的 X 座標 ===
@@ -474,21 +794,19 @@ class PlayScene(Scene):
         VIEW_W = WIDTH // 2
         VIEW_H = HEIGHT
 
-        def clamp(v, a, b):
-            return max(a, min(b, v))
+        # 鏡頭可移動範圍：每幀只算一次，camera_offset 直接 min/max
+        cam_max_x = self.world_w - VIEW_W
+        cam_max_y = self.world_h - VIEW_H
 
         def camera_offset(center: pygame.Vector2) -> pygame.Vector2:
-            off_x = center.x - VIEW_W / 2
-            off_y = center.y - VIEW_H / 2
-            off_x = clamp(off_x, 0, self.world_w - VIEW_W)
-            off_y = clamp(off_y, 0, self.world_h - VIEW_H)
+            off_x = max(0, min(cam_max_x, center.x - VIEW_W / 2))
+            off_y = max(0, min(cam_max_y, center.y - VIEW_H / 2))
             return pygame.Vector2(off_x, off_y)
 
         def draw_world(view_surf: pygame.Surface, cam_off: pygame.Vector2, focus_player) -> None:
             # --- 1. 背景層 (深藍底色 + 呼吸燈網格 + 星空) ---
             view_surf.fill((15, 15, 25))
             
-            import math, random
             glow = math.sin(pygame.time.get_ticks() * 0.005) * 25
             g_val = max(0, min(255, 50 + glow))
             grid_color = (g_val, g_val, g_val + 20)
@@ -501,11 +819,7 @@ class PlayScene(Scene):
             for gy in range(start_y, VIEW_H, grid_size):
                 pygame.draw.line(view_surf, grid_color, (0, gy), (VIEW_W, gy), 1)
 
-            random.seed(42)
-            for _ in range(40):
-                rx, ry = random.randint(0, VIEW_W), random.randint(0, VIEW_H)
-                pygame.draw.circle(view_surf, (150, 150, 200), (rx, ry), 1)
-            random.seed()
+            view_surf.blit(self._star_layer, (0, 0))
             #==========
             def shift_rect(r: pygame.Rect) -> pygame.Rect:
                 return r.move(-int(cam_off.x), -int(cam_off.y))
@@ -513,146 +827,41 @@ class PlayScene(Scene):
             def shift_pos(p: pygame.Vector2):
                 return (int(p.x - cam_off.x), int(p.y - cam_off.y))
             
-            def rect_facing(x, y, w, h, fx):
-                    """fx=1 面右: 從x往右畫；fx=-1 面左: 從x往左畫，但Rect寬度仍為正"""
-                    if fx >= 0:
-                        return pygame.Rect(x, y, w, h)
-                    else:
-                        return pygame.Rect(x - w, y, w, h)
-
             def draw_human(pl: Player):
                 cx, cy = shift_pos(pl.pos)
                 fx = 1 if pl.facing.x >= 0 else -1
-                
-                # === [修改] 顏色定義：讓 P1/P2 有區別 ===
+
+                # 不會動的部分（背包/身體/頭/面罩 + 手/武器）是快取好的兩層 sprite：
+                # 眼淚要夾在兩層中間、腳每幀擺動，這兩樣照舊直接畫
+                upper, lower = self._human_layers(pl.color, pl.weapon.name, fx)
+                ox, oy = cx - _HUMAN_CX, cy - _HUMAN_CY
+                view_surf.blit(upper, (ox, oy))
+
                 armor_col = (240, 240, 245)
-                
-                visor_col = (max(0, pl.color[0]-60), max(0, pl.color[1]-60), max(0, pl.color[2]-60))
-                
                 outline = (30, 30, 40)
-                detail_col = (180, 185, 200)
-                body_h, body_w = 26, 22
-                head_r, leg_len = 12, 14
-
-                # 1. 背包與天線 (背包顏色改用玩家色 [新增])
-                tank_rect = rect_facing(cx - fx * 13, cy - 8, 10, 22, fx)
-                pygame.draw.rect(view_surf, pl.color, tank_rect, border_radius=3)
-                pygame.draw.rect(view_surf, outline, tank_rect, width=2, border_radius=3)
-                ant_x = cx - fx * 10
-                pygame.draw.line(view_surf, outline, (ant_x, cy - 5), (ant_x, cy - 35), 2)
-
-                # 2. 身體 (不變)
-                body_rect = pygame.Rect(cx - body_w//2, cy - body_h//2, body_w, body_h)
-                pygame.draw.rect(view_surf, armor_col, body_rect, border_radius=6)
-                pygame.draw.rect(view_surf, outline, body_rect, width=2, border_radius=6)
-                panel_rect = rect_facing(cx - fx * 4, cy - 2, 8, 6, fx)
-                pygame.draw.rect(view_surf, detail_col, panel_rect, border_radius=2)
-
-                # 3. 頭部與面罩 (不變)
-                head_pos = (cx, cy - body_h//2 - 6)
-                pygame.draw.circle(view_surf, armor_col, head_pos, head_r)
-                pygame.draw.circle(view_surf, outline, head_pos, head_r, 2)
-                v_w, v_h = 14, 10
-                visor_rect = rect_facing(cx + fx * 1, head_pos[1] - v_h//2, v_w, v_h, fx)
-                pygame.draw.rect(view_surf, visor_col, visor_rect, border_radius=5)
-                # === [修改] 將反光點改為可愛哭哭臉 ===
-                # 哭哭眼睛 (兩條向下斜的線 \ / )
-                eye_y = visor_rect.centery - 2
-                # 左眼
-                pygame.draw.line(view_surf, (255, 255, 255), 
-                                 (visor_rect.centerx - 3, eye_y - 1), 
-                                 (visor_rect.centerx - 1, eye_y + 1), 1)
-                # 右眼
-                pygame.draw.line(view_surf, (255, 255, 255), 
-                                 (visor_rect.centerx + 1, eye_y + 1), 
-                                 (visor_rect.centerx + 3, eye_y - 1), 1)
-                
-                # 委屈的小嘴巴 (一個扁平的 v)
-                mouth_y = visor_rect.centery + 2
-                pygame.draw.line(view_surf, (255, 255, 255), 
-                                 (visor_rect.centerx - 1, mouth_y), 
-                                 (visor_rect.centerx, mouth_y + 1), 1)
-                pygame.draw.line(view_surf, (255, 255, 255), 
-                                 (visor_rect.centerx, mouth_y + 1), 
-                                 (visor_rect.centerx + 1, mouth_y), 1)
+                body_h = 26
+                leg_len = 14
+                # 面罩中心 / 眼睛高度（跟 sprite 裡 visor_rect 的位置一樣）
+                vcx = cx + fx * 8
+                eye_y = cy - body_h//2 - 6 - 2
+
                 # 3. [新增] 血量低於 30% 時，眼淚流到地板 (不變紅)
                 if pl.hp / pl.max_hp < 0.3:
                     tear_col = (150, 220, 255) # 淺藍色淚水
                     floor_y = cy + 20          # 淚水流到的地板高度
                     
                     # 左眼淚痕 (從眼睛位置一直畫到地板)
-                    pygame.draw.line(view_surf, tear_col, (visor_rect.centerx - 3, eye_y + 1), (visor_rect.centerx - 3, floor_y), 1)
+                    pygame.draw.line(view_surf, tear_col, (vcx - 3, eye_y + 1), (vcx - 3, floor_y), 1)
                     # 右眼淚痕 (從眼睛位置一直畫到地板)
-                    pygame.draw.line(view_surf, tear_col, (visor_rect.centerx + 3, eye_y + 1), (visor_rect.centerx + 3, floor_y), 1)
+                    pygame.draw.line(view_surf, tear_col, (vcx + 3, eye_y + 1), (vcx + 3, floor_y), 1)
                     
                     # 在地板處畫兩個小水窪
-                    pygame.draw.ellipse(view_surf, tear_col, (visor_rect.centerx - 5, floor_y - 1, 4, 2))
-                    pygame.draw.ellipse(view_surf, tear_col, (visor_rect.centerx + 1, floor_y - 1, 4, 2))
-                
+                    pygame.draw.ellipse(view_surf, tear_col, (vcx - 5, floor_y - 1, 4, 2))
+                    pygame.draw.ellipse(view_surf, tear_col, (vcx + 1, floor_y - 1, 4, 2))
 
-                # === [修改後] 4. 手與武器 ===
-                shoulder_y = cy - body_h//2 + 8
-                # gx, gy 是槍的起點，也是手的末端
-                gx = cx + (fx * (body_w//2 + 10))
-                gy = shoulder_y + 2
-                
-                # --- 新增：畫手臂 (連結身體肩膀與槍枝) ---
-                # 這樣手才會出現！使用粗線條模擬像素手臂
-                pygame.draw.line(view_surf, armor_col, (cx, shoulder_y), (gx, gy), 6)
-                pygame.draw.line(view_surf, outline, (cx, shoulder_y), (gx, gy), 2)
-
-                wpn = pl.weapon.name
-                g_col, g_out = (30, 30, 35), (220, 220, 235)
-            # 定義未來感配色
-                g_col = (40, 42, 50)      # 深灰色槍身
-                g_out = (80, 85, 100)     # 槍身輪廓
-                glow_col = (0, 255, 255)  # 未來感青色發光條 (能量源)
-
-                if wpn == "Pistol":
-                    # --- 未來能量手槍：短小但有厚重的能量核心 ---
-                    # 主槍身
-                    gr = pygame.Rect(gx if fx > 0 else gx - 16, gy - 4, 16, 8)
-                    pygame.draw.rect(view_surf, g_col, gr, border_radius=2)
-                    pygame.draw.rect(view_surf, g_out, gr, 1, border_radius=2)
-                    # 能量發光槽 (側邊的一條細線)
-                    gl = pygame.Rect(gx + (fx*4) if fx > 0 else gx - 12, gy - 1, 8, 2)
-                    pygame.draw.rect(view_surf, glow_col, gl)
-
-                elif wpn == "Rifle":
-                    # --- 未來電磁步槍：長管、分段式設計 ---
-                    # 前段槍管 (較細)
-                    bar = pygame.Rect(gx if fx > 0 else gx - 30, gy - 2, 30, 4)
-                    # 後段槍機 (較厚)
-                    body = pygame.Rect(gx if fx > 0 else gx - 12, gy - 5, 12, 9)
-                    # 槍托 (斜向或梯形感)
-                    st = pygame.Rect((gx - fx * 8) if fx > 0 else (gx - fx * 8 - 10), gy - 3, 10, 10)
-                    
-                    pygame.draw.rect(view_surf, g_col, bar); pygame.draw.rect(view_surf, g_col, body)
-                    pygame.draw.rect(view_surf, g_col, st, border_bottom_left_radius=4)
-                    # 貫穿槍身的電磁發光線
-                    line_x = gx if fx > 0 else gx - 28
-                    pygame.draw.line(view_surf, glow_col, (line_x, gy), (line_x + (fx*25 if fx > 0 else 25), gy), 1)
-                    # 輪廓
-                    pygame.draw.rect(view_surf, g_out, bar, 1); pygame.draw.rect(view_surf, g_out, body, 1)
-
-                elif wpn == "Shotgun":
-                    # --- 未來重型霰彈槍：寬大槍口、帶有散熱片感 ---
-                    # 厚重的槍身
-                    bar = pygame.Rect(gx if fx > 0 else gx - 24, gy - 5, 24, 10)
-                    # 槍口加寬處理 (散熱器)
-                    muz = pygame.Rect((gx + fx * 16) if fx > 0 else (gx + fx * 16 - 8), gy - 7, 8, 14)
-                    
-                    pygame.draw.rect(view_surf, g_col, bar, border_radius=1)
-                    pygame.draw.rect(view_surf, (50, 55, 70), muz) # 槍口用不同深灰色
-                    # 側面三個能量指示燈 (點點)
-                    for i in range(3):
-                        dot_x = gx + fx*(4 + i*4) if fx > 0 else gx - (6 + i*4)
-                        pygame.draw.circle(view_surf, glow_col, (dot_x, gy), 1)
-                    # 輪廓
-                    pygame.draw.rect(view_surf, g_out, bar, 1); pygame.draw.rect(view_surf, g_out, muz, 1)
+                view_surf.blit(lower, (ox, oy))
 
                 # === [修改] 5. 腳部：加入走路擺動動畫 [新增] ===
-                import math
                 # 使用 pygame.time.get_ticks() 根據時間產生波動
                 # 只有在速度不為 0 時才擺動 (或簡單點讓它一直動也行)
                 walk_swing = math.sin(pygame.time.get_ticks() * 0.015) * 6
@@ -665,63 +874,10 @@ class PlayScene(Scene):
                 pygame.draw.line(view_surf, armor_col, (cx + 7, hip_y), (cx + 9, hip_y + leg_len - walk_swing), 8)
                 pygame.draw.line(view_surf, outline, (cx + 7, hip_y), (cx + 9, hip_y + leg_len - walk_swing), 2)
 
-            # arena border
-            arena_rect = pygame.Rect(
-                ARENA_MARGIN, ARENA_MARGIN,
-                self.world_w - 2 * ARENA_MARGIN,
-                self.world_h - 2 * ARENA_MARGIN
-            )
+            # arena border + obstacles：開局就畫好在整張世界圖層上，這裡只貼鏡頭看得到的那塊
+            view_surf.blit(self._world_layer, (0, 0),
+                           area=pygame.Rect(int(cam_off.x), int(cam_off.y), VIEW_W, VIEW_H))
 
-            pygame.draw.rect(
-                view_surf,
-                (70, 70, 85),
-                shift_rect(arena_rect),
-                width=2,
-                border_radius=14,
-            )
-
-            # obstacles (磚塊風格)
-            for o in self.map.obstacles:
-                r = shift_rect(o)
-                
-                # 1. 畫出障礙物底色（磚縫/水泥的顏色）
-                grout_color = (40, 40, 45) # 深灰色磚縫
-                pygame.draw.rect(view_surf, grout_color, r, border_radius=4)
-                
-                # 2. 定義磚塊大小
-                brick_w = 20  # 磚塊寬度
-                brick_h = 10  # 磚塊高度
-                
-                # 3. 遍歷矩形區域畫出每一塊小磚頭
-                for row_y in range(r.top, r.bottom, brick_h):
-                    # 計算這一行是否需要偏移（交錯排列效果）
-                    # 使用 row_y 相對於 r.top 的索引來判斷奇偶行
-                    is_offset = ((row_y - r.top) // brick_h) % 2 == 1
-                    start_x = r.left - (brick_w // 2 if is_offset else 0)
-                    
-                    for col_x in range(start_x, r.right, brick_w):
-                        # 計算單個磚塊的矩形
-                        b_rect = pygame.Rect(col_x + 1, row_y + 1, brick_w - 2, brick_h - 2)
-                        
-                        # 確保磚塊不超出障礙物邊界
-                        clipped_rect = b_rect.clip(r)
-                        
-                        if clipped_rect.width > 0 and clipped_rect.height > 0:
-                            # 磚塊主色 (根據原本的 OBSTACLE_COLOR 做一點隨機或明暗變化)
-                            pygame.draw.rect(view_surf, OBSTACLE_COLOR, clipped_rect, border_radius=2)
-                            
-                            # 加上磚塊的高光（左上角），增加立體感
-                            highlight_col = (min(255, OBSTACLE_COLOR[0]+30), 
-                                             min(255, OBSTACLE_COLOR[1]+30), 
-                                             min(255, OBSTACLE_COLOR[2]+30))
-                            pygame.draw.line(view_surf, highlight_col, 
-                                             clipped_rect.topleft, (clipped_rect.right, clipped_rect.top), 1)
-                            pygame.draw.line(view_surf, highlight_col, 
-                                             clipped_rect.topleft, (clipped_rect.left, clipped_rect.bottom), 1)
-
-                # 4. 最後加上一層外框，讓整體更紮實
-                pygame.draw.rect(view_surf, (20, 20, 25), r, width=2, border_radius=4)
-            
             # grenades (more realistic)
             for g in self.grenades:
                 x, y = shift_pos(g.pos)
@@ -776,22 +932,9 @@ class PlayScene(Scene):
                 size = max(2, r * 2 + 8)
                 fx = ex - size // 2
                 fy = ey - size // 2
-                sfx = pygame.Surface((size, size), pygame.SRCALPHA)
-
-                cx = size // 2
-                cy = size // 2
-
-                # ✅ 讓外圈線寬跟半徑走：半徑小就不要畫空心圈（會像 V）
-                if r <= 4:
-                    # 半徑太小：直接畫實心比較漂亮
-                    pygame.draw.circle(sfx, (255, 230, 120, a), (cx, cy), r)
-                else:
-                    thick = 2 if r < 14 else 3  # 你也可以再調整
-                    pygame.draw.circle(sfx, (255, 230, 120, a), (cx, cy), r, thick)
-
-                # 內核亮點
-                core_r = max(2, int(r * 0.35))
-                pygame.draw.circle(sfx, (255, 200, 80, min(255, a + 40)), (cx, cy), core_r)
+                sfx = self._fx_cache.get((r, a))
+                if sfx is None:
+                    sfx = self._fx_cache[(r, a)] = self._build_explosion_fx(r, a)
 
                 view_surf.blit(sfx, (fx, fy))
 
@@ -830,12 +973,16 @@ class PlayScene(Scene):
             if self.fog:
                 fx, fy = shift_pos(focus_player.pos)
                 self.fog.apply(view_surf, (fx, fy))
-        left_view = pygame.Surface((VIEW_W, VIEW_H))
-        right_view = pygame.Surface((VIEW_W, VIEW_H))
+        left_view = self._left_view
+        right_view = self._right_view
         cam1 = camera_offset(self.p1.pos)
         cam2 = camera_offset(self.p2.pos)
         draw_world(left_view, cam1, self.p1)
-        draw_world(right_view, cam2, self.p2)
+        if cam1 == cam2 and not self.fog:
+            # 兩個鏡頭一樣（兩人疊在一起 / 都卡在同一個邊角）又沒有各自的視野遮罩：畫一次，右邊直接複製
+            right_view.blit(left_view, (0, 0))
+        else:
+            draw_world(right_view, cam2, self.p2)
         # 把左右畫面貼到主螢幕
         screen.fill(BG_COLOR)
         screen.blit(left_view, (0, 0))
@@ -0,0 +1,117 @@
+# tests/test_broadphase.py
+import unittest
+
+import pygame
+
+from broadphase import UniformGrid
+
+
+class Thing:
+    # dataclass 的 == 是比欄位；grid 要靠 id 分辨，這裡故意讓兩個物件「相等」
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Thing)
+
+    __hash__ = object.__hash__
+
+
+class UniformGridTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.grid = UniformGrid(cell=100)
+
+    def test_insert_and_query_by_tag(self) -> None:
+        a, b = Thing(), Thing()
+        self.grid.insert(a, pygame.Rect(10, 10, 20, 20), "barrel")
+        self.grid.insert(b, pygame.Rect(30, 30, 20, 20), "tile")
+
+        hits = self.grid.query(pygame.Rect(0, 0, 50, 50))
+        self.assertEqual([(o is a, t) for o, t in hits], [(True, "barrel"), (False, "tile")])
+        tiles = self.grid.query_tag(pygame.Rect(0, 0, 50, 50), "tile")
+        self.assertEqual(len(tiles), 1)
+        self.assertIs(tiles[0], b)
+
+    def test_query_misses_other_cells(self) -> None:
+        self.grid.insert(Thing(), pygame.Rect(10, 10, 20, 20), "barrel")
+        self.assertEqual(self.grid.query(pygame.Rect(250, 250, 10, 10)), [])
+
+    def test_query_dedupes_objects_spanning_cells(self) -> None:
+        big = Thing()
+        # 蓋到 (0,0) (1,0) (0,1) (1,1) 四格
+        self.grid.insert(big, pygame.Rect(50, 50, 100, 100), "tile")
+        hits = self.grid.query(pygame.Rect(0, 0, 200, 200))
+        self.assertEqual(len(hits), 1)
+        self.assertIs(hits[0][0], big)
+
+    def test_query_keeps_insertion_order_across_cells(self) -> None:
+        # 後插入的放在前面那格：結果還是要照插入順序
+        first, second, third = Thing(), Thing(), Thing()
+        self.grid.insert(first, pygame.Rect(150, 10, 10, 10), "barrel")
+        self.grid.insert(second, pygame.Rect(10, 10, 10, 10), "barrel")
+        self.grid.insert(third, pygame.Rect(10, 150, 10, 10), "barrel")
+        hits = self.grid.query_tag(pygame.Rect(0, 0, 200, 200), "barrel")
+        self.assertEqual([id(o) for o in hits], [id(first), id(second), id(third)])
+
+    def test_remove_uses_identity(self) -> None:
+        a, b = Thing(), Thing()   # a == b，但只能拿掉 a
+        self.grid.insert(a, pygame.Rect(10, 10, 20, 20), "apple")
+        self.grid.insert(b, pygame.Rect(10, 10, 20, 20), "apple")
+        self.grid.remove(a)
+        hits = self.grid.query_tag(pygame.Rect(0, 0, 50, 50), "apple")
+        self.assertEqual(len(hits), 1)
+        self.assertIs(hits[0], b)
+        # 拿掉不存在的東西不會出錯
+        self.grid.remove(a)
+
+    def test_reinsert_moves_object(self) -> None:
+        a = Thing()
+        self.grid.insert(a, pygame.Rect(10, 10, 20, 20), "apple")
+        self.grid.insert(a, pygame.Rect(310, 310, 20, 20), "apple")
+        self.assertEqual(self.grid.query(pygame.Rect(0, 0, 50, 50)), [])
+        self.assertEqual(len(self.grid.query(pygame.Rect(300, 300, 50, 50))), 1)
+
+    def test_clear_by_tag(self) -> None:
+        keg, tile = Thing(), Thing()
+        self.grid.insert(keg, pygame.Rect(10, 10, 20, 20), "barrel")
+        self.grid.insert(tile, pygame.Rect(10, 10, 20, 20), "tile")
+        self.grid.clear("barrel")
+        hits = self.grid.query(pygame.Rect(0, 0, 50, 50))
+        self.assertEqual(len(hits), 1)
+        self.assertIs(hits[0][0], tile)
+
+        self.grid.clear()
+        self.assertEqual(self.grid.query(pygame.Rect(0, 0, 50, 50)), [])
+
+    def test_query_point(self) -> None:
+        mine = Thing()
+        self.grid.insert(mine, pygame.Rect(90, 90, 20, 20), "mine")
+        self.assertEqual(len(self.grid.query_point(105, 105, "mine")), 1)
+        self.assertEqual(self.grid.query_point(105, 105, "apple"), [])
+        self.assertEqual(self.grid.query_point(305, 105, "mine"), [])
+
+    def test_query_into_matches_query(self) -> None:
+        objs = []
+        for i in range(12):
+            o = Thing()
+            objs.append(o)
+            tag = "barrel" if i % 2 else "tile"
+            self.grid.insert(o, pygame.Rect(i * 37, (i * 53) % 300, 60, 40), tag)
+
+        tiles, kegs = [], []
+        out = {"tile": tiles, "barrel": kegs}
+        for rect in (pygame.Rect(0, 0, 10, 4), pygame.Rect(95, 95, 10, 10),
+                     pygame.Rect(0, 0, 400, 400), pygame.Rect(120, 40, 90, 90)):
+            tiles.clear()
+            kegs.clear()
+            self.grid.query_into(rect, out)
+            expect = self.grid.query(rect)
+            self.assertEqual(sorted(map(id, tiles)), sorted(id(o) for o, t in expect if t == "tile"))
+            self.assertEqual(sorted(map(id, kegs)), sorted(id(o) for o, t in expect if t == "barrel"))
+
+    def test_query_into_skips_unrequested_tags(self) -> None:
+        self.grid.insert(Thing(), pygame.Rect(10, 10, 20, 20), "apple")
+        tiles = []
+        self.grid.query_into(pygame.Rect(0, 0, 50, 50), {"tile": tiles})
+        self.assertEqual(tiles, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
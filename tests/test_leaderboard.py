@@ -0,0 +1,94 @@
+# tests/test_leaderboard.py
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from leaderboard import LeaderboardManager
+
+
+class LeaderboardManagerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self._tmp.name, "lb.db")
+        self.json_path = os.path.join(self._tmp.name, "lb.json")
+        self._managers = []
+
+    def tearDown(self) -> None:
+        for m in self._managers:
+            m.conn.close()
+        self._tmp.cleanup()
+
+    def _open(self) -> LeaderboardManager:
+        # 絕對路徑：os.path.join 會直接用它，不會寫到專案資料夾
+        m = LeaderboardManager(filename=self.db_path, legacy_json=self.json_path)
+        self._managers.append(m)
+        return m
+
+    def test_record_win_upserts(self) -> None:
+        lb = self._open()
+        lb.record_win("classic", "amy")
+        lb.record_win("classic", "amy")
+        lb.record_win("classic", "bob")
+        lb.record_win("chaos", "amy")
+        self.assertEqual(lb.top("classic"), [("amy", 2), ("bob", 1)])
+        self.assertEqual(lb.top("chaos"), [("amy", 1)])
+        self.assertEqual(lb.top("hardcore"), [])
+
+    def test_record_win_strips_and_ignores_blank_names(self) -> None:
+        lb = self._open()
+        lb.record_win("classic", "  amy ")
+        lb.record_win("classic", "   ")
+        self.assertEqual(lb.top("classic"), [("amy", 1)])
+
+    def test_record_win_is_committed_immediately(self) -> None:
+        lb = self._open()
+        lb.record_win("classic", "amy")
+        # record_win 回來就已經 commit：另開一條連線也要看得到
+        other = sqlite3.connect(self.db_path)
+        try:
+            rows = other.execute("SELECT name, wins FROM lb WHERE mode = 'classic'").fetchall()
+        finally:
+            other.close()
+        self.assertEqual(rows, [("amy", 1)])
+
+    def test_top_orders_ties_by_first_entry(self) -> None:
+        lb = self._open()
+        for name in ("cat", "amy", "bob"):
+            lb.record_win("classic", name)
+        lb.record_win("classic", "bob")
+        # bob 2 勝排第一；cat / amy 同分照先上榜的順序
+        self.assertEqual(lb.top("classic"), [("bob", 2), ("cat", 1), ("amy", 1)])
+        self.assertEqual(lb.top("classic", limit=2), [("bob", 2), ("cat", 1)])
+
+    def test_imports_legacy_json_once(self) -> None:
+        legacy = {
+            "classic": {"zed": {"wins": 3, "last": 1.0}, "amy": {"wins": 3, "last": 2.0}},
+            "hardcore": {"bob": {"wins": "x", "last": 0}},
+            "broken": ["not", "a", "dict"],
+        }
+        with open(self.json_path, "w", encoding="utf-8") as f:
+            json.dump(legacy, f)
+
+        lb = self._open()
+        self.assertEqual(lb.top("classic"), [("zed", 3), ("amy", 3)])
+        # 壞掉的 wins 當 0 勝
+        self.assertEqual(lb.top("hardcore"), [("bob", 0)])
+        self.assertEqual(lb.top("broken"), [])
+
+        lb.record_win("classic", "amy")
+        lb.conn.close()
+        self._managers.remove(lb)
+
+        # 表已經有資料：再開一次不會重新匯入（amy 的新勝場還在、zed 沒變兩倍）
+        again = self._open()
+        self.assertEqual(again.top("classic"), [("amy", 4), ("zed", 3)])
+
+    def test_missing_legacy_json_is_fine(self) -> None:
+        lb = self._open()
+        self.assertEqual(lb.top("classic"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
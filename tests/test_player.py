@@ -0,0 +1,45 @@
+# tests/test_player.py
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from main import P1_COLOR, Player
+
+
+def _player() -> Player:
+    keys = dict(left=pygame.K_a, right=pygame.K_d, up=pygame.K_w, down=pygame.K_s)
+    return Player(player_id=1, name="A", color=P1_COLOR, start_pos=(100, 100), keymap=keys)
+
+
+class BodyHitboxTest(unittest.TestCase):
+    def test_body_hitbox_is_centered_and_smaller(self) -> None:
+        pl = _player()
+        hb = pl.body_hitbox()
+        self.assertEqual(hb.center, pl.rect.center)
+        self.assertLess(hb.w, pl.rect.w)
+        self.assertLess(hb.h, pl.rect.h)
+
+    def test_body_hitbox_returns_independent_rects(self) -> None:
+        pl = _player()
+        first = pl.body_hitbox()
+        pl.rect.move_ip(50, 0)
+        second = pl.body_hitbox()
+        # 先拿到的那個不能被後面的呼叫蓋掉
+        self.assertIsNot(first, second)
+        self.assertEqual(second.centerx - first.centerx, 50)
+
+    def test_body_hitbox_ip_matches_and_is_reused(self) -> None:
+        pl = _player()
+        shared = pl.body_hitbox_ip()
+        self.assertEqual(shared, pl.body_hitbox())
+        pl.rect.move_ip(0, 30)
+        self.assertIs(pl.body_hitbox_ip(), shared)
+        self.assertEqual(shared, pl.body_hitbox())
+
+
+if __name__ == "__main__":
+    unittest.main()
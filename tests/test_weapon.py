@@ -0,0 +1,71 @@
+# tests/test_weapon.py
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from main import Weapon
+
+
+def _make(reserve: int = 30) -> Weapon:
+    return Weapon("Test", cooldown=0.25, damage=10, spread_deg=0.0, pellets=1,
+                  mag_size=5, reserve=reserve, reload_time=1.0)
+
+
+def _state(w: Weapon):
+    return (w.mag, w.reserve, w.reloading, round(w._cooldown_left, 9), round(w._reload_left, 9))
+
+
+class WeaponTickAllTest(unittest.TestCase):
+    def _pair(self, setup) -> None:
+        # 同樣的起始狀態：一把用 update 一步步推，一組用 tick_all，每一步都要一樣
+        a, b, c = _make(), _make(), _make(reserve=2)
+        a2, b2, c2 = _make(), _make(), _make(reserve=2)
+        for w in (a, b, c):
+            setup(w)
+        for w in (a2, b2, c2):
+            setup(w)
+
+        for dt in (0.016, 0.1, 0.2, 0.0, 0.3, 0.5, 0.25, 1.0, 0.016):
+            for w in (a, b, c):
+                w.update(dt)
+            Weapon.tick_all([a2, b2, c2], dt)
+            self.assertEqual([_state(w) for w in (a, b, c)], [_state(w) for w in (a2, b2, c2)])
+
+    def test_cooldown_expiry_matches_update(self) -> None:
+        def setup(w: Weapon) -> None:
+            w.fire(pygame.Vector2(0, 0), pygame.Vector2(1, 0), owner_id=1)
+        self._pair(setup)
+
+    def test_reload_expiry_matches_update(self) -> None:
+        def setup(w: Weapon) -> None:
+            for _ in range(3):
+                w._cooldown_left = 0.0
+                w.fire(pygame.Vector2(0, 0), pygame.Vector2(1, 0), owner_id=1)
+            w.start_reload()
+        self._pair(setup)
+
+    def test_reload_finishes_and_refills(self) -> None:
+        w = _make(reserve=2)
+        w.mag = 1
+        w.start_reload()
+        Weapon.tick_all([w], 0.6)
+        self.assertTrue(w.reloading)
+        self.assertEqual(w.mag, 1)
+        Weapon.tick_all([w], 0.6)
+        self.assertFalse(w.reloading)
+        # 備彈只有 2：補到 3 發
+        self.assertEqual((w.mag, w.reserve), (3, 0))
+
+    def test_idle_weapon_is_untouched(self) -> None:
+        w = _make()
+        before = _state(w)
+        Weapon.tick_all([w], 0.5)
+        self.assertEqual(_state(w), before)
+
+
+if __name__ == "__main__":
+    unittest.main()